@@ -7,6 +7,8 @@ customization required.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 
 __version__ = "1.9.8"
 
@@ -84,6 +86,7 @@ from rich_click.rich_command import RichGroup as RichGroup
 from rich_click.rich_context import RichContext as RichContext
 from rich_click.rich_context import get_current_context as get_current_context
 from rich_click.rich_help_configuration import RichHelpConfiguration as RichHelpConfiguration
+from rich_click.rich_help_configuration import config_scope as config_scope
 from rich_click.rich_help_formatter import RichHelpFormatter as RichHelpFormatter
 from rich_click.rich_panel import RichCommandPanel as RichCommandPanel
 from rich_click.rich_panel import RichOptionPanel as RichOptionPanel
@@ -95,6 +98,11 @@ from rich_click.rich_parameter import RichParameter as RichParameter
 from . import rich_click as rich_click
 
 
+if TYPE_CHECKING:
+    from rich_click.rich_help_tree import RenderedHelp as RenderedHelp
+    from rich_click.rich_help_tree import render_tree as render_tree
+
+
 def __getattr__(name: str) -> object:
     from rich_click._compat_click import CLICK_IS_BEFORE_VERSION_9X
 
@@ -110,6 +118,12 @@ def __getattr__(name: str) -> object:
 
         return RichMultiCommand
 
+    elif name in ("render_tree", "RenderedHelp"):
+        # Imported on first use, to keep it out of the startup time of every CLI.
+        from rich_click import rich_help_tree
+
+        return getattr(rich_help_tree, name)
+
     else:
         import click
 
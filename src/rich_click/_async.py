@@ -0,0 +1,90 @@
+"""
+Helpers that run help text and error rendering without blocking the event loop.
+
+Rendering is CPU-bound, so it runs in a small thread pool that is shared by all callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+
+T = TypeVar("T")
+
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+"""Number of threads that render concurrently for the async APIs."""
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> Executor:
+    """Return the thread pool used by the async APIs, creating it the first time."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="rich-click-render")
+    return _executor
+
+
+async def run_in_executor(func: Callable[[], T]) -> T:
+    """
+    Run a function in the thread pool with the current context variables, and wait for its result.
+
+    Cancelling the caller cancels the function if it has not started yet.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), contextvars.copy_context().run, func)
+
+
+class _SharedRender:
+    """A render that is in progress, and the number of callers waiting for it."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future[Any]) -> None:
+        self.future = future
+        self.waiters = 0
+
+
+# Renders in progress, by event loop and key.
+_in_flight: dict[tuple[asyncio.AbstractEventLoop, Hashable], _SharedRender] = {}
+
+
+async def run_coalesced(key: Hashable, func: Callable[[], T]) -> T:
+    """
+    Run a function like run_in_executor(), sharing the result with concurrent calls that pass the same key.
+
+    Cancelling one caller does not affect the others.
+    The function is only cancelled when every caller waiting for it has been cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    full_key = (loop, key)
+    shared = _in_flight.get(full_key)
+    if shared is None:
+        future = loop.run_in_executor(get_executor(), contextvars.copy_context().run, func)
+        shared = _in_flight[full_key] = _SharedRender(future)
+
+        def forget(_: asyncio.Future[Any], shared: _SharedRender = shared) -> None:
+            if _in_flight.get(full_key) is shared:
+                del _in_flight[full_key]
+
+        future.add_done_callback(forget)
+
+    shared.waiters += 1
+    try:
+        result: T = await asyncio.shield(shared.future)
+        return result
+    except asyncio.CancelledError:
+        if shared.waiters == 1 and not shared.future.done():
+            shared.future.cancel()
+        raise
+    finally:
+        shared.waiters -= 1
@@ -0,0 +1,480 @@
+"""
+On-disk caches used by rich-click, and the cached size of the terminal.
+
+Nothing in this module imports Rich, so that a cache hit can skip it entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+from collections.abc import Callable, Collection, Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+import click
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from types import FrameType
+
+    from rich_click.rich_context import RichContext
+    from rich_click.rich_help_configuration import RichHelpConfiguration
+
+
+# Environment variables that Rich reads when it detects the color system and size of the terminal.
+_TERMINAL_ENV_VARS = (
+    "TERM",
+    "COLORTERM",
+    "NO_COLOR",
+    "FORCE_COLOR",
+    "TTY_COMPATIBLE",
+    "TTY_INTERACTIVE",
+    "COLUMNS",
+    "LINES",
+    "JUPYTER_COLUMNS",
+    "JUPYTER_LINES",
+    "RICH_CLICK_THEME",
+)
+
+
+def user_cache_dir() -> str:
+    """
+    Return the directory that rich-click uses for on-disk caches.
+
+    The `RICH_CLICK_CACHE_DIR` environment variable takes precedence.
+    Otherwise, the platform's conventional user cache directory is used.
+    """
+    path = os.getenv("RICH_CLICK_CACHE_DIR")
+    if path:
+        return path
+    if sys.platform == "win32":
+        base = os.getenv("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "rich-click")
+
+
+def write_atomic(path: str, data: str) -> None:
+    """
+    Write a text file so that concurrent readers never see a partial file.
+
+    Failures are ignored; a cache that cannot be written is just a cache miss.
+    """
+    tmp = None
+    try:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # A unique name per call, so that threads of the same process do not write to the same file.
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+def read_text(path: str) -> str | None:
+    """Read a cache file, or return None if it does not exist or cannot be read."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _stable_repr(obj: Any) -> str:
+    """
+    Fallback for json.dumps() that avoids memory addresses for functions and classes.
+
+    Raises TypeError for other objects whose repr contains a memory address, which differs between processes.
+    """
+    if callable(obj) and hasattr(obj, "__qualname__"):
+        return f"{getattr(obj, '__module__', '')}.{obj.__qualname__}"
+    text = repr(obj)
+    if " at 0x" in text:
+        raise TypeError(f"{type(obj).__name__} has no stable repr")
+    return text
+
+
+def _hash(data: Any) -> str:
+    """Hash JSON-like data. Raises TypeError for values without a stable repr, see _stable_repr()."""
+    return hashlib.sha256(json.dumps(data, default=_stable_repr, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _file_stamp(path: str | None) -> tuple[str, int] | None:
+    if not path:
+        return None
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _module_stamp(name: str | None) -> tuple[str, int] | None:
+    """Return the path and mtime of a module's source without importing it."""
+    if not name:
+        return None
+    module = sys.modules.get(name)
+    if module is not None:
+        return _file_stamp(getattr(module, "__file__", None))
+    from importlib.util import find_spec
+
+    try:
+        spec = find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    return _file_stamp(spec.origin if spec is not None else None)
+
+
+def _lookup_terminal_size() -> tuple[int, int] | None:
+    for fd in (1, 2) if sys.platform == "win32" else (0, 1, 2):
+        try:
+            size = os.get_terminal_size(fd)
+        except (AttributeError, ValueError, OSError):
+            continue
+        return size.columns, size.lines
+    return None
+
+
+_terminal_size: tuple[int, int] | None = None
+_terminal_size_cached = False
+_resize_watch_installed = False
+_previous_resize_handler: Any = None
+
+
+def _on_resize(signum: int, frame: FrameType | None) -> None:
+    global _terminal_size_cached
+    _terminal_size_cached = False
+    if callable(_previous_resize_handler):
+        _previous_resize_handler(signum, frame)
+
+
+def _watching_resize() -> bool:
+    """Return whether resizes of the terminal are being watched, installing a SIGWINCH handler the first time."""
+    global _resize_watch_installed, _previous_resize_handler
+    import signal
+
+    sigwinch = getattr(signal, "SIGWINCH", None)
+    if sigwinch is None:
+        return False
+    if _resize_watch_installed:
+        # Another handler may have replaced ours since, in which case resizes can no longer be seen.
+        return signal.getsignal(sigwinch) is _on_resize
+    try:
+        # Any handler that was already installed is called by ours.
+        _previous_resize_handler = signal.signal(sigwinch, _on_resize)
+    except (ValueError, OSError):
+        # Signal handlers can only be installed from the main thread, which may call this later.
+        return False
+    _resize_watch_installed = True
+    return True
+
+
+def terminal_size() -> tuple[int, int] | None:
+    """
+    Return the size of the first standard stream attached to a terminal, the same way Rich looks it up.
+
+    Where SIGWINCH is available, the size is looked up once, and again only after the terminal is resized.
+    """
+    global _terminal_size, _terminal_size_cached
+    if not _watching_resize():
+        return _lookup_terminal_size()
+    if not _terminal_size_cached:
+        _terminal_size_cached = True
+        _terminal_size = _lookup_terminal_size()
+    return _terminal_size
+
+
+def terminal_fingerprint(ctx: RichContext) -> list[Any]:
+    """Describe everything about the terminal that can change how the help text is rendered."""
+    config = ctx.help_config
+    width = ctx.terminal_width if ctx.terminal_width is not None else config.width
+    stdout = sys.stdout
+    try:
+        isatty = stdout.isatty()
+    except (AttributeError, ValueError):
+        isatty = False
+    return [
+        width,
+        ctx.max_content_width,
+        # The size of the terminal only matters when the width is not fixed.
+        terminal_size() if width is None else None,
+        getattr(stdout, "encoding", None),
+        isatty,
+        sys.platform,
+        [os.getenv(k) for k in _TERMINAL_ENV_VARS],
+    ]
+
+
+def config_fingerprint(config: RichHelpConfiguration, exclude: Collection[str] = ()) -> list[Any]:
+    """Describe the config options that change help text, and the themes that are applied to them."""
+    import dataclasses
+
+    import rich_click.rich_click as rc
+    from rich_click.utils import notset
+
+    options = {}
+    for f in dataclasses.fields(config):
+        if f.repr and f.name not in exclude:
+            value = getattr(config, f.name)
+            # The repr of the sentinel differs between processes.
+            options[f.name] = "<notset>" if value is notset else value
+    themes = [rc._THEME_FROM_CLI, os.getenv("RICH_CLICK_THEME") if config.enable_theme_env_var else None]
+    return [options, themes]
+
+
+@contextmanager
+def _environment(env: Mapping[str, str | None]) -> Iterator[None]:
+    """Temporarily set environment variables, or unset those that are None. This is not thread-safe."""
+    saved = {k: os.environ.get(k) for k in env}
+
+    def apply(values: Mapping[str, str | None]) -> None:
+        for k, v in values.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+    apply(env)
+    try:
+        yield
+    finally:
+        apply(saved)
+
+
+def subcommands_fingerprint(group: click.Group, ctx: click.Context, include_class: bool = False) -> list[Any]:
+    """Describe the direct subcommands of a group, as they appear in its help text, without importing lazy ones."""
+    from rich_click.rich_panel import _help_command_getter
+
+    get_command = _help_command_getter(group)
+    commands = []
+    for name in group.list_commands(ctx):
+        sub = get_command(ctx, name)
+        if sub is None:
+            continue
+        commands.append(
+            [
+                name,
+                type(sub) if include_class else None,
+                sub.help,
+                sub.short_help,
+                sub.deprecated,
+                sub.hidden,
+                list(getattr(sub, "aliases", None) or []),
+                getattr(sub, "panel", None),
+            ]
+        )
+    return commands
+
+
+def _command_fingerprint(command: click.Command, ctx: RichContext) -> list[Any]:
+    """Describe the parts of a command and its direct subcommands that appear in its help text."""
+    from rich_click.rich_command import RichCommand
+
+    params = []
+    for param in command.get_params(ctx):
+        info = param.to_info_dict()
+        info["class"] = type(param)
+        info["panel"] = getattr(param, "panel", None)
+        params.append(info)
+
+    data: dict[str, Any] = {
+        "class": type(command),
+        "name": command.name,
+        "help": command.help,
+        "short_help": command.short_help,
+        "epilog": command.epilog,
+        "options_metavar": command.options_metavar,
+        "deprecated": command.deprecated,
+        "hidden": command.hidden,
+        "aliases": list(getattr(command, "aliases", None) or []),
+        "panels": [p.to_info_dict(ctx) for p in getattr(command, "panels", [])],
+        "params": params,
+    }
+
+    if isinstance(command, click.Group):
+        data["subcommand_metavar"] = command.subcommand_metavar
+        data["chain"] = command.chain
+        data["commands"] = subcommands_fingerprint(command, ctx, include_class=True)
+
+    if isinstance(command, RichCommand):
+        callback = command.callback
+        data["source"] = _module_stamp(getattr(callback, "__module__", None) or type(command).__module__)
+
+    return [data]
+
+
+def help_cache_key(command: click.Command, ctx: RichContext) -> str | None:
+    """
+    Compute the cache key for the help text of a command.
+
+    Returns None if the help text cannot be cached.
+    """
+    if ctx.console is not None:
+        # A user-supplied console can be configured in ways we cannot fingerprint.
+        return None
+
+    from rich_click import __version__
+
+    parts = [
+        __version__,
+        _module_stamp("rich"),
+        _module_stamp("click"),
+        ctx.command_path,
+        ctx.formatter_class,
+        ctx.export_console_as,
+        ctx.auto_envvar_prefix,
+        ctx.show_default,
+        ctx.help_option_names,
+        ctx.default_map,
+        config_fingerprint(ctx.help_config),
+        terminal_fingerprint(ctx),
+        _command_fingerprint(command, ctx),
+    ]
+    try:
+        return _hash(parts)
+    except (TypeError, ValueError):
+        return None
+
+
+# Number of help texts to keep, e.g. one per command, config and terminal.
+_MAX_CACHED_HELP_TEXTS = 512
+
+
+def get_cached_help(command: click.Command, ctx: RichContext, render: Callable[[], str]) -> str:
+    """Return the help text of a command from the on-disk cache, rendering and storing it on a miss."""
+    try:
+        key = help_cache_key(command, ctx)
+    except Exception:
+        key = None
+    if key is None:
+        return render()
+
+    path = os.path.join(user_cache_dir(), "help", f"{key}.txt")
+    cached = read_text(path)
+    if cached is not None:
+        return cached
+
+    value = render()
+    _store(path, value, _MAX_CACHED_HELP_TEXTS)
+    return value
+
+
+# Number of console scripts indexes to keep, e.g. one per virtualenv and working directory.
+_MAX_CONSOLE_SCRIPTS_INDEXES = 32
+
+
+def _has_distributions(path: str) -> bool:
+    """Return whether a directory on `sys.path` holds the metadata of any distributions."""
+    if path.endswith(".egg"):
+        return True
+    try:
+        with os.scandir(path) as entries:
+            return any(entry.name.endswith((".dist-info", ".egg-info")) for entry in entries)
+    except OSError:
+        # Missing entries, and zip files, e.g. the standard library.
+        return False
+
+
+def _sys_path_fingerprint() -> str:
+    """
+    Hash the entries of `sys.path` that hold distributions, and their mtimes, which change when distributions change.
+
+    Other entries, e.g. the working directory, are left out, since they change for other reasons.
+    """
+    stamps: list[Any] = [sys.executable, sys.version]
+    for entry in sys.path:
+        path = entry or "."
+        if _has_distributions(path):
+            try:
+                stamps.append((entry, os.stat(path).st_mtime_ns))
+            except OSError:
+                pass
+    return hashlib.sha256(json.dumps(stamps).encode("utf-8")).hexdigest()
+
+
+def _prune(directory: str, keep: int) -> None:
+    """Delete all but the most recently modified files of a cache directory."""
+    try:
+        # Temporary files are left alone, since another writer may be about to rename them.
+        paths = [os.path.join(directory, name) for name in os.listdir(directory) if not name.endswith(".tmp")]
+        if len(paths) <= keep:
+            return
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[keep:]:
+            os.remove(path)
+    except OSError:
+        pass
+
+
+# A cache directory is pruned once every this many new files, on average, since listing it is not free.
+_PRUNE_EVERY = 16
+
+# Number of new files left before each cache directory is pruned, by directory.
+_new_files_until_prune: dict[str, int] = {}
+
+
+def _store(path: str, data: str, keep: int) -> None:
+    """
+    Write a cache file, and occasionally prune its directory down to the `keep` most recent files.
+
+    Only writes that create a new file count towards pruning.
+    The countdown of a directory starts at a random point,
+    so that short-lived processes, which write few files each, still prune it now and then.
+    """
+    directory = os.path.dirname(path)
+    is_new = not os.path.exists(path)
+    write_atomic(path, data)
+    if not is_new:
+        return
+    remaining = _new_files_until_prune.get(directory)
+    if remaining is None:
+        remaining = random.randint(1, _PRUNE_EVERY)
+    remaining -= 1
+    if remaining <= 0:
+        _prune(directory, keep)
+        remaining = _PRUNE_EVERY
+    _new_files_until_prune[directory] = remaining
+
+
+def console_scripts_index(rebuild: bool = False) -> dict[str, list[str]]:
+    """
+    Return the values of the `console_scripts` entry points of the installed distributions, by script name.
+
+    A script has more than one value when distributions on `sys.path` disagree about it.
+    The index is cached on disk, keyed by the entries of `sys.path` that hold distributions, and their mtimes.
+    Pass `rebuild=True` to scan the distributions again.
+    """
+    directory = os.path.join(user_cache_dir(), "console-scripts")
+    path = os.path.join(directory, f"{_sys_path_fingerprint()}.json")
+    if not rebuild:
+        cached = read_text(path)
+        if cached is not None:
+            try:
+                index = json.loads(cached)
+            except ValueError:
+                index = None
+            if isinstance(index, dict):
+                return index
+
+    from importlib import metadata
+
+    index = {}
+    for ep in metadata.entry_points(group="console_scripts"):
+        values = index.setdefault(ep.name, [])
+        if ep.value not in values:
+            values.append(ep.value)
+
+    _store(path, json.dumps(index, separators=(",", ":")), _MAX_CONSOLE_SCRIPTS_INDEXES)
+    return index
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Mapping, MutableMapping
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Literal,
@@ -17,6 +18,7 @@ from rich_click.utils import CommandGroupDict, OptionGroupDict
 
 
 if TYPE_CHECKING:
+    import os
     import sys
 
     from rich.align import AlignMethod
@@ -60,6 +62,10 @@ class RichContextSettingsDict(TypedDict):
     export_console_as: NotRequired[Literal["html", "svg", "text"] | None]
     errors_in_output_format: NotRequired[bool | None]
     help_to_stderr: NotRequired[bool | None]
+    help_manifest: NotRequired[str | os.PathLike[str] | Mapping[str, Any] | None]
+    help_snapshot: NotRequired[str | os.PathLike[str] | bytes | None]
+    stdout: NotRequired[IO[str] | None]
+    stderr: NotRequired[IO[str] | None]
 
 
 class TableKwargs(TypedDict):
@@ -246,3 +252,5 @@ class RichHelpConfigurationDict(TypedDict):
     helptext_show_aliases: NotRequired[bool]
     highlighter_patterns: NotRequired[list[str]]
     legacy_windows: NotRequired[bool | None]
+    enable_help_cache: NotRequired[bool]
+    stream_help: NotRequired[bool]
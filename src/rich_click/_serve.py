@@ -0,0 +1,232 @@
+"""
+A local server that keeps a CLI imported, and renders its help text for `rich-click` CLI invocations.
+
+`rich-click --serve MODULE:CLICK_COMMAND` listens on a Unix domain socket.
+When its socket exists, `rich-click MODULE:CLICK_COMMAND ... --help` sends the arguments and
+the terminal environment to the server, and prints the help text it renders.
+The client falls back to rendering in-process when there is no server, or the server cannot answer.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import sys
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import click
+
+from rich_click._cache import _TERMINAL_ENV_VARS, _environment, _module_stamp, terminal_size, user_cache_dir
+
+
+# Environment variables that rich-click reads into its globals at import time, which the server cannot change.
+_STARTUP_ENV_VARS = ("TERMINAL_WIDTH", "FORCE_COLOR", "PY_COLORS", "GITHUB_ACTIONS")
+
+# Longest path that fits in a Unix domain socket address on all platforms.
+_MAX_SOCKET_PATH = 100
+
+_MAX_CACHED_RESPONSES = 256
+
+CLIENT_TIMEOUT = 2.0
+"""Seconds the client waits for the server before rendering in-process."""
+
+
+def socket_path(module_path: str, function_name: str) -> str:
+    """Return the path of the socket of the server for a command, in the current interpreter and directory."""
+    key = json.dumps([sys.executable, os.getcwd(), module_path, function_name])
+    name = f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}.sock"
+    path = os.path.join(user_cache_dir(), "serve", name)
+    if len(path) > _MAX_SOCKET_PATH:
+        import tempfile
+
+        path = os.path.join(tempfile.gettempdir(), f"rich-click-{name}")
+    return path
+
+
+def _request_env() -> dict[str, str | None]:
+    return {k: os.environ.get(k) for k in (*_STARTUP_ENV_VARS, *_TERMINAL_ENV_VARS)}
+
+
+def _isatty() -> bool:
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def request_help(path: str, argv: Sequence[str], prog_name: str, options: Mapping[str, Any]) -> dict[str, Any] | None:
+    """
+    Ask the server listening on a socket to render help text.
+
+    Returns the exit code and output of the invocation, or None if the server is not running or cannot answer.
+    """
+    import socket
+
+    payload = {
+        "argv": list(argv),
+        "prog_name": prog_name,
+        "options": dict(options),
+        "env": _request_env(),
+        "isatty": _isatty(),
+        "size": terminal_size(),
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(path)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+        response = json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(response, dict) or "exit_code" not in response:
+        return None
+    return response
+
+
+def _protected_args(ctx: click.Context) -> list[str]:
+    if hasattr(ctx, "_protected_args"):
+        return list(ctx._protected_args)
+    return list(ctx.protected_args)  # pragma: no cover
+
+
+def render_help(command: click.Command, prog_name: str, argv: Sequence[str]) -> tuple[int, str, str] | None:
+    """
+    Render the help text that `command.main(argv)` would print, without invoking any command callbacks.
+
+    The arguments are parsed the same way, level by level, until a help option exits.
+    Returns None if the arguments do not ask for help text, or fail to parse,
+    in which case the invocation has to run in-process.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    try:
+        ctx = command.make_context(prog_name, list(argv), stdout=stdout, stderr=stderr)
+        while isinstance(ctx.command, click.Group) and not ctx.command.chain:
+            args = [*_protected_args(ctx), *ctx.args]
+            if not args:
+                return None
+            name, sub, rest = ctx.command.resolve_command(ctx, args)
+            if sub is None or name is None:
+                return None
+            ctx = sub.make_context(name, rest, parent=ctx)
+        return None
+    except click.exceptions.Exit as e:
+        if not stdout.getvalue() and not stderr.getvalue():
+            return None
+        return e.exit_code, stdout.getvalue(), stderr.getvalue()
+    except Exception:
+        return None
+
+
+class HelpServer:
+    """Renders help text for requests from `rich-click` CLI clients."""
+
+    def __init__(self, command: click.Command, module_path: str, options: Mapping[str, Any]) -> None:
+        """Serve help text for a command that was loaded from a module, with the given `rich-click` CLI options."""
+        self.command = command
+        self.module_path = module_path
+        self.options = dict(options)
+        self.startup_env = {k: os.environ.get(k) for k in _STARTUP_ENV_VARS}
+        self.module_stamp = _module_stamp(module_path)
+        self.stale = False
+        self._responses: dict[str, dict[str, Any]] = {}
+
+    def handle(self, request: Mapping[str, Any]) -> dict[str, Any]:
+        """Answer one request. The response has no exit code when the client has to render in-process."""
+        if _module_stamp(self.module_path) != self.module_stamp:
+            # The CLI has changed since it was imported.
+            self.stale = True
+            return {}
+
+        env = request.get("env") or {}
+        if request.get("options") != self.options or any(env.get(k) != v for k, v in self.startup_env.items()):
+            return {}
+
+        key = json.dumps([request.get(k) for k in ("argv", "prog_name", "env", "isatty", "size")])
+        response = self._responses.get(key)
+        if response is None:
+            response = self._render(request)
+            if len(self._responses) >= _MAX_CACHED_RESPONSES:
+                self._responses.clear()
+            self._responses[key] = response
+        return response
+
+    def _render(self, request: Mapping[str, Any]) -> dict[str, Any]:
+        import rich_click.rich_click as rc
+        from rich_click.rich_help_configuration import config_scope
+
+        env = {k: v for k, v in request["env"].items() if k in _TERMINAL_ENV_VARS}
+
+        # The server's own stdout and terminal say nothing about the client's, so they are passed explicitly.
+        overrides: dict[str, Any] = {}
+        if rc.FORCE_TERMINAL is None and not env.get("FORCE_COLOR") and env.get("TTY_COMPATIBLE") is None:
+            overrides["force_terminal"] = bool(request.get("isatty"))
+        if rc.WIDTH is None and not env.get("COLUMNS"):
+            size = request.get("size")
+            overrides["width"] = size[0] if size else 80
+
+        # The server handles one request at a time, so it can use the client's environment while it renders.
+        with _environment(env), config_scope(**overrides):
+            result = render_help(self.command, request["prog_name"], request["argv"])
+        if result is None:
+            return {}
+        exit_code, stdout, stderr = result
+        return {"exit_code": exit_code, "stdout": stdout, "stderr": stderr}
+
+
+def serve(command: click.Command, module_path: str, path: str, options: Mapping[str, Any]) -> None:
+    """Serve help text for a command on a Unix domain socket, until interrupted or the command's module changes."""
+    import socket
+    import socketserver
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise click.ClickException("--serve requires Unix domain sockets, which this platform does not support.")
+
+    if os.path.exists(path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(path)
+            except OSError:
+                # Left behind by a server that did not exit cleanly.
+                os.remove(path)
+            else:
+                raise click.ClickException(f"A server is already listening on {path}.")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    server = HelpServer(command, module_path, options)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            try:
+                request = json.loads(self.rfile.readline())
+                response = server.handle(request)
+            except Exception:
+                response = {}
+            self.wfile.write(json.dumps(response).encode("utf-8"))
+
+    old_umask = os.umask(0o077)
+    try:
+        unix_server = socketserver.UnixStreamServer(path, Handler)
+    finally:
+        os.umask(old_umask)
+
+    click.echo(f"Serving help text on {path}. Press Ctrl+C to stop.", err=True)
+    try:
+        with unix_server:
+            while not server.stale:
+                unix_server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    if server.stale:
+        click.echo(f"Stopped serving, because '{module_path}' has changed.", err=True)
@@ -0,0 +1,375 @@
+"""
+Startup and rendering benchmarks for rich-click.
+
+Run with `python -m rich_click.bench`. Every case runs in a fresh interpreter, so import costs are included.
+Results can be saved as a JSON baseline with `--save`, and compared against one with `--baseline`,
+in which case the command exits with status 1 if any case regressed by more than `--max-regression`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import click
+
+from rich_click.decorators import command as _rich_command
+from rich_click.decorators import option as _rich_option
+
+
+_GENERATED_CLI = '''
+import rich_click as click
+
+
+def make_cli(n_commands, n_options, **context_settings):
+    def add_options(f):
+        for j in range(n_options):
+            f = click.option(f"--option-{j}", default=j, show_default=True, help=f"Option number {j}.")(f)
+        return f
+
+    @click.group(context_settings=context_settings)
+    @add_options
+    def cli(**kwargs):
+        """A generated CLI used for benchmarking."""
+
+    for i in range(n_commands):
+        def callback(**kwargs):
+            print("ok")
+
+        callback.__doc__ = f"Command number {i} does things."
+        cli.command(f"command-{i}")(add_options(callback))
+
+    return cli
+'''
+
+_REPEATED_TYPER_HELP = '''
+from rich_click.patch import patch_typer
+
+patch_typer()
+
+import typer
+
+app = typer.Typer()
+
+
+@app.command(rich_help_panel="Utils")
+def sync(force: bool = typer.Option(False, rich_help_panel="Flags")):
+    """Synchronize the system."""
+
+
+@app.command()
+def create(name: str):
+    """Create a new user."""
+
+
+import sys
+import time
+
+group = typer.main.get_command(app)
+batches = []
+for _ in range(10):
+    start = time.perf_counter()
+    for _ in range(100):
+        group.make_context("cli", [], resilient_parsing=True).get_help()
+    batches.append((time.perf_counter() - start) * 1000 / 100)
+
+# Renders should not get slower as they repeat.
+print(f"bench-metric first_render_ms {batches[0]}", file=sys.stderr)
+print(f"bench-metric last_render_ms {batches[-1]}", file=sys.stderr)
+'''
+
+# Cases can report metrics of their own by printing lines of this form to stderr: `bench-metric NAME VALUE`.
+_METRIC_PREFIX = "bench-metric "
+
+_SIZES = {"small": (2, 3), "medium": (20, 10), "huge": (200, 50)}
+
+# Each case is a script, and the exit code it is expected to finish with.
+CASES: dict[str, tuple[str, int]] = {
+    "import": ("import rich_click", 0),
+    "execute": (
+        "import rich_click as click\n@click.command()\ndef cli():\n    print('ok')\ncli([])\n",
+        0,
+    ),
+    **{
+        f"help_{size}": (f"from benchcli import make_cli\nmake_cli({n}, {m})(['--help'], prog_name='cli')\n", 0)
+        for size, (n, m) in _SIZES.items()
+    },
+    # A single table of 2,000 options, rendered with colors.
+    "help_2000_options": (
+        "import rich_click.rich_click as rc\n"
+        "rc.COLOR_SYSTEM = 'truecolor'\n"
+        "from benchcli import make_cli\n"
+        "make_cli(0, 2000)(['--help'], prog_name='cli')\n",
+        0,
+    ),
+    # The same help text as help_medium, printed from a snapshot built by _build_snapshot().
+    "help_medium_snapshot": (
+        "from benchcli import make_cli\n"
+        f"make_cli(*{_SIZES['medium']}, help_snapshot='help.snapshot')(['--help'], prog_name='cli')\n",
+        0,
+    ),
+    "error": (
+        "from benchcli import make_cli\n"
+        f"make_cli{_SIZES['medium']}(['command-0', '--option-0', 'not-a-number'], prog_name='cli')\n",
+        2,
+    ),
+    # Help text of one Typer app rendered 1,000 times in a process, which should not slow down as it repeats.
+    # Reports the time per render of the first and last 100 renders.
+    "typer_help_1000": (_REPEATED_TYPER_HELP, 0),
+    "rich_click_cli": (
+        "import runpy, sys\n"
+        "sys.argv = ['rich-click', 'benchcli:run']\n"
+        "runpy.run_module('rich_click', run_name='__main__')\n",
+        0,
+    ),
+    # A plain click command, run without rich-click, and through the rich-click CLI in deferred mode.
+    "click_run": ("from plaincli import run\nrun(['--count', '1'])\n", 0),
+    "rich_click_cli_deferred": (
+        "import runpy, sys\n"
+        "sys.argv = ['rich-click', '--deferred-patch', 'plaincli:run', '--count', '1']\n"
+        "runpy.run_module('rich_click', run_name='__main__')\n",
+        0,
+    ),
+}
+
+_RUN_COMMAND = """
+
+@click.command()
+def run():
+    print("ok")
+"""
+
+_PLAIN_CLI = """
+import click
+
+
+@click.command()
+@click.option("--count", type=int, default=1)
+def run(count):
+    print("ok" * count)
+"""
+
+
+def _write_support_module(directory: str) -> None:
+    with open(os.path.join(directory, "benchcli.py"), "w", encoding="utf-8") as f:
+        f.write(_GENERATED_CLI + _RUN_COMMAND)
+    with open(os.path.join(directory, "plaincli.py"), "w", encoding="utf-8") as f:
+        f.write(_PLAIN_CLI)
+
+
+def _build_snapshot(env: Mapping[str, str], cwd: str) -> None:
+    # Built in a subprocess, so that the snapshot matches the config and terminal of the benchmarks.
+    script = (
+        "from benchcli import make_cli\n"
+        "from rich_click.rich_help_snapshot import build_snapshot\n"
+        "with open('help.snapshot', 'wb') as f:\n"
+        f"    f.write(build_snapshot(make_cli(*{_SIZES['medium']}), 'cli', widths=[100], color_systems=[None]))\n"
+    )
+    res = subprocess.run([sys.executable, "-c", script], env=env, cwd=cwd, stderr=subprocess.PIPE, text=True)
+    if res.returncode != 0:
+        raise click.ClickException(f"Building the help snapshot failed:\n{res.stderr}")
+
+
+def _environment(directory: str) -> dict[str, str]:
+    import rich_click
+
+    # Make sure the subprocess imports the same rich-click, even from a source checkout.
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(rich_click.__file__)))
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [directory, package_root, env.get("PYTHONPATH")]))
+    env["TERMINAL_WIDTH"] = "100"
+    for key in ("RICH_CLICK_THEME", "FORCE_COLOR", "NO_COLOR", "PYTHONPROFILEIMPORTTIME"):
+        env.pop(key, None)
+    return env
+
+
+def _run(name: str, env: Mapping[str, str], cwd: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    script, expected_code = CASES[name]
+    res = subprocess.run(
+        [sys.executable, *flags, "-c", script],
+        env=env,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if res.returncode != expected_code:
+        raise click.ClickException(f"Benchmark {name!r} exited with code {res.returncode}:\n{res.stderr}")
+    return res
+
+
+def _total_import_time_ms(stderr: str) -> float:
+    """Sum the self time of every import reported by `-X importtime`."""
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us = line.split(":", 1)[1].split("|", 1)[0].strip()
+        if self_us.isdigit():
+            total_us += int(self_us)
+    return total_us / 1000
+
+
+def _case_metrics(stderr: str) -> dict[str, float]:
+    """Parse the metrics that a case reported itself."""
+    metrics = {}
+    for line in stderr.splitlines():
+        if line.startswith(_METRIC_PREFIX):
+            name, _, value = line[len(_METRIC_PREFIX) :].partition(" ")
+            metrics[name] = float(value)
+    return metrics
+
+
+def run_cases(names: Iterable[str], repeat: int = 5) -> dict[str, dict[str, float]]:
+    """
+    Run benchmark cases, each in a fresh interpreter.
+
+    Returns the median wall time of each case in milliseconds,
+    the total time spent on imports as reported by `python -X importtime`,
+    and the median of any metrics that the case reports itself.
+    """
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        _write_support_module(directory)
+        env = _environment(directory)
+        names = list(names)
+        if "help_medium_snapshot" in names:
+            _build_snapshot(env, directory)
+        for name in names:
+            # Warm up the bytecode cache, so the first timed run is not an outlier.
+            _run(name, env, directory)
+            timings = []
+            case_metrics: dict[str, list[float]] = {}
+            for _ in range(repeat):
+                start = time.perf_counter()
+                res = _run(name, env, directory)
+                timings.append((time.perf_counter() - start) * 1000)
+                for metric, value in _case_metrics(res.stderr).items():
+                    case_metrics.setdefault(metric, []).append(value)
+            import_ms = _total_import_time_ms(_run(name, env, directory, "-X", "importtime").stderr)
+            results[name] = {"wall_ms": round(statistics.median(timings), 3), "import_ms": round(import_ms, 3)}
+            for metric, values in case_metrics.items():
+                results[name][metric] = round(statistics.median(values), 3)
+    return results
+
+
+def _render_slowdown(metrics: Mapping[str, float]) -> float | None:
+    """Return how many times slower the last renders of a case were than its first, if it reports both."""
+    first = metrics.get("first_render_ms")
+    last = metrics.get("last_render_ms")
+    if first is None or first <= 0 or last is None:
+        return None
+    return last / first
+
+
+def compare(
+    results: Mapping[str, Mapping[str, float]],
+    baseline: Mapping[str, Mapping[str, float]],
+    max_regression: float = 0.2,
+    min_delta_ms: float = 5.0,
+) -> list[str]:
+    """
+    Compare results against a baseline and describe every regression.
+
+    A metric regresses when it is both more than `max_regression` (as a fraction)
+    and more than `min_delta_ms` milliseconds slower than the baseline.
+    Per-render times are too short to pass `min_delta_ms`, so for cases that report them,
+    the ratio of the last to the first render time is compared against `max_regression` alone.
+    Cases and metrics missing from either side, or zero in the baseline, are ignored.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        base_metrics = baseline.get(name, {})
+        for metric, value in metrics.items():
+            base = base_metrics.get(metric)
+            if base is None or base <= 0:
+                continue
+            if value - base > min_delta_ms and value > base * (1 + max_regression):
+                regressions.append(
+                    f"{name} {metric}: {value:.1f}ms vs. {base:.1f}ms baseline (+{value / base - 1:.0%})"
+                )
+        slowdown = _render_slowdown(metrics)
+        base_slowdown = _render_slowdown(base_metrics)
+        if slowdown is not None and base_slowdown is not None and slowdown > base_slowdown * (1 + max_regression):
+            regressions.append(f"{name} last/first render: {slowdown:.2f}x vs. {base_slowdown:.2f}x baseline")
+    return regressions
+
+
+@_rich_command("rich-click-bench")
+@_rich_option(
+    "--case",
+    "cases",
+    type=click.Choice(list(CASES)),
+    multiple=True,
+    help="Benchmark to run. Can be passed multiple times. Defaults to all benchmarks.",
+)
+@_rich_option("--repeat", "-n", type=click.IntRange(min=1), default=5, show_default=True, help="Runs per benchmark.")
+@_rich_option("--save", type=click.Path(dir_okay=False), help="Write the results to a JSON file.")
+@_rich_option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare the results against a JSON file written by --save, and fail on regressions.",
+)
+@_rich_option(
+    "--max-regression",
+    type=float,
+    default=0.2,
+    show_default=True,
+    help="Allowed slowdown relative to the baseline, as a fraction.",
+)
+@_rich_option(
+    "--min-delta-ms",
+    type=float,
+    default=5.0,
+    show_default=True,
+    help="Slowdowns smaller than this many milliseconds are never regressions, to allow for noise.",
+)
+def main(
+    cases: tuple[str, ...],
+    repeat: int,
+    save: str | None,
+    baseline: str | None,
+    max_regression: float,
+    min_delta_ms: float,
+) -> None:
+    """Benchmark the startup and help rendering time of rich-click."""
+    results = run_cases(cases or list(CASES), repeat=repeat)
+
+    width = max(len(name) for name in results)
+    click.echo(f"{'case':<{width}}  {'wall (ms)':>10}  {'imports (ms)':>12}")
+    for name, metrics in results.items():
+        click.echo(f"{name:<{width}}  {metrics['wall_ms']:>10.1f}  {metrics['import_ms']:>12.1f}")
+
+    for name, metrics in results.items():
+        extra = {k: v for k, v in metrics.items() if k not in ("wall_ms", "import_ms")}
+        if extra:
+            line = ", ".join(f"{k} {v:.3f}" for k, v in extra.items())
+            slowdown = _render_slowdown(extra)
+            if slowdown is not None:
+                line += f" (last/first: {slowdown:.2f}x)"
+            click.echo(f"{name}: {line}")
+
+    if save:
+        data: dict[str, Any] = {"python": sys.version.split()[0], "platform": sys.platform, "results": results}
+        with open(save, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    if baseline:
+        with open(baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f)["results"], max_regression, min_delta_ms)
+        if regressions:
+            click.echo("Regressions found:", err=True)
+            for line in regressions:
+                click.echo(f"  {line}", err=True)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,12 @@ from __future__ import annotations
 import os
 import sys
 import warnings
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from functools import wraps
 from gettext import gettext
-from importlib import (
-    import_module,
-    metadata,  # type: ignore[import,unused-ignore]
-)
-from typing import Any, Literal
+from importlib import import_module
+from typing import IO, Any, BinaryIO, Literal, TextIO
 
 import click
 from click.core import ParameterSource
@@ -24,9 +21,9 @@ from rich_click.decorators import option as _rich_option
 from rich_click.decorators import option_panel, pass_context
 from rich_click.decorators import version_option as _rich_version_option
 from rich_click.patch import patch as _patch
-from rich_click.rich_click_theme import COLORS, FORMATS, RichClickThemeNotFound, get_theme
 from rich_click.rich_context import RichContext
 from rich_click.rich_help_configuration import RichHelpConfiguration
+from rich_click.utils import load_command, load_object
 
 
 DISABLE_WARNINGS_NOTE = (
@@ -86,21 +83,19 @@ class _RichHelpConfigurationParamType(click.ParamType):  # type: ignore[type-arg
                     raise e
 
 
-def _get_module_path_and_function_name(script: str, suppress_warnings: bool) -> tuple[str, str]:
-    _selected: list[str] = []
+def _get_module_path_and_function_name(
+    script: str, suppress_warnings: bool, rebuild_index: bool = False
+) -> tuple[str, str]:
+    from rich_click._cache import console_scripts_index
+
+    _selected: list[str] = console_scripts_index(rebuild=rebuild_index).get(script, [])
     module_path = ""
     function_name = ""
 
-    for s in metadata.entry_points(group="console_scripts"):
-        if script == s.name:
-            if not _selected:
-                module_path, function_name = s.value.split(":", 1)
-                if " [" in function_name and function_name.endswith("]"):
-                    function_name = function_name.split(" [")[0]
-            if suppress_warnings:
-                break
-            if s.value not in _selected:
-                _selected.append(s.value)
+    if _selected:
+        module_path, function_name = _selected[0].split(":", 1)
+        if " [" in function_name and function_name.endswith("]"):
+            function_name = function_name.split(" [")[0]
 
     if len(_selected) > 1 and not suppress_warnings:
         # This is an extremely rare edge case that comes up when the user sets the PYTHONPATH themselves.
@@ -133,6 +128,85 @@ def _get_module_path_and_function_name(script: str, suppress_warnings: bool) ->
     return module_path, function_name
 
 
+def _load_function(module_path: str, function_name: str, command: bool = False) -> Any:
+    try:
+        import_module(module_path)
+    except ModuleNotFoundError:
+        try:
+            # Import can fail if module is relative to root dir
+            # and PYTHONPATH does not include ".".
+            sys.path.append(os.path.abspath("."))
+            import_module(module_path)
+        except ModuleNotFoundError as e:
+            raise click.ClickException(e.args[0] if e.args else "Unknown error")
+    # The module is imported, so any error from here on is about the attribute.
+    try:
+        return (load_command if command else load_object)(f"{module_path}:{function_name}")
+    except (AttributeError, TypeError, ValueError) as e:
+        raise click.ClickException(str(e)) from None
+
+
+# Arguments that make the rich-click CLI patch click, even in deferred mode.
+_HELP_OPTION_NAMES = frozenset({"--help", "-h"})
+
+
+def _render_errors_with_rich_click(load_config: Callable[[], RichHelpConfiguration]) -> None:
+    """Render click exceptions that escape an unpatched program with rich-click, loading the config on first use."""
+    default_show = click.ClickException.show
+    default_usage_error_show = click.UsageError.show
+
+    def show(self: click.ClickException, file: IO[Any] | None = None) -> None:
+        try:
+            formatter = RichContext.formatter_class(
+                config=load_config(),
+                export_console_as=RichContext.export_console_as if RichContext.errors_in_output_format else None,
+            )
+            formatter.write_error(self)
+        except Exception:
+            if isinstance(self, click.UsageError):
+                default_usage_error_show(self, file)
+            else:
+                default_show(self, file)
+        else:
+            print(formatter.getvalue(), file=file or sys.stderr, end="")
+            formatter._release()
+
+    click.ClickException.show = show  # type: ignore[method-assign]
+    click.UsageError.show = show  # type: ignore[method-assign]
+
+
+def _help_from_server(script: str, args: list[str], options: dict[str, Any]) -> dict[str, Any] | None:
+    """Ask the help server of a script for its help text, if a server is running."""
+    if sys.platform == "win32":
+        return None
+
+    _sys_path = sys.path.copy()
+    sys.path.append(os.path.abspath("."))
+    try:
+        module_path, function_name = _get_module_path_and_function_name(script, suppress_warnings=True)
+    finally:
+        sys.path = _sys_path
+    if not function_name:
+        return None
+
+    from rich_click._serve import request_help, socket_path
+
+    path = socket_path(module_path, function_name)
+    if not os.path.exists(path):
+        return None
+
+    # The program name is detected from sys.argv, the same as when the command runs in-process.
+    from click.utils import _detect_program_name
+
+    _argv = sys.argv
+    sys.argv = [module_path.split(".", 1)[0], *args]
+    try:
+        prog_name = _detect_program_name()
+    finally:
+        sys.argv = _argv
+    return request_help(path, args, prog_name, options)
+
+
 def list_themes(ctx: RichContext, param: click.Parameter, value: bool) -> None:
     """Print all themes."""
     if value:
@@ -144,6 +218,8 @@ def list_themes(ctx: RichContext, param: click.Parameter, value: bool) -> None:
         from rich.table import Table
         from rich.text import Text
 
+        from rich_click.rich_click_theme import COLORS, FORMATS, RichClickThemeNotFound, get_theme
+
         formatter = ctx.make_formatter()
 
         console = Console(
@@ -329,6 +405,13 @@ def list_themes(ctx: RichContext, param: click.Parameter, value: bool) -> None:
     panel="Advanced Options",
     help="Suppress warnings when there are conflicting entry_points. This situation is extremely rare.",
 )
+@_rich_option(
+    "--rebuild-index",
+    is_flag=True,
+    panel="Advanced Options",
+    help="Rebuild the cached index of installed console scripts that [argument]SCRIPT[/] is looked up in."
+    " Use this if a script was installed but is not found.",
+)
 @_rich_option(
     "--patch-rich-click/--no-patch-rich-click",
     is_flag=True,
@@ -337,6 +420,23 @@ def list_themes(ctx: RichContext, param: click.Parameter, value: bool) -> None:
     help="If set, patch [reverse][option][b]rich_click.Command[/][/][/],"
     " not just [reverse][option][b]click.Command[/][/][/].",
 )
+@_rich_option(
+    "--deferred-patch/--no-deferred-patch",
+    default=False,
+    envvar="RICH_CLICK_CLI_DEFERRED_PATCH",
+    show_envvar=True,
+    panel="Advanced Options",
+    help="Only patch click when [argument]SCRIPT[/] is run with no arguments, --help or -h."
+    " Otherwise run it unpatched, and render errors that escape it with rich-click,"
+    " so that it starts as fast as it does without rich-click.",
+)
+@_rich_option(
+    "--serve",
+    is_flag=True,
+    panel="Advanced Options",
+    help="Keep [argument]MODULE:CLICK_COMMAND[/] imported, and render its help text for other runs of"
+    " [command]rich-click[/] with --help or -h, over a Unix domain socket. Runs until interrupted.",
+)
 @_rich_option(
     "--themes",
     help="List all available themes and exit.",
@@ -345,6 +445,21 @@ def list_themes(ctx: RichContext, param: click.Parameter, value: bool) -> None:
     expose_value=False,
     is_flag=True,
 )
+@_rich_option(
+    "--build-manifest",
+    type=click.File("w", encoding="utf-8", lazy=True),
+    metavar="FILE",
+    panel="Extra",
+    help="Write a help manifest for [argument]MODULE:CLICK_COMMAND[/] to FILE and exit.",
+)
+@_rich_option(
+    "--build-snapshot",
+    type=click.File("wb", lazy=True),
+    metavar="FILE",
+    panel="Extra",
+    help="Write the help text of [argument]MODULE:CLICK_COMMAND[/] and its subcommands,"
+    " rendered for common terminal widths and color systems, to FILE and exit.",
+)
 @_rich_version_option(panel="Extra")
 @_rich_option(
     # The rich-click CLI uses a special implementation of --help,
@@ -369,8 +484,13 @@ def main(
     output: Literal[None, "html", "svg"],
     errors_in_output_format: bool,
     suppress_warnings: bool,
+    rebuild_index: bool,
     patch_rich_click: bool,
     rich_config: dict[str, Any] | None,
+    build_manifest: TextIO | None,
+    build_snapshot: BinaryIO | None,
+    deferred_patch: bool,
+    serve: bool,
     show_help: bool,
 ) -> None:
     """
@@ -396,25 +516,73 @@ https://ewels.github.io/rich-click/latest/documentation/rich_click_cli/[/]
 
     >>> [command]rich-click[/] [argument]my_package[/] [argument]cmd[/] [option]--foo[/] 3
     """  # noqa: D401
-    try:
-        if rich_config:
-            if theme:
-                rich_config.setdefault("theme", theme)
+
+    def load_config() -> RichHelpConfiguration:
+        from rich_click.rich_click_theme import RichClickThemeNotFound
+
+        try:
+            if rich_config:
+                if theme:
+                    rich_config.setdefault("theme", theme)
+                    import rich_click.rich_click as rc
+
+                    rc._THEME_FROM_CLI = theme
+                return RichHelpConfiguration.load_from_globals(**rich_config)
+            elif theme:
                 import rich_click.rich_click as rc
 
                 rc._THEME_FROM_CLI = theme
-            cfg = RichHelpConfiguration.load_from_globals(**rich_config)
-        elif theme:
-            import rich_click.rich_click as rc
-
-            rc._THEME_FROM_CLI = theme
-            cfg = RichHelpConfiguration.load_from_globals(theme=theme)
-        else:
-            cfg = RichHelpConfiguration.load_from_globals()
-    except RichClickThemeNotFound as e:
-        raise click.ClickException(e.args[0] if e.args else "Theme not found")
+                return RichHelpConfiguration.load_from_globals(theme=theme)
+            else:
+                return RichHelpConfiguration.load_from_globals()
+        except RichClickThemeNotFound as e:
+            raise click.ClickException(e.args[0] if e.args else "Theme not found")
+
+    # In deferred mode, plain runs of the program neither patch click nor load the config.
+    deferred = (
+        deferred_patch
+        and not show_help
+        and len(script_and_args) > 1
+        and not _HELP_OPTION_NAMES.intersection(script_and_args[1:])
+    )
+    # Options that a help server must have been started with to answer for this invocation.
+    serve_options = {
+        "theme": theme,
+        "rich_config": dict(rich_config) if rich_config else None,
+        "output": output,
+        "errors_in_output_format": errors_in_output_format,
+        "patch_rich_click": patch_rich_click,
+    }
+    if (
+        not serve
+        and not show_help
+        and not rebuild_index
+        and build_manifest is None
+        and build_snapshot is None
+        and not ctx.resilient_parsing
+        and _HELP_OPTION_NAMES.intersection(script_and_args[1:])
+    ):
+        response = _help_from_server(script_and_args[0], list(script_and_args[1:]), serve_options)
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            ctx.exit(response["exit_code"])
+
+    cfg = None if deferred else load_config()
+
+    if rebuild_index and not script_and_args and not show_help and not ctx.resilient_parsing:
+        from rich_click._cache import console_scripts_index
+
+        _sys_path = sys.path.copy()
+        sys.path.append(os.path.abspath("."))
+        try:
+            console_scripts_index(rebuild=True)
+        finally:
+            sys.path = _sys_path
+        ctx.exit(0)
 
     if (show_help or not script_and_args) and not ctx.resilient_parsing:
+        assert cfg is not None
         cfg.use_markdown = False
         cfg.use_rich_markup = True
         cfg.text_markup = "rich"
@@ -445,8 +613,11 @@ https://ewels.github.io/rich-click/latest/documentation/rich_click_cli/[/]
             yield
 
     # patch click before importing the program function
-    with patch_ctx():
-        _patch(rich_config=cfg, patch_rich_click=patch_rich_click)
+    if deferred:
+        _render_errors_with_rich_click(load_config)
+    else:
+        with patch_ctx():
+            _patch(rich_config=cfg, patch_rich_click=patch_rich_click)
 
     script, *args = script_and_args
 
@@ -455,28 +626,51 @@ https://ewels.github.io/rich-click/latest/documentation/rich_click_cli/[/]
     _sys_path = sys.path.copy()
     sys.path.append(os.path.abspath("."))
     try:
-        module_path, function_name = _get_module_path_and_function_name(script, suppress_warnings)
+        module_path, function_name = _get_module_path_and_function_name(script, suppress_warnings, rebuild_index)
     finally:
         sys.path = _sys_path
 
+    if build_manifest is not None:
+        if not function_name:
+            raise click.UsageError("--build-manifest requires a MODULE:CLICK_COMMAND.", ctx=ctx)
+        command = _load_function(module_path, function_name, command=True)
+
+        import json
+
+        from rich_click.rich_help_manifest import build_manifest as _build_manifest
+
+        json.dump(_build_manifest(command), build_manifest, separators=(",", ":"))
+        ctx.exit(0)
+
+    if build_snapshot is not None:
+        if not function_name:
+            raise click.UsageError("--build-snapshot requires a MODULE:CLICK_COMMAND.", ctx=ctx)
+        command = _load_function(module_path, function_name, command=True)
+
+        from rich_click.rich_help_snapshot import build_snapshot as _build_snapshot
+
+        # A console script is invoked by its name, rather than the command's.
+        info_name = None if ":" in script else script
+        build_snapshot.write(_build_snapshot(command, info_name))
+        ctx.exit(0)
+
+    if serve:
+        if not function_name:
+            raise click.UsageError("--serve requires a MODULE:CLICK_COMMAND.", ctx=ctx)
+        command = _load_function(module_path, function_name, command=True)
+
+        from rich_click._serve import serve as _serve
+        from rich_click._serve import socket_path
+
+        RichContext.export_console_as = ctx.export_console_as = output
+        RichContext.errors_in_output_format = ctx.errors_in_output_format = errors_in_output_format
+        _serve(command, module_path, socket_path(module_path, function_name), serve_options)
+        ctx.exit(0)
+
     if function_name:
 
         def function() -> None:
-            try:
-                module = import_module(module_path)
-            except ModuleNotFoundError:
-                try:
-                    # Import can fail if module is relative to root dir
-                    # and PYTHONPATH does not include ".".
-                    sys.path.append(os.path.abspath("."))
-                    module = import_module(module_path)
-                except ModuleNotFoundError as e:
-                    raise click.ClickException(e.args[0] if e.args else "Unknown error")
-            try:
-                f = getattr(module, function_name)
-            except AttributeError:
-                raise click.ClickException(f"Module '{module_path}' has no attribute '{function_name}'.")
-            f()
+            _load_function(module_path, function_name)()
 
     elif module_path.endswith(".py"):
 
@@ -321,7 +321,9 @@ def help_option(*param_decls: str, **kwargs: Any) -> Callable[[FC], FC]:
         if value and not ctx.resilient_parsing:
             # Avoid click.echo() because it ignores console settings like force_terminal.
             # Also, do not print() if empty string; assume console was record=False.
-            if getattr(ctx, "help_to_stderr", False):
+            if isinstance(ctx, RichContext):
+                ctx.print_help()
+            elif getattr(ctx, "help_to_stderr", False):
                 print(ctx.get_help(), file=sys.stderr)
             else:
                 print(ctx.get_help())
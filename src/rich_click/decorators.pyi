@@ -3,7 +3,7 @@
 # Copyright (c) 2021, Gianluca Gippetto MIT
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, MutableMapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 from typing import (
     Any,
     Concatenate,
@@ -22,6 +22,7 @@ from rich_click.rich_command import RichCommand, RichGroup
 from rich_click.rich_context import RichContext
 from rich_click.rich_help_configuration import CommandColumnType, OptionColumnType, RichHelpConfiguration
 from rich_click.rich_panel import RichOptionPanel, RichPanel
+from rich_click.utils import LazyCommandDict
 
 _AnyCallable = Callable[..., Any]
 
@@ -154,6 +155,7 @@ def group(
     *,
     cls: type[G],
     commands: MutableMapping[str, click.Command] | Sequence[click.Command] | None = ...,
+    lazy_commands: Mapping[str, str | LazyCommandDict] | None = ...,
     invoke_without_command: bool = ...,
     no_args_is_help: bool | None = ...,
     subcommand_metavar: str | None = ...,
@@ -178,6 +180,7 @@ def group(
     *,
     cls: None,
     commands: MutableMapping[str, click.Command] | Sequence[click.Command] | None = ...,
+    lazy_commands: Mapping[str, str | LazyCommandDict] | None = ...,
     invoke_without_command: bool = ...,
     no_args_is_help: bool | None = ...,
     subcommand_metavar: str | None = ...,
@@ -202,6 +205,7 @@ def group(
     *,
     cls: type[G],
     commands: MutableMapping[str, click.Command] | Sequence[click.Command] | None = ...,
+    lazy_commands: Mapping[str, str | LazyCommandDict] | None = ...,
     invoke_without_command: bool = ...,
     no_args_is_help: bool | None = ...,
     subcommand_metavar: str | None = ...,
@@ -226,6 +230,7 @@ def group(
     *,
     cls: None,
     commands: MutableMapping[str, click.Command] | Sequence[click.Command] | None = ...,
+    lazy_commands: Mapping[str, str | LazyCommandDict] | None = ...,
     invoke_without_command: bool = ...,
     no_args_is_help: bool | None = ...,
     subcommand_metavar: str | None = ...,
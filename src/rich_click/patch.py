@@ -4,7 +4,7 @@ from __future__ import annotations
 
 # ruff: noqa: D103
 from abc import ABCMeta
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
 from click import Argument, Command, Context, Group, Option
 
@@ -19,6 +19,8 @@ from rich_click.rich_help_formatter import RichHelpFormatter
 if TYPE_CHECKING:
     import typer.core
 
+    from rich_click.rich_panel import RichPanel
+
 
 __TyperGroup: type[typer.core.TyperGroup]
 __TyperCommand: type[typer.core.TyperCommand]
@@ -29,35 +31,45 @@ __TyperOption: type[typer.core.TyperOption]
 class _PatchedTyperContext(RichContext):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         RichContext.__init__(self, *args, **kwargs)
+        self._typer_help_config: RichHelpConfiguration | None = None
 
-    def make_formatter(self, error_mode: bool = False) -> RichHelpFormatter:
+    def make_formatter(self, error_mode: bool = False, stream: IO[str] | None = None) -> RichHelpFormatter:
         """Create the Rich Help Formatter."""
         import rich_click.rich_click as rc
 
-        # Alignment between rich-click style and Typer style.
-        if not rc.DEFAULT_PANELS_FIRST:
-            self.help_config.default_panels_first = True
-        if rc.THEME is None:
-            # Infer user intent-- in rich-click CLI, config gets set via globals
-            if rc.STYLE_OPTIONS_TABLE_EXPAND is FROM_THEME:
-                self.help_config.style_options_table_expand = False
-            if rc.STYLE_COMMANDS_TABLE_EXPAND is FROM_THEME:
-                self.help_config.style_commands_table_expand = False
-
-        formatter = super().make_formatter(error_mode=error_mode)
-
-        if hasattr(self.command, "rich_markup_mode"):
-            if self.command.rich_markup_mode == "rich":
-                formatter.config.text_markup = "rich"
-                formatter.config.text_emojis = True
-            elif self.command.rich_markup_mode == "markdown":
-                formatter.config.text_markup = "markdown"
-                formatter.config.text_emojis = True
+        # The config may be shared with other contexts, so overrides are applied as an overlay instead of mutating it.
+        # The overlay is applied once per context, unless the context's config is replaced.
+        if self._typer_help_config is None or self.help_config is not self._typer_help_config:
+            overrides: dict[str, Any] = {}
+
+            # Alignment between rich-click style and Typer style.
+            if not rc.DEFAULT_PANELS_FIRST:
+                overrides["default_panels_first"] = True
+            if rc.THEME is None:
+                # Infer user intent-- in rich-click CLI, config gets set via globals
+                if rc.STYLE_OPTIONS_TABLE_EXPAND is FROM_THEME:
+                    overrides["style_options_table_expand"] = False
+                if rc.STYLE_COMMANDS_TABLE_EXPAND is FROM_THEME:
+                    overrides["style_commands_table_expand"] = False
+
+            if hasattr(self.command, "rich_markup_mode"):
+                if self.command.rich_markup_mode == "rich":
+                    overrides["text_markup"] = "rich"
+                    overrides["text_emojis"] = True
+                elif self.command.rich_markup_mode == "markdown":
+                    overrides["text_markup"] = "markdown"
+                    overrides["text_emojis"] = True
+
+            if overrides:
+                self.help_config = self.help_config._with_overlay(overrides)
+            self._typer_help_config = self.help_config
+
+        formatter = super().make_formatter(error_mode=error_mode, stream=stream)
 
         if isinstance(formatter.config.theme, str) and formatter.config.theme.endswith("box"):
             # If user explicitly sets box theme, checking rc namespace does not work,
             # as theme will be set already. Most users don't touch "expand"
-            # so just prefer to override.
+            # so just prefer to override. The formatter's config is its own copy, so it can be changed.
             if rc.STYLE_OPTIONS_TABLE_EXPAND is FROM_THEME:
                 formatter.config.style_options_table_expand = False
             if rc.STYLE_COMMANDS_TABLE_EXPAND is FROM_THEME:
@@ -65,83 +77,80 @@ class _PatchedTyperContext(RichContext):
 
         return formatter
 
-    def get_help(self) -> str:
-        """
-        Format the help into a string and returns it.
-
-        Calls :meth:`format_help` internally.
-        """
-        import typer.core
-        from typer.models import DefaultPlaceholder
 
-        from rich_click.rich_panel import RichCommandPanel, RichOptionPanel
+def _typer_implied_panels(self: Any, ctx: RichContext, formatter: RichHelpFormatter) -> list[RichPanel[Any, Any]]:
+    """
+    Derive the default panels and the `rich_help_panel` panels of a Typer command.
 
-        formatter = self.make_formatter()
-
-        if isinstance(self.command, RichGroup):
-            command_panels: dict[str, list[str]] = {}
-            for cmd_name in self.command.commands:
-                cmd = self.command.commands[cmd_name]
-                if (
-                    isinstance(cmd, (typer.core.TyperCommand, typer.core.TyperGroup))
-                    and cmd.rich_help_panel is not None
-                    and not isinstance(cmd.rich_help_panel, DefaultPlaceholder)
-                ):
-                    command_panels.setdefault(cmd.rich_help_panel, [])
-                    command_panels[cmd.rich_help_panel].append(cmd_name)
-
-            default_commands = [
-                cmd_name
-                for cmd_name in self.command.commands
-                if cmd_name not in {cmd for command_list in command_panels.values() for cmd in command_list}
-            ]
-
-            if default_commands:
-                self.command.add_panel(
-                    RichCommandPanel(formatter.config.commands_panel_title, commands=default_commands)
-                )
-
-            for name, commands in command_panels.items():
-                self.command.add_panel(RichCommandPanel(name, commands=commands))
+    The panels are cached on the command, and derived again when its params, commands or the panel titles change.
+    """
+    import typer.core
+    from typer.models import DefaultPlaceholder
 
-        option_panels: dict[str, list[str]] = {}
+    from rich_click.rich_panel import RichCommandPanel, RichOptionPanel
 
-        for param in self.command.params:
+    config = formatter.config
+    key: tuple[Any, ...] = (
+        config.commands_panel_title,
+        config.arguments_panel_title,
+        config.options_panel_title,
+        tuple(self.params),
+    )
+    if isinstance(self, RichGroup):
+        key += (tuple(self.commands.items()),)
+    cached: tuple[tuple[Any, ...], list[RichPanel[Any, Any]]] | None = self.__dict__.get("_typer_panels")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    panels: list[RichPanel[Any, Any]] = []
+
+    if isinstance(self, RichGroup):
+        command_panels: dict[str, list[str]] = {}
+        default_commands: list[str] = []
+        for cmd_name, cmd in self.commands.items():
             if (
-                isinstance(param, (typer.core.TyperOption, typer.core.TyperArgument))
-                and param.rich_help_panel is not None
-                and param.name
-                and not isinstance(param.rich_help_panel, DefaultPlaceholder)
+                isinstance(cmd, (typer.core.TyperCommand, typer.core.TyperGroup))
+                and cmd.rich_help_panel is not None
+                and not isinstance(cmd.rich_help_panel, DefaultPlaceholder)
             ):
-                option_panels.setdefault(param.rich_help_panel, [])
-                option_panels[param.rich_help_panel].append(param.name)
-
-        default_opts = [
-            param.name
-            for param in self.command.params
-            if param.name
-            and isinstance(param, typer.core.TyperOption)
-            and param.name not in {param for param_list in option_panels.values() for param in param_list}
-        ]
-        default_args = [
-            param.name
-            for param in self.command.params
-            if param.name
-            and isinstance(param, typer.core.TyperArgument)
-            and param.name not in {param for param_list in option_panels.values() for param in param_list}
-        ]
-
-        if default_args:
-            if TYPE_CHECKING:
-                assert isinstance(self.command, RichCommand)
-            self.command.add_panel(RichOptionPanel(formatter.config.arguments_panel_title, options=default_args))
-
-        if default_opts:
-            if TYPE_CHECKING:
-                assert isinstance(self.command, RichCommand)
-            self.command.add_panel(RichOptionPanel(formatter.config.options_panel_title, options=default_opts))
-
-        return super().get_help()
+                command_panels.setdefault(cmd.rich_help_panel, []).append(cmd_name)
+            else:
+                default_commands.append(cmd_name)
+
+        if default_commands:
+            panels.append(RichCommandPanel(config.commands_panel_title, commands=default_commands))
+
+        for name, commands in command_panels.items():
+            panels.append(RichCommandPanel(name, commands=commands))
+
+    in_option_panels: set[str] = set()
+    for param in self.params:
+        if (
+            isinstance(param, (typer.core.TyperOption, typer.core.TyperArgument))
+            and param.rich_help_panel is not None
+            and param.name
+            and not isinstance(param.rich_help_panel, DefaultPlaceholder)
+        ):
+            in_option_panels.add(param.name)
+
+    default_opts: list[str] = []
+    default_args: list[str] = []
+    for param in self.params:
+        if not param.name or param.name in in_option_panels:
+            continue
+        if isinstance(param, typer.core.TyperOption):
+            default_opts.append(param.name)
+        elif isinstance(param, typer.core.TyperArgument):
+            default_args.append(param.name)
+
+    if default_args:
+        panels.append(RichOptionPanel(config.arguments_panel_title, options=default_args))
+
+    if default_opts:
+        panels.append(RichOptionPanel(config.options_panel_title, options=default_opts))
+
+    self._typer_panels = (key, panels)
+    return panels
 
 
 def _typer_command_init(
@@ -195,6 +204,7 @@ def _parse_args(self, ctx: Context, args: list[str]) -> list[str]:  # type: igno
 
 def _patch_typer_group(cls: type[Group]) -> type[Group]:
     cls.format_help = RichGroup.format_help  # type: ignore[assignment]
+    cls._implied_panels = _typer_implied_panels  # type: ignore[attr-defined]
     cls.__init__ = _typer_group_init  # type: ignore[method-assign]
     cls.parse_args = _parse_args  # type: ignore[method-assign]
     cls.context_class = _PatchedTyperContext
@@ -206,6 +216,7 @@ def _patch_typer_group(cls: type[Group]) -> type[Group]:
 
 def _patch_typer_command(cls: type[Command]) -> type[Command]:
     cls.format_help = RichCommand.format_help  # type: ignore[assignment]
+    cls._implied_panels = _typer_implied_panels  # type: ignore[attr-defined]
     cls.__init__ = _typer_command_init  # type: ignore[method-assign]
     cls.context_class = _PatchedTyperContext
     cls.panel = property(  # type: ignore[attr-defined]
@@ -171,6 +171,8 @@ COMMAND_GROUPS: dict[str, list[CommandGroupDict]] = {}
 OPTION_GROUPS: dict[str, list[OptionGroupDict]] = {}
 USE_CLICK_SHORT_HELP: bool = False  # Use click's default function to truncate help text
 HELPTEXT_SHOW_ALIASES: bool = True
+ENABLE_HELP_CACHE: bool = False  # Cache rendered help text on disk; see docs for details
+STREAM_HELP: bool = False  # Write help text as it renders instead of buffering it
 
 #!ENDCONFIG
 
@@ -1,16 +1,16 @@
 from collections.abc import Callable
-from copy import deepcopy
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal
 
 
 if TYPE_CHECKING:
     from rich.style import StyleType
 
-# TODO: Optimize loading themes
-#  No need to iterate over everything and store in memory.
-#  Behaviors when combining themes is also weird
+# TODO: Behaviors when combining themes is weird
 #  and can allow for more interesting variety.
 
+ENTRY_POINT_GROUP = "rich_click.themes"
+
 ThemeType = Literal["color", "format", "combined"]
 
 
@@ -53,7 +53,8 @@ class RichClickTheme:
         return f"<{self.__class__.__name__} {self.name}>"
 
     def combine(self, other: "RichClickTheme") -> "RichClickTheme":
-        styles = deepcopy(self.styles)
+        # Theme styles are never mutated, so a shallow copy is enough.
+        styles = self.styles.copy()
         styles.update(other.styles)
         if self.post_combine_callback:
             styles.update(self.post_combine_callback(styles))
@@ -1081,13 +1082,40 @@ FORMATS: dict[str, RichClickTheme] = {
     ),
 }
 
-_THEME_CACHE: dict[str, RichClickTheme] = {}
-
 
 class RichClickThemeNotFound(KeyError):
     """Raise when a theme is not found."""
 
 
+@lru_cache(maxsize=64)
+def _combined_theme(clr: str, fmt: str) -> RichClickTheme:
+    return COLORS[clr] + FORMATS[fmt]
+
+
+@lru_cache(maxsize=64)
+def _entry_point_theme(name: str) -> RichClickTheme | None:
+    """
+    Load a theme registered by another package under the `rich_click.themes` entry point group.
+
+    The theme is layered on top of the default theme, so it only needs to define the styles it changes.
+    """
+    from importlib.metadata import entry_points
+
+    for ep in entry_points(group=ENTRY_POINT_GROUP, name=name):
+        theme = ep.load()
+        if not isinstance(theme, RichClickTheme):
+            import warnings
+
+            warnings.warn(
+                f"Entry point {ep.value!r} for RichClickTheme '{name}' is not a RichClickTheme.",
+                UserWarning,
+                stacklevel=2,
+            )
+            return None
+        return _combined_theme("default", "box") + theme
+    return None
+
+
 def get_theme(theme: str, raise_key_error: bool = True) -> RichClickTheme:
     """Get the theme based on the string name."""
     clr: str | None = None
@@ -1099,28 +1127,22 @@ def get_theme(theme: str, raise_key_error: bool = True) -> RichClickTheme:
         clr = random.choice(list(COLORS.keys()))
         fmt = random.choice(list(FORMATS.keys()))
 
-        rich_click_theme = _THEME_CACHE[f"{clr}-{fmt}"] = COLORS[clr] + FORMATS[fmt]
-        return rich_click_theme
-    if theme in _THEME_CACHE:
-        return _THEME_CACHE[theme]
+        return _combined_theme(clr, fmt)
     try:
         if "-" not in theme:
             if theme in COLORS:
-                rich_click_theme = _THEME_CACHE[theme] = COLORS[theme] + FORMATS["box"]
-                return rich_click_theme
+                return _combined_theme(theme, "box")
             elif theme in FORMATS:
-                rich_click_theme = _THEME_CACHE[theme] = COLORS["default"] + FORMATS[theme]
-                return rich_click_theme
-            else:
-                raise RichClickThemeNotFound(f"RichClickTheme '{theme}' not found")
-        clr, fmt, *_ = theme.split("-")
-        if _:
-            raise RichClickThemeNotFound(f"RichClickTheme '{theme}' not found")
-        if clr in COLORS and fmt in FORMATS:
-            rich_click_theme = _THEME_CACHE[theme] = COLORS[clr] + FORMATS[fmt]
-            return rich_click_theme
+                return _combined_theme("default", theme)
         else:
+            clr, fmt, *_ = theme.split("-")
+            if not _ and clr in COLORS and fmt in FORMATS:
+                return _combined_theme(clr, fmt)
+        # Third-party themes are only looked up when the name is not a built-in theme.
+        rich_click_theme = _entry_point_theme(theme)
+        if rich_click_theme is None:
             raise RichClickThemeNotFound(f"RichClickTheme '{theme}' not found")
+        return rich_click_theme
     except KeyError:
         if raise_key_error:
             raise
@@ -1132,7 +1154,7 @@ def get_theme(theme: str, raise_key_error: bool = True) -> RichClickTheme:
             stacklevel=2,
         )
         if clr and clr in COLORS:
-            return COLORS[clr] + FORMATS["box"]
+            return _combined_theme(clr, "box")
         elif fmt and fmt in FORMATS:
-            return COLORS["default"] + FORMATS[fmt]
-        return COLORS["default"] + FORMATS["box"]
+            return _combined_theme("default", fmt)
+        return _combined_theme("default", "box")
@@ -5,7 +5,9 @@ import os
 import sys
 import warnings
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from types import MappingProxyType
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Literal,
@@ -32,6 +34,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
     from rich_click.rich_help_rendering import RichPanelRow
     from rich_click.rich_panel import RichCommandPanel, RichPanel
+    from rich_click.utils import LazyCommandDict
 
 
 # TLDR: if a subcommand overrides one of the methods called by `RichCommand.format_help`,
@@ -52,6 +55,7 @@ class RichCommand(Command):
 
     context_class: type[RichContext] = RichContext
     _formatter: RichHelpFormatter | None = None
+    _panel_layout: tuple[tuple[Any, ...], list[RichPanel[Any, Any]]] | None = None
 
     def __init__(
         self,
@@ -232,6 +236,7 @@ class RichCommand(Command):
                 formatter = self._error_formatter()
                 formatter.write_error(e)
                 print(formatter.getvalue(), file=sys.stderr, end="")
+                formatter._release()
                 sys.exit(e.exit_code)
             except OSError as e:
                 if e.errno == errno.EPIPE:
@@ -255,9 +260,120 @@ class RichCommand(Command):
             else:
                 formatter.write_abort()
                 print(formatter.getvalue(), file=sys.stderr, end="")
+                formatter._release()
             finally:
                 sys.exit(1)
 
+    def invoke_isolated(
+        self,
+        args: Sequence[str],
+        *,
+        prog_name: str | None = None,
+        stdout: IO[str] | None = None,
+        stderr: IO[str] | None = None,
+        config: RichHelpConfiguration | Mapping[str, Any] | None = None,
+        export_console_as: Literal["html", "svg", "text"] | None = None,
+        errors_in_output_format: bool | None = None,
+        **extra: Any,
+    ) -> int:
+        """
+        Invoke the command without changing any process-wide state, and return its exit code.
+
+        Unlike `main()`, this never calls `sys.exit()`, never replaces `sys.stdout` or `sys.stderr`,
+        never reads `sys.argv`, and does not handle shell completion. Help text, errors and aborts are printed
+        to the given streams and rendered with the given settings, so commands can be invoked from
+        many threads at once, e.g. by a REPL or a server.
+
+        Output that the command's own callbacks print, e.g. with `click.echo()`, is not redirected.
+        Callbacks can print to the context's `stdout` and `stderr` streams instead.
+
+        Args:
+        ----
+            args: The arguments to parse.
+            prog_name: The program name shown in help text. Defaults to the name of the command.
+            stdout: Stream for help text. Defaults to sys.stdout at the time of the call.
+            stderr: Stream for errors and aborts. Defaults to sys.stderr at the time of the call.
+            config: Help configuration, which takes precedence over the `rich_help_config` context setting.
+            export_console_as: Overrides `RichContext.export_console_as`.
+            errors_in_output_format: Overrides `RichContext.errors_in_output_format`.
+            **extra: Extra kwargs passed to `make_context()`.
+
+        """
+        stdout = stdout if stdout is not None else sys.stdout
+        stderr = stderr if stderr is not None else sys.stderr
+        extra.update(stdout=stdout, stderr=stderr)
+        if config is not None:
+            extra["rich_help_config"] = config
+        if export_console_as is not None:
+            extra["export_console_as"] = export_console_as
+        if errors_in_output_format is not None:
+            extra["errors_in_output_format"] = errors_in_output_format
+
+        def print_error(ctx: click.Context | None, e: click.exceptions.ClickException | None) -> None:
+            if isinstance(ctx, RichContext):
+                formatter = ctx.make_formatter(error_mode=True)
+            else:
+                # The error was raised before a context was created.
+                ctx = self.context_class(self, info_name=prog_name or self.name, **extra)
+                formatter = ctx.make_formatter(error_mode=True)
+            if e is None:
+                formatter.write_abort()
+            else:
+                formatter.write_error(e)
+            print(formatter.getvalue(), file=stderr, end="")
+            formatter._release()
+
+        ctx: RichContext | None = None
+        try:
+            try:
+                with self.make_context(prog_name or self.name, list(args), **extra) as ctx:
+                    self.invoke(ctx)
+                    return 0
+            except (EOFError, KeyboardInterrupt):
+                print(file=stderr)
+                raise click.exceptions.Abort() from None
+            except click.exceptions.ClickException as e:
+                from rich_click._compat_click import CLICK_IS_BEFORE_VERSION_82
+
+                if not CLICK_IS_BEFORE_VERSION_82:
+                    if isinstance(e, click.exceptions.NoArgsIsHelpError):
+                        print(e.message, file=stdout)
+                        return e.exit_code
+                print_error(getattr(e, "ctx", None) or ctx, e)
+                return e.exit_code
+            except OSError as e:
+                if e.errno == errno.EPIPE:
+                    return 1
+                raise
+        except click.exceptions.Exit as e:
+            return e.exit_code
+        except click.exceptions.Abort:
+            print_error(ctx, None)
+            return 1
+
+    def get_help(self, ctx: click.Context) -> str:
+        if isinstance(ctx, RichContext) and ctx.help_snapshot is not None:
+            from rich_click.rich_help_snapshot import get_snapshot_help
+
+            snapshot_help = get_snapshot_help(self, ctx)
+            if snapshot_help is not None:
+                return snapshot_help
+        if isinstance(ctx, RichContext) and ctx.help_config.enable_help_cache:
+            from rich_click._cache import get_cached_help
+
+            return get_cached_help(self, ctx, lambda: self._render_help(ctx))
+        return self._render_help(ctx)
+
+    def _render_help(self, ctx: click.Context) -> str:
+        if isinstance(ctx, RichContext) and super(RichCommand, type(self)).get_help is click.core.Command.get_help:
+            # The same as click's get_help(), which cannot return the formatter's console to the pool.
+            formatter = ctx.make_formatter()
+            self.format_help(ctx, formatter)
+            value = formatter.getvalue().rstrip("\n")
+            formatter._release()
+            return value
+        return super().get_help(ctx)
+
     # Mypy complains about Liskov substitution principle violations.
     # We opt to ignore mypy here.
 
@@ -340,6 +456,10 @@ class RichCommand(Command):
         """Add a RichPanel to the RichCommand."""
         self.panels.append(panel)
 
+    def _implied_panels(self, ctx: RichContext, formatter: RichHelpFormatter) -> list[RichPanel[Any, Any]]:
+        """Panels derived from the command itself, which are laid out after `panels` without being added to them."""
+        return []
+
 
 class RichGroup(RichCommand, Group):
     """
@@ -351,9 +471,28 @@ class RichGroup(RichCommand, Group):
 
     command_class: type[RichCommand] | None = RichCommand
     group_class: type[Group] | type[type] | None = type
+    # Read-only default for subclasses that do not call RichGroup.__init__().
+    lazy_commands: Mapping[str, LazyCommandDict] = MappingProxyType({})
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Mapping[str, str | LazyCommandDict] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Create RichGroup instance.
+
+        Args:
+        ----
+            *args: Args that get passed to click.Group.
+            lazy_commands: Mapping of command names to either an import path such as "pkg.mod:cmd",
+                or a dict containing an "import_path" plus metadata (short_help, aliases, panel, etc.)
+                that is used to render help text without importing the command.
+            **kwargs: Kwargs that get passed to click.Group.
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Create RichGroup instance."""
+        """
+        self.lazy_commands = {}
         super().__init__(*args, **kwargs)
 
         self._alias_mapping: dict[str, str] = {}
@@ -373,6 +512,56 @@ class RichGroup(RichCommand, Group):
             if cmd.name and panel:
                 self.add_command_to_panel(cmd, panel)
 
+        for name, spec in (lazy_commands or {}).items():
+            self.add_lazy_command(name, spec)
+
+    def add_lazy_command(self, name: str, spec: str | LazyCommandDict) -> None:
+        """
+        Register a command that is only imported when it is invoked.
+
+        The metadata in the spec is used to render the group's help text,
+        so listing subcommands does not import them.
+        """
+        if isinstance(spec, str):
+            spec = {"import_path": spec}
+        lazy_commands = self.lazy_commands if isinstance(self.lazy_commands, dict) else {}
+        lazy_commands[name] = spec
+        self.lazy_commands = lazy_commands
+        for alias in spec.get("aliases") or []:
+            self._alias_mapping[alias] = name
+        panel = spec.get("panel")
+        if panel:
+            self._panel_command_mapping.setdefault(name, [])
+            if isinstance(panel, str):
+                self._panel_command_mapping[name].append(panel)
+            else:
+                self._panel_command_mapping[name].extend(panel)
+
+    def _load_lazy_command(self, name: str) -> click.Command:
+        from rich_click.utils import load_command
+
+        command = load_command(self.lazy_commands[name]["import_path"])
+        self.commands[name] = command
+        return command
+
+    def _get_help_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """
+        Get a command for rendering help text only.
+
+        Lazy commands that have not been imported yet are represented by a placeholder
+        built from their declared metadata.
+        """
+        _cmd_name = self._alias_mapping.get(cmd_name, cmd_name)
+        if _cmd_name in self.commands or _cmd_name not in self.lazy_commands:
+            return self.get_command(ctx, cmd_name)
+        return _placeholder_command(_cmd_name, self.lazy_commands[_cmd_name])
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        commands = super().list_commands(ctx)
+        if self.lazy_commands:
+            return sorted({*commands, *self.lazy_commands})
+        return commands
+
     def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         # Not used
         pass
@@ -531,6 +720,8 @@ class RichGroup(RichCommand, Group):
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
         _cmd_name = self._alias_mapping.get(cmd_name, cmd_name)
+        if _cmd_name not in self.commands and _cmd_name in self.lazy_commands:
+            return self._load_lazy_command(_cmd_name)
         return super().get_command(ctx, _cmd_name)
 
     def add_command(
@@ -598,3 +789,17 @@ def prevent_incompatible_overrides(
             getattr(RichCommand, method_name)(cmd, ctx, formatter)
         else:
             getattr(cmd, method_name)(ctx, formatter)
+
+
+def _placeholder_command(name: str, metadata: Mapping[str, Any]) -> RichCommand:
+    """Create a command that only renders a row in its parent's help text, for subcommands that are not imported."""
+    return RichCommand(
+        name=name,
+        help=metadata.get("help"),
+        short_help=metadata.get("short_help"),
+        aliases=metadata.get("aliases"),
+        panel=metadata.get("panel"),
+        hidden=metadata.get("hidden", False),
+        deprecated=metadata.get("deprecated", False),
+        add_help_option=False,
+    )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, MutableMapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 from typing import (
+    IO,
     Any,
     Literal,
     NoReturn,
@@ -22,6 +23,7 @@ from rich_click.rich_help_configuration import RichHelpConfiguration
 from rich_click.rich_help_formatter import RichHelpFormatter
 from rich_click.rich_help_rendering import RichPanelRow
 from rich_click.rich_panel import RichCommandPanel, RichPanel
+from rich_click.utils import LazyCommandDict
 
 _AnyCallable = Callable[..., Any]
 C = TypeVar("C", bound=click.Command)
@@ -35,6 +37,7 @@ OVERRIDES_GUARD: bool = False
 class RichCommand(click.Command):
     context_class: type[RichContext] = RichContext
     _formatter: RichHelpFormatter | None = None
+    _panel_layout: tuple[tuple[Any, ...], list[RichPanel[Any, Any]]] | None = None
     panels: list[RichPanel[Any, Any]]
     panel: str | None
     aliases: Iterable[str]
@@ -91,6 +94,19 @@ class RichCommand(click.Command):
         windows_expand_args: bool = True,
         **extra: Any,
     ) -> Any: ...
+    def invoke_isolated(
+        self,
+        args: Sequence[str],
+        *,
+        prog_name: str | None = None,
+        stdout: IO[str] | None = None,
+        stderr: IO[str] | None = None,
+        config: RichHelpConfiguration | Mapping[str, Any] | None = None,
+        export_console_as: Literal["html", "svg", "text"] | None = None,
+        errors_in_output_format: bool | None = None,
+        **extra: Any,
+    ) -> int: ...
+    def get_help(self, ctx: click.Context) -> str: ...
     def format_help(self, ctx: RichContext, formatter: RichHelpFormatter) -> None: ...
     def format_help_text(self, ctx: RichContext, formatter: RichHelpFormatter) -> None: ...
     def format_options(self, ctx: RichContext, formatter: RichHelpFormatter) -> None: ...
@@ -103,6 +119,7 @@ class RichCommand(click.Command):
         panel: RichCommandPanel | None = None,
     ) -> RichPanelRow: ...
     def add_panel(self, panel: RichPanel[Any, Any]) -> None: ...
+    def _implied_panels(self, ctx: RichContext, formatter: RichHelpFormatter) -> list[RichPanel[Any, Any]]: ...
     def add_command_to_panel(
         self,
         command_name: str,
@@ -122,10 +139,13 @@ class RichGroup(RichCommand, click.Group):
     _alias_mapping: dict[str, str]
     _panel_command_mapping: dict[str, list[str]]
 
+    lazy_commands: Mapping[str, LazyCommandDict]
+
     def __init__(
         self,
         panels: list[RichPanel[Any, Any]] | None = None,
         aliases: Iterable[str] | None = None,
+        lazy_commands: Mapping[str, str | LazyCommandDict] | None = None,
         name: str | None = None,
         commands: MutableMapping[str, click.Command] | Sequence[click.Command] | None = None,
         invoke_without_command: bool = False,
@@ -144,6 +164,10 @@ class RichGroup(RichCommand, click.Group):
         hidden: bool = False,
         deprecated: bool | str = False,
     ) -> None: ...
+    def add_lazy_command(self, name: str, spec: str | LazyCommandDict) -> None: ...
+    def _load_lazy_command(self, name: str) -> click.Command: ...
+    def _get_help_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None: ...
+    def list_commands(self, ctx: click.Context) -> list[str]: ...
     def format_commands(self, ctx: RichContext, formatter: RichHelpFormatter) -> None: ...
     def format_help(self, ctx: RichContext, formatter: RichHelpFormatter) -> None: ...
     def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
@@ -422,3 +446,5 @@ class RichMultiCommand(RichGroup, click.CommandCollection):
 
 class RichCommandCollection(RichGroup, click.CommandCollection):
     pass
+
+def _placeholder_command(name: str, metadata: Mapping[str, Any]) -> RichCommand: ...
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal
+from typing import IO, TYPE_CHECKING, Any, Literal
 
 import click
 from click.globals import get_current_context as click_get_current_context
@@ -11,6 +12,8 @@ from rich_click.rich_help_formatter import RichHelpFormatter
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    import os
+
     from rich.console import Console
 
 
@@ -22,6 +25,10 @@ class RichContext(click.Context):
     export_console_as: Literal["html", "svg", "text"] | None = None
     errors_in_output_format: bool = False
     help_to_stderr: bool = False
+    help_manifest: str | os.PathLike[str] | Mapping[str, Any] | None = None
+    help_snapshot: str | os.PathLike[str] | bytes | None = None
+    stdout: IO[str] | None = None
+    stderr: IO[str] | None = None
 
     def __init__(
         self,
@@ -31,6 +38,10 @@ class RichContext(click.Context):
         export_console_as: Literal["html", "svg", "text"] | None = None,
         errors_in_output_format: bool | None = None,
         help_to_stderr: bool | None = None,
+        help_manifest: str | os.PathLike[str] | Mapping[str, Any] | None = None,
+        help_snapshot: str | os.PathLike[str] | bytes | None = None,
+        stdout: IO[str] | None = None,
+        stderr: IO[str] | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -44,6 +55,13 @@ class RichContext(click.Context):
             export_console_as: Arg is passed to RichHelpFormatter().
             errors_in_output_format: Arg is passed to RichHelpFormatter().
             help_to_stderr: If set, help is printed to stderr.
+            help_manifest: Path to a help manifest built with `rich-click --build-manifest`, or the loaded manifest.
+                Inherited by child contexts.
+            help_snapshot: Path to a help snapshot built with `rich-click --build-snapshot`, or its contents.
+                Inherited by child contexts.
+            stdout: Stream that help text is printed to, instead of sys.stdout. Inherited by child contexts.
+            stderr: Stream that help text is printed to when help_to_stderr is set,
+                instead of sys.stderr. Inherited by child contexts.
             **kwargs: Kwargs that get passed to click.Context.
 
         """
@@ -65,40 +83,154 @@ class RichContext(click.Context):
         else:
             self.errors_in_output_format = errors_in_output_format or self.errors_in_output_format
 
+        if help_manifest is None and hasattr(parent, "help_manifest"):
+            self.help_manifest = parent.help_manifest  # type: ignore[union-attr]
+        else:
+            self.help_manifest = help_manifest
+
+        if help_snapshot is None and hasattr(parent, "help_snapshot"):
+            self.help_snapshot = parent.help_snapshot  # type: ignore[union-attr]
+        else:
+            self.help_snapshot = help_snapshot
+
+        if stdout is None and hasattr(parent, "stdout"):
+            stdout = parent.stdout  # type: ignore[union-attr]
+        if stdout is not None:
+            self.stdout = stdout
+
+        if stderr is None and hasattr(parent, "stderr"):
+            stderr = parent.stderr  # type: ignore[union-attr]
+        if stderr is not None:
+            self.stderr = stderr
+
         if rich_console is None and hasattr(parent, "console"):
             rich_console = parent.console  # type: ignore[union-attr]
 
         if rich_console is not None:
             self.console = rich_console
 
-        if rich_help_config is None:
-            if hasattr(parent, "help_config"):
-                self.help_config = parent.help_config  # type: ignore[has-type,union-attr]
-            else:
-                self.help_config = RichHelpConfiguration.load_from_globals()
-        elif isinstance(rich_help_config, Mapping):
-            if hasattr(parent, "help_config"):
-                if TYPE_CHECKING:  # pragma: no cover
-                    assert parent is not None
-                kw = parent.help_config.__dict__.copy()
-                kw.update(rich_help_config)
-                self.help_config = RichHelpConfiguration(**kw)
-            else:
-                self.help_config = RichHelpConfiguration.load_from_globals(**rich_help_config)
+        # The help config is resolved on first access, since most invocations never render help text.
+        self._help_config: RichHelpConfiguration | None = None
+        self._help_config_source = rich_help_config
+
+    @property
+    def help_config(self) -> RichHelpConfiguration:
+        """Rich help configuration, which is resolved the first time it is accessed."""
+        if self._help_config is None:
+            self._help_config = self._resolve_help_config()
+        return self._help_config
+
+    @help_config.setter
+    def help_config(self, value: RichHelpConfiguration) -> None:
+        self._help_config = value
+
+    def _resolve_help_config(self) -> RichHelpConfiguration:
+        # Configurations built from globals and mapping overlays are memoized and shared between contexts.
+        source = self._help_config_source
+        parent_config: RichHelpConfiguration | None = getattr(self.parent, "help_config", None)
+        if source is None:
+            if parent_config is not None:
+                return parent_config
+            return RichHelpConfiguration._load_shared_from_globals()
+        elif isinstance(source, Mapping):
+            if parent_config is not None:
+                return parent_config._with_overlay(source)
+            return RichHelpConfiguration._load_shared_from_globals(**source)
         else:
-            self.help_config = rich_help_config
+            return source
 
-    def make_formatter(self, error_mode: bool = False) -> RichHelpFormatter:
+    def make_formatter(self, error_mode: bool = False, stream: IO[str] | None = None) -> RichHelpFormatter:
         """Create the Rich Help Formatter."""
+        kwargs: dict[str, Any] = {}
+        if stream is not None:
+            kwargs["stream"] = stream
         formatter = self.formatter_class(
             width=self.terminal_width,
             max_width=self.max_content_width,
             config=self.help_config,
             console=self.console,
             export_console_as=(self.export_console_as if not error_mode or self.errors_in_output_format else None),
+            **kwargs,
         )
         return formatter
 
+    async def aget_help(self) -> str:
+        """
+        Render the help text like get_help(), without blocking the event loop.
+
+        Rendering runs in a small thread pool shared by all callers. Concurrent calls for the same command,
+        with the same config and output settings, share a single render. Cancelling a call stops the render
+        if it has not started yet and no other call is waiting for it.
+        """
+        from rich_click._async import run_coalesced, run_in_executor
+
+        def render() -> str:
+            with self.scope(cleanup=False):
+                return self.get_help()
+
+        key = self._help_render_key()
+        if key is None:
+            return await run_in_executor(render)
+        return await run_coalesced(key, render)
+
+    def _help_render_key(self) -> tuple[Any, ...] | None:
+        """Describe everything that the help text of this context depends on, or return None if that is not known."""
+        if self.console is not None or type(self).get_help is not click.Context.get_help:
+            return None
+        # Objects are compared by identity. They are kept alive by the context that started the render.
+        return (
+            type(self),
+            self.command,
+            self.command_path,
+            id(self.help_config),
+            self.terminal_width,
+            self.max_content_width,
+            self.export_console_as,
+            self.show_default,
+            tuple(self.help_option_names),
+            self.auto_envvar_prefix,
+            id(self.default_map),
+            self.help_manifest if isinstance(self.help_manifest, str) else id(self.help_manifest),
+            self.help_snapshot if isinstance(self.help_snapshot, str) else id(self.help_snapshot),
+        )
+
+    def _can_stream_help(self) -> bool:
+        from rich_click.rich_command import RichCommand
+
+        return (
+            self.help_config.stream_help
+            and not self.help_config.enable_help_cache
+            and self.help_snapshot is None
+            and self.console is None
+            and self.export_console_as is None
+            # Overrides of get_help() may do more than render the help text.
+            and type(self).get_help is click.Context.get_help
+            and isinstance(self.command, RichCommand)
+            and type(self.command).get_help is RichCommand.get_help
+        )
+
+    def print_help(self, file: IO[str] | None = None) -> None:
+        """
+        Print the help text to a file, or to stdout (or stderr if help_to_stderr is set) by default.
+
+        The context's `stdout` and `stderr` streams take precedence over sys.stdout and sys.stderr.
+
+        If the `stream_help` config option is set, the help text is written as each section renders.
+        Otherwise, it is rendered in full with get_help() and then printed.
+        """
+        if file is None:
+            if self.help_to_stderr:
+                file = self.stderr if self.stderr is not None else sys.stderr
+            else:
+                file = self.stdout if self.stdout is not None else sys.stdout
+        if not self._can_stream_help():
+            print(self.get_help(), file=file)
+            return
+        formatter = self.make_formatter(stream=file)
+        self.command.format_help(self, formatter)
+        formatter._release()
+        file.flush()
+
 
 def get_current_context(silent: bool = False) -> RichContext | None:
     """
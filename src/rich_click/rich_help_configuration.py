@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
+import operator
 import os
+import weakref
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import copy
 from dataclasses import dataclass, field
-from types import ModuleType
+from types import MappingProxyType, ModuleType
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
-from rich_click.rich_click_theme import RichClickTheme, get_theme
 from rich_click.utils import CommandGroupDict, OptionGroupDict, notset, truthy
 
 
@@ -17,6 +22,9 @@ if TYPE_CHECKING:  # pragma: no cover
     from rich.padding import PaddingDimensions
     from rich.style import StyleType
     from rich.text import Text
+    from rich.theme import Theme
+
+    from rich_click.rich_click_theme import RichClickTheme
 
 T = TypeVar("T", bound="RichHelpConfiguration")
 
@@ -94,6 +102,123 @@ def terminal_width_default() -> int | None:
     return None
 
 
+class _SharedConfigMemo:
+    """Configurations derived from a shared configuration."""
+
+    __slots__ = ("overlays", "resolved")
+
+    def __init__(self) -> None:
+        self.overlays: dict[Any, RichHelpConfiguration] = {}
+        self.resolved: RichHelpConfiguration | None = None
+
+
+class _CompiledStyles:
+    """
+    The fields of a configuration, with style strings parsed into Style objects the first time they are accessed.
+
+    Values that cannot be parsed, e.g. names of styles in the console's theme, are returned as is.
+    """
+
+    def __init__(self, config: RichHelpConfiguration) -> None:
+        self._config = config
+        self._console_theme: Theme | None = None
+        # Copies of a configuration share its compiled styles, until any of them is modified.
+        self._valid = True
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called the first time an attribute is accessed, as the value is then set on the instance.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = getattr(self._config, name)
+        if isinstance(value, str) and value:
+            from rich.errors import StyleSyntaxError
+            from rich.style import Style
+
+            try:
+                value = Style.parse(value)
+            except StyleSyntaxError:
+                pass
+        setattr(self, name, value)
+        return value
+
+    def console_theme(self) -> Theme:
+        """Return the theme of the styles that can be referenced in markup, e.g. `[option]--foo[/]`."""
+        if self._console_theme is None:
+            from rich.theme import Theme
+
+            self._console_theme = Theme(
+                {
+                    "option": self._config.style_option,
+                    "command": self._config.style_command,
+                    "argument": self._config.style_argument,
+                    "switch": self._config.style_switch,
+                    "metavar": self._config.style_metavar,
+                    "metavar_sep": self._config.style_metavar_separator,
+                    "usage": self._config.style_usage,
+                    "deprecated": self._config.style_deprecated,
+                }
+            )
+        return self._console_theme
+
+
+# Keyed by id() of configurations that are shared between contexts; entries are removed when the config is collected.
+_shared_memos: dict[int, _SharedConfigMemo] = {}
+
+# The last configuration loaded from globals:
+# (class, module, global values, shallow state of list and dict globals, themes, {overlay key: config}).
+_globals_memo: (
+    tuple[type, ModuleType, tuple[Any, ...], tuple[tuple[Any, ...], ...], tuple[str | None, Any], dict[Any, Any]] | None
+) = None
+
+
+# Config options set by config_scope(), which take precedence over the globals in rich_click.rich_click.
+_scope: ContextVar[Mapping[str, Any]] = ContextVar("rich_click_config_scope", default=MappingProxyType({}))
+
+# Names of the globals that each configuration class is loaded from.
+_global_names: dict[type, list[str]] = {}
+
+
+def _share(config: T) -> T:
+    """Register a configuration as shared, so that configurations derived from it are memoized."""
+    key = id(config)
+    _shared_memos[key] = _SharedConfigMemo()
+    weakref.finalize(config, _shared_memos.pop, key, None)
+    return config
+
+
+def _unshare(config: RichHelpConfiguration) -> None:
+    """
+    Stop sharing a configuration that is being modified.
+
+    Its memoized derived configurations are dropped, and contexts created later load a new configuration
+    instead of this one, so the modification only applies to the contexts that already use it.
+    """
+    if _shared_memos.pop(id(config), None) is None:
+        return
+    stores = [memo.overlays for memo in _shared_memos.values()]
+    if _globals_memo is not None:
+        stores.append(_globals_memo[5])
+    for store in stores:
+        for key in [k for k, v in store.items() if v is config]:
+            del store[key]
+
+
+def _shallow_state(value: list[Any] | dict[Any, Any]) -> tuple[Any, ...]:
+    """Describe the items of a list or dict, and the length of the lists and dicts among them, without copying them."""
+    items = value.items() if isinstance(value, dict) else enumerate(value)
+    return tuple([(k, id(v), len(v) if isinstance(v, (list, dict)) else None) for k, v in items])
+
+
+def _overlay_key(overlay: Mapping[str, Any]) -> Any:
+    """Return a hashable key for an overlay, or None if it has unhashable values."""
+    try:
+        key = tuple(sorted(overlay.items()))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 @dataclass
 class RichHelpConfiguration:
     """
@@ -278,6 +403,33 @@ class RichHelpConfiguration:
 
     legacy_windows: bool | None = field(default=None)
 
+    enable_help_cache: bool = field(default=False)
+    """If set, cache rendered help text on disk and reuse it while the command and config are unchanged."""
+    stream_help: bool = field(default=False)
+    """If set, help text is written to the output stream as it renders, instead of being buffered first."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Changing any field invalidates the compiled styles.
+        styles = self.__dict__.pop("_compiled_styles", None)
+        if styles is not None:
+            styles._valid = False
+        if id(self) in _shared_memos:
+            _unshare(self)
+        object.__setattr__(self, name, value)
+
+    @property
+    def compiled_styles(self) -> _CompiledStyles:
+        """
+        The styles of this configuration, parsed into Rich Style objects.
+
+        Each style is parsed once per configuration instead of every time it is rendered,
+        e.g. `config.compiled_styles.style_option`. The styles are recompiled after a field is set.
+        """
+        styles: _CompiledStyles | None = self.__dict__.get("_compiled_styles")
+        if styles is None or not styles._valid:
+            styles = self.__dict__["_compiled_styles"] = _CompiledStyles(self)
+        return styles
+
     def __post_init__(self) -> None:  # noqa: D105
         if self.highlighter is not None:
             import warnings
@@ -374,10 +526,12 @@ class RichHelpConfiguration:
 
         When building from globals, all fields are treated as having been set by the user,
         meaning they will overwrite other fields when "merged".
+
+        Options set by an enclosing `config_scope()` take precedence over the globals in rich_click.rich_click.
         """
-        if module is None:
-            import rich_click.rich_click as rc
+        import rich_click.rich_click as rc
 
+        if module is None:
             module = rc
         kw = {}
         for k, v in cls.__dataclass_fields__.items():
@@ -385,17 +539,106 @@ class RichHelpConfiguration:
                 if k != "highlighter" and hasattr(module, k.upper()):
                     kw[k] = getattr(module, k.upper())
 
+        if module is rc:
+            kw.update(_scope.get())
         kw.update(extra)
         inst = cls(**kw)
         return inst
 
+    @classmethod
+    def _load_shared_from_globals(cls, **extra: Any) -> RichHelpConfiguration:
+        """
+        Memoized version of load_from_globals(), used by RichContext.
+
+        The memo is reused until a global is reassigned, an item is added, removed or replaced in a list or dict global
+        or in the lists and dicts directly inside it, e.g. `rc.OPTION_GROUPS["cli"].append(...)`,
+        or the theme set by the environment or the CLI changes. Deeper edits are not noticed.
+        Each config scope has its own entries in the memo.
+        The returned configuration is shared between contexts. Modifying it stops sharing it, see _unshare().
+        """
+        global _globals_memo
+
+        import rich_click.rich_click as rc
+
+        names = _global_names.get(cls)
+        if names is None:
+            names = _global_names[cls] = [k.upper() for k in cls.__dataclass_fields__ if k != "highlighter"]
+        values = tuple(map(vars(rc).get, names))
+        # Lists and dicts can be edited in place, which their identity does not show.
+        contents = tuple([_shallow_state(v) for v in values if isinstance(v, (list, dict))])
+        themes = (os.getenv("RICH_CLICK_THEME"), rc._THEME_FROM_CLI)
+
+        memo = _globals_memo
+        if (
+            memo is None
+            or memo[0] is not cls
+            or memo[1] is not rc
+            or not all(map(operator.is_, memo[2], values))
+            or memo[3] != contents
+            or memo[4] != themes
+        ):
+            memo = _globals_memo = (cls, rc, values, contents, themes, {})
+
+        scope = _scope.get()
+        key = _overlay_key(extra)
+        scope_key = _overlay_key(scope) if scope else ()
+        if key is None or scope_key is None:
+            return cls.load_from_globals(rc, **extra)
+        key = (scope_key, key)
+        if key not in memo[5]:
+            memo[5][key] = _share(cls.load_from_globals(rc, **extra))
+        config: RichHelpConfiguration = memo[5][key]
+        return config
+
+    def _with_overlay(self, overlay: Mapping[str, Any]) -> RichHelpConfiguration:
+        """
+        Return a copy of this configuration updated with the overlay.
+
+        The result is memoized if this configuration is shared.
+        """
+        memo = _shared_memos.get(id(self))
+        key = _overlay_key(overlay) if memo is not None else None
+        if memo is not None and key is not None and key in memo.overlays:
+            return memo.overlays[key]
+
+        kw = self.__dict__.copy()
+        kw.pop("_compiled_styles", None)
+        kw.update(overlay)
+        config = type(self)(**kw)
+        if memo is not None and key is not None:
+            memo.overlays[key] = _share(config)
+        return config
+
+    def _resolved(self) -> RichHelpConfiguration:
+        """
+        Return a copy of this configuration with the theme and defaults fully applied, for use by a formatter.
+
+        The resolved values are memoized if this configuration is shared, but a new copy is always returned,
+        so that the formatter is free to mutate it.
+        """
+        memo = _shared_memos.get(id(self))
+        if memo is not None and memo.resolved is not None:
+            return copy(memo.resolved)
+
+        config = copy(self)
+        # Applying the theme to the copy would otherwise invalidate the compiled styles it shares with this config.
+        config.__dict__.pop("_compiled_styles", None)
+        config.apply_theme(force_default=True)
+        if memo is not None:
+            memo.resolved = config
+            # Create the compiled styles before copying, so that every copy shares them.
+            config.compiled_styles  # noqa: B018
+            return copy(config)
+        return config
+
     def apply_theme(self, force_default: bool = False) -> None:
         theme: str | RichClickTheme | None = None
         raise_key_error = True
 
         import rich_click.rich_click as rc
 
-        if rc._THEME_FROM_CLI is not None:
+        # A theme set by a config scope takes precedence over the one passed to the rich-click CLI.
+        if rc._THEME_FROM_CLI is not None and "theme" not in _scope.get():
             theme = rc._THEME_FROM_CLI
         if self.enable_theme_env_var and "RICH_CLICK_THEME" in os.environ:
             _theme = os.environ["RICH_CLICK_THEME"]
@@ -431,6 +674,8 @@ class RichHelpConfiguration:
 
         theme_styles: dict[str, Any] | None = None
 
+        from rich_click.rich_click_theme import RichClickTheme, get_theme
+
         if isinstance(theme, RichClickTheme):
             theme_styles = theme.styles
         elif theme is not None:
@@ -484,6 +729,8 @@ class RichHelpConfiguration:
             styles.setdefault(k, getattr(self, k))
         kwargs.setdefault("name", "_from_config")
         kwargs["styles"] = styles
+        from rich_click.rich_click_theme import RichClickTheme
+
         return RichClickTheme(**kwargs)
 
     def dump_to_globals(self, module: ModuleType | None = None) -> None:
@@ -497,6 +744,32 @@ class RichHelpConfiguration:
                     setattr(module, k.upper(), getattr(self, k))
 
 
+@contextmanager
+def config_scope(**kwargs: Any) -> Iterator[None]:
+    """
+    Set config options for the current thread or asyncio task, on top of the globals in rich_click.rich_click.
+
+    Help configurations loaded from globals inside the scope use these options instead of the globals.
+    Options set with the `rich_help_config` context setting still take precedence. Scopes can be nested.
+
+    The scope is stored in a context variable, so asyncio tasks created inside it inherit it, but other threads do not.
+    To use a scope in a thread pool, submit `contextvars.copy_context().run` with your function.
+
+    Args:
+    ----
+        **kwargs: Config options, named like the fields of RichHelpConfiguration.
+
+    """
+    unknown = [k for k in kwargs if k == "highlighter" or k not in RichHelpConfiguration.__dataclass_fields__]
+    if unknown:
+        raise TypeError(f"config_scope() got unexpected config options: {', '.join(unknown)}")
+    token = _scope.set(MappingProxyType({**_scope.get(), **kwargs}))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
 def __getattr__(name: str) -> Any:
     if name == "OptionHighlighter":
         from rich.highlighter import RegexHighlighter
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import io
+import os
+import re
 import sys
+import threading
 from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import (
     IO,
     TYPE_CHECKING,
@@ -20,10 +23,12 @@ from rich_click.rich_panel import RichCommandPanel, RichOptionPanel, RichPanel
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    from rich.color import ColorSystem
     from rich.console import Console
     from rich.highlighter import Highlighter
     from rich.markdown import Markdown
-    from rich.style import StyleType
+    from rich.segment import Segment
+    from rich.style import Style, StyleType
     from rich.text import Text
 
 
@@ -47,6 +52,121 @@ class _EncodedStringIO(io.StringIO):
         return self._errors
 
 
+# Flags describing a help string, see _classify_text().
+_NEEDS_CLEANDOC = 1
+_HAS_MARKUP = 2
+_HAS_EMOJI_CODE = 4
+_HAS_ANSI = 8
+_HAS_DASH = 16
+_HAS_ANGLE_BRACKET = 32
+_HAS_DEPRECATED = 64
+
+# Characters that make Text.from_ansi() differ from Text(): escape codes, and line breaks other than "\n".
+_re_ansi_chars = re.compile("[\x1b\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+# Substrings required for each of the default highlighter patterns to match.
+_HIGHLIGHTER_PATTERN_FLAGS = {
+    r"(^|[^\w\-])(?P<switch>-([^\W0-9][\w\-]*\w|[^\W0-9]))": _HAS_DASH,
+    r"(^|[^\w\-])(?P<option>--([^\W0-9][\w\-]*\w|[^\W0-9]))": _HAS_DASH,
+    r"(?P<metavar><[^>]+>)": _HAS_ANGLE_BRACKET,
+    r"(?P<deprecated>\(DEPRECATED(?:\: .*?)?\))$": _HAS_DEPRECATED,
+}
+
+
+@lru_cache(maxsize=4096)
+def _classify_text(text: str) -> int:
+    """Describe which of the transformations that rich_text() applies can change a string."""
+    flags = 0
+    if "\n" in text or "\t" in text or text[:1].isspace():
+        flags |= _NEEDS_CLEANDOC
+    if "[" in text:
+        flags |= _HAS_MARKUP
+    if ":" in text:
+        flags |= _HAS_EMOJI_CODE
+    if _re_ansi_chars.search(text):
+        flags |= _HAS_ANSI
+    if "-" in text:
+        flags |= _HAS_DASH
+    if "<" in text:
+        flags |= _HAS_ANGLE_BRACKET
+    if "(DEPRECATED" in text:
+        flags |= _HAS_DEPRECATED
+    return flags
+
+
+def _render_segments(segments: Iterable[Segment], color_system: ColorSystem | None) -> str:
+    """
+    Render segments to a string with ANSI codes.
+
+    This is equivalent to calling `style.render()` on each segment, but the codes of each distinct style
+    are only computed once, and consecutive segments with the same style are wrapped in a single pair of codes.
+    """
+    if color_system is None:
+        return "".join([segment.text for segment in segments])
+
+    # Keyed by id(), which is cheaper than hashing a Style. The styles are kept alive by the segments.
+    codes: dict[int, tuple[str, str]] = {}
+    out: list[str] = []
+    run_text = ""
+    run_style: Style | None = None
+    wrap = ("", "")
+    for text, style, _ in segments:
+        if style is run_style:
+            run_text += text
+            continue
+        if run_text:
+            out.append(wrap[0] + run_text + wrap[1])
+        cached = codes.get(id(style))
+        if cached is None:
+            if style:
+                # Render a placeholder to let Rich produce the codes, including those of hyperlinks.
+                prefix, _, suffix = style.render("\x00", color_system=color_system).partition("\x00")
+                cached = codes[id(style)] = (prefix, suffix)
+            else:
+                cached = codes[id(style)] = ("", "")
+        wrap = cached
+        run_style = style
+        run_text = text
+    if run_text:
+        out.append(wrap[0] + run_text + wrap[1])
+    return "".join(out)
+
+
+def _new_console(config: RichHelpConfiguration, width: int | None) -> Console:
+    from rich.console import Console
+
+    return Console(
+        theme=config.compiled_styles.console_theme(),
+        color_system=config.color_system,
+        force_terminal=config.force_terminal,
+        width=width if width is not None else config.width,
+        legacy_windows=config.legacy_windows,
+    )
+
+
+def _setup_console(
+    console: Console, config: RichHelpConfiguration, file: IO[str] | None, max_width: int | None
+) -> Console:
+    if (console._width is None or console._height is None) and not console.legacy_windows:
+        if not console.is_dumb_terminal:
+            # Look up the size of the terminal once, instead of every time Rich needs the size of the console.
+            from rich_click._cache import terminal_size
+
+            columns, lines = terminal_size() or (0, 0)
+            if console._width is None:
+                console._width = columns or 80
+            if console._height is None:
+                console._height = lines or 25
+    console.record = file is None
+    # Defaults for console.color_system change when file is in __init__.
+    # Workaround: set file after __init__.
+    console.file = file or _EncodedStringIO()
+    max_width = max_width if max_width is not None else config.max_width
+    if isinstance(max_width, int):
+        console.width = min(max_width, console.size.width)
+    return console
+
+
 def create_console(
     config: RichHelpConfiguration,
     file: IO[str] | None = None,
@@ -65,35 +185,88 @@ def create_console(
         max_width: Max width of the Console; overrides config.max_width if set.
 
     """
-    from rich.console import Console
-    from rich.theme import Theme
-
-    console = Console(
-        theme=Theme(
-            {
-                "option": config.style_option,
-                "command": config.style_command,
-                "argument": config.style_argument,
-                "switch": config.style_switch,
-                "metavar": config.style_metavar,
-                "metavar_sep": config.style_metavar_separator,
-                "usage": config.style_usage,
-                "deprecated": config.style_deprecated,
-            }
-        ),
-        color_system=config.color_system,
-        force_terminal=config.force_terminal,
-        width=width if width is not None else config.width,
-        record=True if file is None else False,
-        legacy_windows=config.legacy_windows,
+    return _setup_console(_new_console(config, width), config, file, max_width)
+
+
+_ConsolePoolKey = tuple[Any, ...]
+
+# Environment variables that Rich reads when it creates a console.
+_CONSOLE_ENV_VARS = (
+    "TERM",
+    "COLORTERM",
+    "NO_COLOR",
+    "FORCE_COLOR",
+    "TTY_COMPATIBLE",
+    "TTY_INTERACTIVE",
+    "COLUMNS",
+    "LINES",
+)
+
+# Consoles of formatters that are no longer used, by everything their creation depended on.
+# Each entry also stores the console's width and height as it was created, before the formatter changed them.
+_console_pool: dict[_ConsolePoolKey, list[tuple[Console, tuple[int | None, int | None]]]] = {}
+_console_pool_lock = threading.Lock()
+_CONSOLE_POOL_MAX_KEYS = 16
+_CONSOLE_POOL_MAX_SIZE = 4
+
+
+def _console_pool_key(config: RichHelpConfiguration, width: int | None) -> _ConsolePoolKey:
+    # Rich detects the color system and interactivity from sys.stdout and the environment when a console is created.
+    try:
+        isatty = sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        isatty = False
+    environ = os.environ
+    return (
+        width if width is not None else config.width,
+        config.color_system,
+        config.force_terminal,
+        config.legacy_windows,
+        # Themes are compiled once per config, so their identity is enough.
+        config.compiled_styles.console_theme(),
+        isatty,
+        tuple([environ.get(k) for k in _CONSOLE_ENV_VARS]),
     )
-    # Defaults for console.color_system change when file is in __init__.
-    # Workaround: set file after __init__.
-    console.file = file or _EncodedStringIO()
-    max_width = max_width if max_width is not None else config.max_width
-    if isinstance(max_width, int):
-        console.width = min(max_width, console.size.width)
-    return console
+
+
+def _acquire_console(
+    config: RichHelpConfiguration,
+    file: IO[str] | None,
+    width: int | None,
+    max_width: int | None,
+) -> tuple[Console, _ConsolePoolKey, tuple[int | None, int | None]]:
+    """
+    Return a console the same as create_console() does, reusing a pooled console if there is one.
+
+    Pass the key and base size that are returned to _release_console() once the console is no longer used.
+    """
+    key = _console_pool_key(config, width)
+    with _console_pool_lock:
+        free = _console_pool.get(key)
+        entry = free.pop() if free else None
+    if entry is None:
+        console = _new_console(config, width)
+        base_size = console._width, console._height
+    else:
+        console, base_size = entry
+        console._width, console._height = base_size
+    return _setup_console(console, config, file, max_width), key, base_size
+
+
+def _release_console(console: Console, key: _ConsolePoolKey, base_size: tuple[int | None, int | None]) -> None:
+    if console._buffer_index or console._live_stack:
+        # Abandoned in the middle of rendering.
+        return
+    del console._record_buffer[:]
+    console.file = None  # type: ignore[assignment]
+    with _console_pool_lock:
+        free = _console_pool.get(key)
+        if free is None:
+            if len(_console_pool) >= _CONSOLE_POOL_MAX_KEYS:
+                del _console_pool[next(iter(_console_pool))]
+            free = _console_pool[key] = []
+        if len(free) < _CONSOLE_POOL_MAX_SIZE:
+            free.append((console, base_size))
 
 
 class RichHelpFormatter(click.HelpFormatter):
@@ -125,6 +298,7 @@ class RichHelpFormatter(click.HelpFormatter):
         config: RichHelpConfiguration | None = None,
         export_console_as: Literal[None, "html", "svg", "text"] = None,
         export_kwargs: dict[str, Any] | None = None,
+        stream: IO[str] | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -141,16 +315,16 @@ class RichHelpFormatter(click.HelpFormatter):
             file: Stream to output to in the Rich Console. If None, use stdout.
             export_console_as: How output is rendered by getvalue(). Default of None renders output normally.
             export_kwargs: Any kwargs passed to the export method of the Console in getvalue().
+            stream: If set, output is written to this stream as it renders instead of being recorded for getvalue().
             **kwargs: Kwargs passed to click.HelpFormatter.
 
         """
+        # The formatter works on its own resolved copy, since the config may be shared between contexts.
         if config is not None:
-            self.config = config
+            self.config = config._resolved()
             # Rich config overrides width and max width if set.
         else:
-            self.config = RichHelpConfiguration.load_from_globals()
-
-        self.config.apply_theme(force_default=True)
+            self.config = RichHelpConfiguration._load_shared_from_globals()._resolved()
 
         file = kwargs.pop("file", None)
         if file is not None:
@@ -162,10 +336,16 @@ class RichHelpFormatter(click.HelpFormatter):
                 stacklevel=2,
             )
 
+        self._pool_entry: tuple[_ConsolePoolKey, tuple[int | None, int | None]] | None = None
         if console:
             self.console = console
         else:
-            self.console = create_console(self.config, file=file, width=width, max_width=max_width)
+            # Code that renders with the formatter internally returns the console to a pool with _release(),
+            # so formatters created later with the same config skip creating a new one.
+            self.console, key, base_size = _acquire_console(
+                self.config, file=stream or file, width=width, max_width=max_width
+            )
+            self._pool_entry = (key, base_size)
 
         width = self.console.width
 
@@ -174,6 +354,17 @@ class RichHelpFormatter(click.HelpFormatter):
 
         super().__init__(indent_increment, width, max_width, *args, **kwargs)
 
+    def _release(self) -> None:
+        """
+        Return the formatter's console to the pool.
+
+        Only code that created the formatter, and has not handed out its console, may call this.
+        The formatter must not be used afterwards.
+        """
+        if self._pool_entry is not None:
+            _release_console(self.console, *self._pool_entry)
+            self._pool_entry = None
+
     @property
     def width(self) -> int:
         return self.console.width
@@ -187,12 +378,25 @@ class RichHelpFormatter(click.HelpFormatter):
         if self.config.highlighter is not None:
             return self.config.highlighter
         else:
-            from rich.highlighter import RegexHighlighter
+            from rich_click.rich_help_rendering import get_highlighter
+
+            return get_highlighter(tuple(self.config.highlighter_patterns))
 
-            class HighlighterClass(RegexHighlighter):
-                highlights = self.config.highlighter_patterns
+    @cached_property
+    def _highlighter_flags(self) -> int | None:
+        """
+        Return the flags of _classify_text() that a string needs for the highlighter to change it.
 
-            return HighlighterClass()
+        Returns None if that is not known, e.g. because a custom highlighter is used.
+        """
+        if type(self).highlighter is not RichHelpFormatter.highlighter or self.config.highlighter is not None:
+            return None
+        flags = 0
+        for pattern in self.config.highlighter_patterns:
+            if pattern not in _HIGHLIGHTER_PATTERN_FLAGS:
+                return None
+            flags |= _HIGHLIGHTER_PATTERN_FLAGS[pattern]
+        return flags
 
     def write(self, *objects: Any, **kwargs: Any) -> None:
         self.console.print(*objects, **kwargs)
@@ -207,6 +411,21 @@ class RichHelpFormatter(click.HelpFormatter):
 
         rich_format_error(self=e, formatter=self)
 
+    async def arender_error(self, e: click.ClickException) -> str:
+        """
+        Render an error like write_error() followed by getvalue(), without blocking the event loop.
+
+        Rendering runs in a small thread pool shared by all callers.
+        Cancelling the call stops the render if it has not started yet.
+        """
+        from rich_click._async import run_in_executor
+
+        def render() -> str:
+            self.write_error(e)
+            return self.getvalue()
+
+        return await run_in_executor(render)
+
     def write_abort(self) -> None:
         """Print richly formatted abort error."""
         self.console.print(self.config.aborted_text, style=self.config.style_aborted)
@@ -241,13 +460,33 @@ class RichHelpFormatter(click.HelpFormatter):
         if isinstance(text, JupyterMixin):
             return text
 
-        # Remove indentations from input text
-        text = inspect.cleandoc(text)
+        flags = _classify_text(text)
+        if flags & _NEEDS_CLEANDOC:
+            # Remove indentations from input text
+            text = inspect.cleandoc(text)
+            flags = _classify_text(text)
+
+        markup = self.config.text_markup
+        emojis = self.config.text_emojis and flags & _HAS_EMOJI_CODE
+
+        # Fast path for plain text, which neither markup, escape codes nor emoji codes can change.
+        if (
+            markup != "markdown"
+            and not emojis
+            and not self.config.text_kwargs
+            and not (markup == "rich" and flags & _HAS_MARKUP)
+            and not (markup == "ansi" and flags & _HAS_ANSI)
+        ):
+            rich_text = Text(text, style=style)
+            highlighter_flags = self._highlighter_flags
+            if highlighter_flags is not None and not flags & highlighter_flags:
+                return rich_text
+            return self.highlighter(rich_text)
 
         kw: dict[str, Any]
-        if self.config.text_markup != "rich":
+        if markup != "rich":
             kw = {"style": style}
-            if self.config.text_emojis:
+            if emojis:
                 from rich.emoji import Emoji
 
                 text = Emoji.replace(text)
@@ -256,14 +495,14 @@ class RichHelpFormatter(click.HelpFormatter):
 
         kw.update(self.config.text_kwargs or {})
 
-        if self.config.text_markup == "markdown":
+        if markup == "markdown":
             # Lazy load Markdown because it slows down rendering
             from rich.markdown import Markdown
 
             return Markdown(text, **kw)
-        elif self.config.text_markup == "rich":
+        elif markup == "rich":
             return self.highlighter(Text.from_markup(text, **kw))
-        elif self.config.text_markup == "ansi":
+        elif markup == "ansi":
             return self.highlighter(Text.from_ansi(text, **kw))
         else:
             return self.highlighter(Text(text, **kw))
@@ -279,34 +518,11 @@ class RichHelpFormatter(click.HelpFormatter):
 
                 colorama.init()
 
+            segments: Iterable[Segment] = self.console._record_buffer
             if self.console.no_color:
-                res = "".join(
-                    (
-                        style.render(
-                            text,
-                            color_system=(
-                                COLOR_SYSTEMS.get(self.console.color_system) if self.console.color_system else None
-                            ),
-                        )
-                        if style
-                        else text
-                    )
-                    for text, style, _ in Segment.remove_color(self.console._record_buffer)
-                )
-            else:
-                res = "".join(
-                    (
-                        style.render(
-                            text,
-                            color_system=(
-                                COLOR_SYSTEMS.get(self.console.color_system) if self.console.color_system else None
-                            ),
-                        )
-                        if style
-                        else text
-                    )
-                    for text, style, _ in self.console._record_buffer
-                )
+                segments = Segment.remove_color(segments)
+            color_system = COLOR_SYSTEMS.get(self.console.color_system) if self.console.color_system else None
+            res = _render_segments(segments, color_system)
             return res
         elif self.console.record:
             kw = self.export_kwargs.copy()
@@ -0,0 +1,222 @@
+"""
+Precomputed help manifests.
+
+A manifest stores the parts of a command tree's help text that are expensive to compute at runtime:
+metavars, default values, and the metadata of every subcommand. A CLI that ships a manifest renders
+its help text without calling `make_metavar()` or `get_default()`, and without importing lazy subcommands.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import warnings
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from rich_click._cache import _hash
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rich_click.rich_command import RichCommand
+
+
+MANIFEST_VERSION = 2
+
+_loaded_manifests: dict[str, Mapping[str, Any] | None] = {}
+
+
+def _make_child_context(command: click.Command, name: str | None, parent: click.Context | None) -> click.Context:
+    """Create a context the same way `make_context()` does, but without parsing any arguments."""
+    return command.context_class(command, info_name=name, parent=parent, **command.context_settings)
+
+
+def _param_signature(param: click.Parameter) -> str | None:
+    """
+    Hash the parts of a parameter that its metavar and default string are computed from.
+
+    Returns None if they cannot be compared across processes, e.g. a default without a stable repr.
+    """
+    try:
+        return _hash(
+            [
+                param.type.to_info_dict(),
+                None if callable(param.default) else param.default,
+                getattr(param, "show_default", None),
+            ]
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _build_command_entry(command: click.Command, ctx: click.Context, key: str, out: dict[str, Any]) -> None:
+    from rich_click.rich_help_rendering import _get_parameter_default_string, _make_metavar
+
+    params: dict[str, Any] = {}
+    for param in command.get_params(ctx):
+        if param.name is None:
+            continue
+        signature = _param_signature(param)
+        if signature is None:
+            continue
+        params[param.name] = {
+            "type": param.param_type_name,
+            "opts": list(param.opts),
+            "signature": signature,
+            "metavar": _make_metavar(param, ctx),  # type: ignore[arg-type]
+            "default": _get_parameter_default_string(param, ctx),  # type: ignore[arg-type]
+        }
+
+    entry: dict[str, Any] = {"show_default": ctx.show_default, "params": params}
+    out[key] = entry
+
+    if not isinstance(command, click.Group):
+        return
+
+    commands: dict[str, Any] = {}
+    for name in command.list_commands(ctx):
+        sub = command.get_command(ctx, name)
+        if sub is None:
+            continue
+        aliases = getattr(sub, "aliases", None)
+        metadata = {
+            "help": sub.help,
+            "short_help": sub.short_help,
+            "aliases": list(aliases) if aliases else None,
+            "panel": getattr(sub, "panel", None),
+            "hidden": sub.hidden,
+            "deprecated": sub.deprecated,
+        }
+        commands[name] = {k: v for k, v in metadata.items() if v}
+        sub_ctx = _make_child_context(sub, name, ctx)
+        _build_command_entry(sub, sub_ctx, f"{key} {name}".lstrip(), out)
+    entry["commands"] = commands
+
+
+def build_manifest(command: click.Command, info_name: str | None = None) -> dict[str, Any]:
+    """
+    Walk a command tree and compute everything needed to render its help text.
+
+    Every subcommand is imported, so this is intended to run at build time.
+    The result can be serialized with `json.dump()`.
+
+    Args:
+    ----
+        command: The root command of the CLI.
+        info_name: The name the root command is invoked as. Defaults to the command's name.
+
+    """
+    ctx = _make_child_context(command, info_name or command.name, None)
+    commands: dict[str, Any] = {}
+    with ctx:
+        _build_command_entry(command, ctx, "", commands)
+    return {"rich_click_manifest": MANIFEST_VERSION, "commands": commands}
+
+
+def load_manifest(source: str | os.PathLike[str] | Mapping[str, Any]) -> Mapping[str, Any] | None:
+    """
+    Load a manifest from a path, or validate an already loaded manifest.
+
+    Manifests read from disk are cached for the lifetime of the process.
+    A manifest that cannot be used emits a warning and returns None,
+    in which case help text is rendered without it.
+    """
+    if isinstance(source, Mapping):
+        manifest: Mapping[str, Any] | None = source
+        path = None
+    else:
+        path = os.fspath(source)
+        if path in _loaded_manifests:
+            return _loaded_manifests[path]
+        try:
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            warnings.warn(f"Could not load help manifest {path!r}: {e}", stacklevel=2)
+            manifest = None
+
+    if manifest is not None and manifest.get("rich_click_manifest") != MANIFEST_VERSION:
+        warnings.warn(
+            "Help manifest was built by an incompatible version of rich-click. Please rebuild it.",
+            stacklevel=2,
+        )
+        manifest = None
+
+    if path is not None:
+        _loaded_manifests[path] = manifest
+    return manifest
+
+
+def _manifest_key(ctx: click.Context) -> str:
+    """Return the names of the subcommands between the root command and this context."""
+    names: list[str] = []
+    while ctx.parent is not None:
+        name = ctx.info_name or ""
+        alias_mapping: dict[str, str] = getattr(ctx.parent.command, "_alias_mapping", {})
+        names.append(alias_mapping.get(name, name))
+        ctx = ctx.parent
+    return " ".join(reversed(names))
+
+
+def get_command_entry(ctx: click.Context) -> Mapping[str, Any] | None:
+    """Return the manifest entry for the command of a context, if the context has a help manifest."""
+    source = getattr(ctx, "help_manifest", None)
+    if source is None:
+        return None
+    manifest = load_manifest(source)
+    if manifest is None:
+        return None
+    entry: Mapping[str, Any] | None = manifest["commands"].get(_manifest_key(ctx))
+    return entry
+
+
+def _match_param(entry: Mapping[str, Any] | None, param: click.Parameter) -> Mapping[str, Any] | None:
+    if entry is None or param.name is None:
+        return None
+    param_entry: Mapping[str, Any] | None = entry["params"].get(param.name)
+    if (
+        param_entry is None
+        or param_entry["type"] != param.param_type_name
+        or param_entry["opts"] != list(param.opts)
+        or param_entry["signature"] != _param_signature(param)
+    ):
+        return None
+    return param_entry
+
+
+def get_param_entry(param: click.Parameter, ctx: click.Context) -> Mapping[str, Any] | None:
+    """Return the manifest entry for a parameter, if it matches the parameter's current definition."""
+    return _match_param(get_command_entry(ctx), param)
+
+
+def get_param_default_string(param: click.Parameter, ctx: click.Context) -> tuple[bool, str | None]:
+    """
+    Return the precomputed default string of a parameter.
+
+    The first item of the tuple is False when the manifest cannot be used,
+    e.g. because the default is overridden by the context's default_map.
+    """
+    entry = get_command_entry(ctx)
+    param_entry = _match_param(entry, param)
+    if (
+        param_entry is None
+        or entry["show_default"] != ctx.show_default  # type: ignore[index]
+        or (ctx.default_map is not None and param.name in ctx.default_map)
+    ):
+        return False, None
+    return True, param_entry["default"]
+
+
+def get_placeholder_command(ctx: click.Context, cmd_name: str) -> RichCommand | None:
+    """Return a placeholder for a subcommand, built from its metadata in the manifest."""
+    entry = get_command_entry(ctx)
+    if entry is None:
+        return None
+    metadata = entry.get("commands", {}).get(cmd_name)
+    if metadata is None:
+        return None
+    from rich_click.rich_command import _placeholder_command
+
+    return _placeholder_command(cmd_name, metadata)
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import inspect
 import re
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from enum import Enum
+from functools import lru_cache
 from gettext import gettext
 from typing import TYPE_CHECKING, Any, Literal, overload
 
@@ -11,11 +12,11 @@ import click
 from rich.align import Align
 from rich.columns import Columns
 from rich.console import RenderableType, group
-from rich.highlighter import RegexHighlighter
+from rich.highlighter import Highlighter, RegexHighlighter
 from rich.jupyter import JupyterMixin
 from rich.padding import Padding
 from rich.panel import Panel
-from rich.text import Text
+from rich.text import Span, Text
 
 from rich_click._click_types_cache import Argument, Command, Group, Option
 from rich_click._compat_click import (
@@ -24,6 +25,7 @@ from rich_click._compat_click import (
 )
 from rich_click.rich_context import RichContext
 from rich_click.rich_help_formatter import RichHelpFormatter
+from rich_click.rich_help_manifest import get_param_default_string, get_param_entry
 from rich_click.rich_parameter import RichParameter
 
 
@@ -75,6 +77,71 @@ class RichClickRichPanel(Panel):
         return None
 
 
+# Numbered backreferences and conditionals, which refer to the wrong group once patterns are combined.
+_re_group_number_reference = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+class CombinedRegexHighlighter(Highlighter):
+    """
+    Applies highlighting from a list of regular expressions, scanning text without highlights only once.
+
+    The patterns are combined into a single alternation, which finds the first position where any pattern matches.
+    Text without any match is left alone after that one scan. Otherwise each pattern runs from that position,
+    as a single alternation cannot find the matches of different patterns that overlap.
+    The highlighted spans are the same as those of a `RegexHighlighter` with the same patterns.
+    """
+
+    def __init__(self, highlights: Sequence[str]) -> None:
+        """
+        Create CombinedRegexHighlighter instance.
+
+        Args:
+        ----
+            highlights: Regular expressions, whose named groups are translated to styles.
+
+        """
+        self.highlights = tuple(highlights)
+        self._patterns = [re.compile(pattern) for pattern in self.highlights]
+        self._scan: re.Pattern[str] | None = None
+        if self.highlights and not any(_re_group_number_reference.search(p) for p in self.highlights):
+            try:
+                self._scan = re.compile("|".join(f"(?:{pattern})" for pattern in self.highlights))
+            except re.error:
+                # e.g. the same group name is used by more than one pattern.
+                pass
+
+    def highlight(self, text: Text) -> None:
+        """
+        Highlight text with the named groups of every pattern.
+
+        Args:
+        ----
+            text: Text to highlight.
+
+        """
+        plain = text.plain
+        pos = 0
+        if self._scan is not None:
+            first = self._scan.search(plain)
+            if first is None:
+                return
+            # No pattern matches before the first match of the alternation.
+            pos = first.start()
+        append_span = text.spans.append
+        for pattern in self._patterns:
+            for match in pattern.finditer(plain, pos):
+                for name in match.groupdict():
+                    start, end = match.span(name)
+                    if start != -1 and end > start:
+                        append_span(Span(start, end, name))
+
+
+@lru_cache(maxsize=32)
+def get_highlighter(highlights: tuple[str, ...]) -> CombinedRegexHighlighter:
+    """Return a highlighter for a list of patterns, which is shared by every formatter that uses the same patterns."""
+    return CombinedRegexHighlighter(highlights)
+
+
 @group()
 def _get_help_text(obj: Command | Group, formatter: RichHelpFormatter) -> Iterable[Padding | Markdown | Text]:
     """
@@ -93,6 +160,7 @@ def _get_help_text(obj: Command | Group, formatter: RichHelpFormatter) -> Iterab
         Text or Markdown: Multiple styled objects (depreciated, usage)
 
     """
+    styles = formatter.config.compiled_styles
     if TYPE_CHECKING:  # pragma: no cover
         assert isinstance(obj.help, str)
     config = formatter.config
@@ -102,16 +170,16 @@ def _get_help_text(obj: Command | Group, formatter: RichHelpFormatter) -> Iterab
             yield Padding(
                 Text.from_markup(
                     formatter.config.deprecated_with_reason_string.format(obj.deprecated.replace("[", r"\[")),
-                    style=config.style_deprecated,
+                    style=styles.style_deprecated,
                 ),
                 formatter.config.padding_helptext_deprecated,
-                style=formatter.config.style_padding_helptext,
+                style=styles.style_padding_helptext,
             )
         else:
             yield Padding(
-                Text.from_markup(config.deprecated_string, style=config.style_deprecated),
+                Text.from_markup(config.deprecated_string, style=styles.style_deprecated),
                 formatter.config.padding_helptext_deprecated,
-                style=formatter.config.style_padding_helptext,
+                style=styles.style_padding_helptext,
             )
 
     # Fetch and dedent the help text
@@ -127,9 +195,9 @@ def _get_help_text(obj: Command | Group, formatter: RichHelpFormatter) -> Iterab
         if not first_line.startswith("\b"):
             first_line = first_line.replace("\n", " ")
     yield Padding(
-        formatter.rich_text(first_line.strip(), formatter.config.style_helptext_first_line),
+        formatter.rich_text(first_line.strip(), styles.style_helptext_first_line),
         formatter.config.padding_helptext_first_line,
-        style=formatter.config.style_padding_helptext,
+        style=styles.style_padding_helptext,
     )
     # Get remaining lines, remove single line breaks and format as dim
     remaining_paragraphs = help_text.split("\n\n")[1:]
@@ -185,14 +253,12 @@ def _get_help_text(obj: Command | Group, formatter: RichHelpFormatter) -> Iterab
         else:
             # Join with double linebreaks if markdown
             remaining_lines = lb.join(remaining_paragraphs)
-        yield formatter.rich_text(remaining_lines, formatter.config.style_helptext)
+        yield formatter.rich_text(remaining_lines, styles.style_helptext)
     if getattr(obj, "aliases", None) and formatter.config.helptext_show_aliases:
         yield Text.from_markup(
             formatter.config.helptext_aliases_string.format(", ".join(obj.aliases)),  # type: ignore[attr-defined]
             style=(
-                formatter.config.style_helptext_aliases
-                if formatter.config.style_helptext_aliases is not None
-                else formatter.config.style_helptext
+                styles.style_helptext_aliases if styles.style_helptext_aliases is not None else styles.style_helptext
             ),
         )
 
@@ -205,7 +271,7 @@ def _get_deprecated_text(
         s = formatter.config.deprecated_with_reason_string.format(deprecated.replace("[", r"\["))
     else:
         s = formatter.config.deprecated_string
-    return Text.from_markup(s, style=formatter.config.style_deprecated)
+    return Text.from_markup(s, style=formatter.config.compiled_styles.style_deprecated)
 
 
 def _get_parameter_env_var(
@@ -231,7 +297,7 @@ def _get_parameter_env_var(
 
     if envvar is not None:
         return Text.from_markup(
-            formatter.config.envvar_string.format(envvar), style=formatter.config.style_option_envvar
+            formatter.config.envvar_string.format(envvar), style=formatter.config.compiled_styles.style_option_envvar
         )
     return None
 
@@ -278,7 +344,7 @@ def _get_parameter_help(
             help_text = re.sub(r"\(DEPRECATED\)$", "", help_text)
 
     if getattr(param, "help_style", None) is None:
-        style = formatter.config.style_option_help
+        style = formatter.config.compiled_styles.style_option_help
     else:
         style = param.help_style  # type: ignore[attr-defined]
     return formatter.rich_text(help_text, style)
@@ -308,6 +374,7 @@ def _get_parameter_range(
     formatter: RichHelpFormatter,
     mode: Literal["metavar_append", "metavar_column", "help"],
 ) -> Text | str | None:
+    styles = formatter.config.compiled_styles
     # Range - from
     # https://github.com/pallets/click/blob/c63c70dabd3f86ca68678b4f00951f78f52d0270/src/click/core.py#L2698-L2706  # noqa: E501
     # skip count with default range type
@@ -322,15 +389,15 @@ def _get_parameter_range(
                 return range_str
             elif mode == "metavar_column":
                 metavar_str = formatter.config.range_string.format(range_str)
-                return Text.from_markup(metavar_str, style=formatter.config.style_metavar)
+                return Text.from_markup(metavar_str, style=styles.style_metavar)
             elif mode == "help":
                 metavar_str = formatter.config.append_range_help_string.format(range_str)
                 return Text.from_markup(
                     metavar_str,
                     style=(
-                        formatter.config.style_range_append
-                        if formatter.config.style_range_append is not None
-                        else formatter.config.style_metavar_append
+                        styles.style_range_append
+                        if styles.style_range_append is not None
+                        else styles.style_metavar_append
                     ),
                 )
             else:
@@ -338,6 +405,14 @@ def _get_parameter_range(
     return None
 
 
+def _make_metavar(param: click.Argument | click.Option | RichParameter, ctx: click.Context) -> str:
+    param_entry = get_param_entry(param, ctx)
+    if param_entry is not None:
+        metavar: str = param_entry["metavar"]
+        return metavar
+    return param.make_metavar() if CLICK_IS_BEFORE_VERSION_82 else param.make_metavar(ctx)  # type: ignore
+
+
 def _get_parameter_metavar(
     param: click.Argument | click.Option | RichParameter,
     ctx: RichContext,
@@ -345,7 +420,8 @@ def _get_parameter_metavar(
     append: bool = True,
     show_range: bool = False,
 ) -> Text | None:
-    metavar_str = param.make_metavar() if CLICK_IS_BEFORE_VERSION_82 else param.make_metavar(ctx)  # type: ignore
+    styles = formatter.config.compiled_styles
+    metavar_str = _make_metavar(param, ctx)
     # Do it ourselves if this is a positional argument
     if isinstance(param, Argument) and param.name is not None and re.match(rf"\[?{param.name.upper()}]?", metavar_str):
         metavar_str = param.type.name.upper()
@@ -360,7 +436,7 @@ def _get_parameter_metavar(
 
         return Text.from_markup(
             formatter.config.append_metavars_help_string.format(metavar_str),
-            style=formatter.config.style_metavar_append if append else formatter.config.style_metavar,
+            style=styles.style_metavar_append if append else styles.style_metavar,
             overflow="fold",
         )
     return None
@@ -373,8 +449,8 @@ def _get_parameter_help_metavar_col(
     show_range: bool = True,
 ) -> Text | None:
     # Column for a metavar, if we have one
-    metavar = Text(style=formatter.config.style_metavar, overflow="fold")
-    metavar_str = param.make_metavar() if CLICK_IS_BEFORE_VERSION_82 else param.make_metavar(ctx)  # type: ignore
+    metavar = Text(style=formatter.config.compiled_styles.style_metavar, overflow="fold")
+    metavar_str = _make_metavar(param, ctx)
 
     if TYPE_CHECKING:  # pragma: no cover
         assert isinstance(param.name, str)
@@ -438,6 +514,7 @@ def _get_parameter_help_opt(
     #    the outer table column other than to explicitly set the width.
     # Attempting to solve both of those problems simultaneously leads to this mess.
 
+    styles = formatter.config.compiled_styles
     opt_long_primary = []
     opt_short_primary = []
     opt_long_secondary = []
@@ -470,18 +547,18 @@ def _get_parameter_help_opt(
     long_cols = []
     short_cols = []
 
-    comma = Text(formatter.config.delimiter_comma, style=formatter.config.style_option_help)
-    slash = Text(formatter.config.delimiter_slash, style=formatter.config.style_option_help)
+    comma = Text(formatter.config.delimiter_comma, style=styles.style_option_help)
+    slash = Text(formatter.config.delimiter_slash, style=styles.style_option_help)
 
     for o in opt_short_primary:
-        oh = Text(o.strip(), style=formatter.config.style_switch)
+        oh = Text(o.strip(), style=styles.style_switch)
         primary_cols.append(oh)
         primary_cols.append(comma)
         short_cols.append(oh)
         short_cols.append(comma)
 
     for o in opt_long_primary:
-        oh = Text(o.strip(), style=formatter.config.style_option)
+        oh = Text(o.strip(), style=styles.style_option)
         primary_cols.append(oh)
         primary_cols.append(comma)
         long_cols.append(oh)
@@ -494,9 +571,7 @@ def _get_parameter_help_opt(
             oh = Text(
                 o.strip(),
                 style=(
-                    formatter.config.style_switch_negative
-                    if formatter.config.style_switch_negative is not None
-                    else formatter.config.style_switch
+                    styles.style_switch_negative if styles.style_switch_negative is not None else styles.style_switch
                 ),
             )
             secondary_cols.append(oh)
@@ -511,9 +586,7 @@ def _get_parameter_help_opt(
             oh = Text(
                 o.strip(),
                 style=(
-                    formatter.config.style_option_negative
-                    if formatter.config.style_option_negative is not None
-                    else formatter.config.style_option
+                    styles.style_option_negative if styles.style_option_negative is not None else styles.style_option
                 ),
             )
             secondary_cols.append(oh)
@@ -544,10 +617,9 @@ def _get_parameter_help_opt(
     return primary_final, secondary_final, long_final, short_final, all_final
 
 
-def _get_parameter_default(
-    param: click.Argument | click.Option | RichParameter, ctx: RichContext, formatter: RichHelpFormatter
-) -> Text | None:
-
+def _get_parameter_default_string(
+    param: click.Argument | click.Option | RichParameter, ctx: click.Context
+) -> str | None:
     if not hasattr(param, "show_default"):
         return None
 
@@ -613,10 +685,20 @@ def _get_parameter_default(
         else:
             default_string = str(default_value)
 
+    return default_string
+
+
+def _get_parameter_default(
+    param: click.Argument | click.Option | RichParameter, ctx: RichContext, formatter: RichHelpFormatter
+) -> Text | None:
+    found, default_string = get_param_default_string(param, ctx)
+    if not found:
+        default_string = _get_parameter_default_string(param, ctx)
+
     if default_string:
         return Text.from_markup(
             formatter.config.default_string.format(default_string.replace("[", r"\[")),
-            style=formatter.config.style_option_default,
+            style=formatter.config.compiled_styles.style_option_default,
         )
     return None
 
@@ -625,7 +707,9 @@ def _get_parameter_required(
     param: click.Argument | click.Option | RichParameter, ctx: RichContext, formatter: RichHelpFormatter
 ) -> Text | None:
     if param.required:
-        return Text.from_markup(formatter.config.required_long_string, style=formatter.config.style_required_long)
+        return Text.from_markup(
+            formatter.config.required_long_string, style=formatter.config.compiled_styles.style_required_long
+        )
     return None
 
 
@@ -633,7 +717,7 @@ def _get_parameter_help_required_short(
     param: click.Argument | click.Option | RichParameter, ctx: RichContext, formatter: RichHelpFormatter
 ) -> Text | None:
     if param.required:
-        return Text(formatter.config.required_short_string, style=formatter.config.style_required_short)
+        return Text(formatter.config.required_short_string, style=formatter.config.compiled_styles.style_required_short)
     return None
 
 
@@ -687,7 +771,7 @@ def get_help_parameter(
         # But in 1.x all other solutions would be too breaking.
         return Columns(
             [
-                Text(" ", overflow="fold", style=formatter.config.style_option_help).join(
+                Text(" ", overflow="fold", style=formatter.config.compiled_styles.style_option_help).join(
                     [i for i in sections if i]  # type: ignore[misc]
                 )
             ]
@@ -701,6 +785,7 @@ def get_parameter_rich_table_row(
     panel: RichOptionPanel | None,
 ) -> RichPanelRow:
     """Create a row for the rich table corresponding with this parameter."""
+    styles = formatter.config.compiled_styles
     # Short and long form
     column_types: list[OptionColumnType]
     if panel is None:
@@ -719,45 +804,45 @@ def get_parameter_rich_table_row(
             pass
 
         if isinstance(param, Argument):
-            opt_long_strs.append(Text.from_markup(opt_str.upper(), style=formatter.config.style_option))
+            opt_long_strs.append(Text.from_markup(opt_str.upper(), style=styles.style_option))
         elif "--" in opt:
             if secondary:
                 opt_long_strs.append(
-                    Text("/", style=formatter.config.style_option_help).join(
+                    Text("/", style=styles.style_option_help).join(
                         [
-                            Text(opt_str, style=formatter.config.style_option),
+                            Text(opt_str, style=styles.style_option),
                             Text(
                                 secondary,
                                 style=(
-                                    formatter.config.style_option_negative
-                                    if formatter.config.style_option_negative is not None
-                                    else formatter.config.style_option
+                                    styles.style_option_negative
+                                    if styles.style_option_negative is not None
+                                    else styles.style_option
                                 ),
                             ),
                         ]
                     )
                 )
             else:
-                opt_long_strs.append(Text.from_markup(opt_str, style=formatter.config.style_option))
+                opt_long_strs.append(Text.from_markup(opt_str, style=styles.style_option))
         else:
             if secondary:
                 opt_short_strs.append(
-                    Text("/", style=formatter.config.style_option_help).join(
+                    Text("/", style=styles.style_option_help).join(
                         [
-                            Text(opt_str, style=formatter.config.style_option),
+                            Text(opt_str, style=styles.style_option),
                             Text(
                                 secondary,
                                 style=(
-                                    formatter.config.style_option_negative
-                                    if formatter.config.style_option_negative is not None
-                                    else formatter.config.style_option
+                                    styles.style_option_negative
+                                    if styles.style_option_negative is not None
+                                    else styles.style_option
                                 ),
                             ),
                         ]
                     )
                 )
             else:
-                opt_short_strs.append(Text.from_markup(opt_str, style=formatter.config.style_option))
+                opt_short_strs.append(Text.from_markup(opt_str, style=styles.style_option))
 
     if TYPE_CHECKING:  # pragma: no cover
         assert isinstance(param.name, str)
@@ -774,14 +859,14 @@ def get_parameter_rich_table_row(
             return _all
         if _all is None:
             return _metavar_padded
-        return Text(" ", style=formatter.config.style_option_help).join([_all, _metavar_padded])
+        return Text(" ", style=styles.style_option_help).join([_all, _metavar_padded])
 
     def _opt_long_metavar() -> RenderableType | None:
         if _metavar_padded is None:
             return _long
         if _long is None:
             return _metavar_padded
-        return Text(" ", style=formatter.config.style_option_help).join([_long, _metavar_padded])
+        return Text(" ", style=styles.style_option_help).join([_long, _metavar_padded])
 
     column_callbacks: dict[OptionColumnType, Callable[..., Any]] = {
         "required": _get_parameter_help_required_short,
@@ -831,7 +916,7 @@ def _get_command_name_help(
                     break
     if command_name is None:
         command_name = command.name or ""
-    return Text(command_name, style=formatter.config.style_command)
+    return Text(command_name, style=formatter.config.compiled_styles.style_command)
 
 
 def _get_command_aliases_help(
@@ -840,13 +925,14 @@ def _get_command_aliases_help(
     formatter: RichHelpFormatter,
     include_name: bool = False,
 ) -> Text | None:
+    styles = formatter.config.compiled_styles
     aliases = getattr(command, "aliases", None)
     if aliases:
         txt_list = []
-        comma = Text(formatter.config.delimiter_comma, style=formatter.config.style_command_help)
+        comma = Text(formatter.config.delimiter_comma, style=styles.style_command_help)
         _last = len(aliases) - 1
         for idx, alias in enumerate(aliases):
-            txt_list.append(Text(alias, style=formatter.config.style_command_aliases))
+            txt_list.append(Text(alias, style=styles.style_command_aliases))
             if idx != _last:
                 txt_list.append(comma)
         if include_name:
@@ -921,7 +1007,7 @@ def _get_command_help(
         paragraphs[0] = paragraphs[0].replace("\b\n", "")
     help_text = paragraphs[0].strip()
     renderable: Text | Markdown | Columns
-    renderable = formatter.rich_text(help_text, formatter.config.style_command_help)
+    renderable = formatter.rich_text(help_text, formatter.config.compiled_styles.style_command_help)
     if deprecated:
         dep_txt = _get_deprecated_text(
             deprecated=deprecated,
@@ -937,6 +1023,7 @@ def _get_command_help(
 
 def get_rich_usage(formatter: RichHelpFormatter, prog: str, args: str = "", prefix: str | None = None) -> None:
     """Richly render usage text."""
+    styles = formatter.config.compiled_styles
     if prefix is None:
         prefix = "Usage:"
 
@@ -946,9 +1033,9 @@ def get_rich_usage(formatter: RichHelpFormatter, prog: str, args: str = "", pref
     if config.header_text:
         formatter.write(
             Padding(
-                formatter.rich_text(config.header_text, config.style_header_text),
+                formatter.rich_text(config.header_text, styles.style_header_text),
                 config.padding_header_text,
-                style=formatter.config.style_padding_usage,
+                style=styles.style_padding_usage,
             ),
         )
 
@@ -965,13 +1052,13 @@ def get_rich_usage(formatter: RichHelpFormatter, prog: str, args: str = "", pref
         Padding(
             Columns(
                 (
-                    Text(prefix, style=config.style_usage),
-                    Text(prog, style=config.style_usage_command),
-                    usage_highlighter(Text(args, style=config.style_usage_separator)),
+                    Text(prefix, style=styles.style_usage),
+                    Text(prog, style=styles.style_usage_command),
+                    usage_highlighter(Text(args, style=styles.style_usage_separator)),
                 )
             ),
             formatter.config.padding_usage,
-            style=formatter.config.style_padding_usage,
+            style=styles.style_padding_usage,
         ),
     )
 
@@ -985,7 +1072,7 @@ def get_rich_help_text(self: Command, ctx: RichContext, formatter: RichHelpForma
             Padding(
                 Align(_get_help_text(self, formatter), pad=False),
                 formatter.config.padding_helptext,
-                style=formatter.config.style_padding_helptext,
+                style=formatter.config.compiled_styles.style_padding_helptext,
             )
         )
 
@@ -996,6 +1083,7 @@ def get_rich_epilog(
     formatter: RichHelpFormatter,
 ) -> None:
     """Richly render a click Command's epilog if it exists."""
+    styles = formatter.config.compiled_styles
     if self.epilog:
         # Remove single linebreaks, replace double with single
         lines = self.epilog.split("\n\n")
@@ -1003,10 +1091,12 @@ def get_rich_epilog(
             epilog = self.epilog
         else:
             epilog = "\n".join([x.replace("\n", " ").strip() for x in lines])  # type: ignore[assignment]
-            epilog = formatter.rich_text(epilog, formatter.config.style_epilog_text)  # type: ignore[assignment]
+            epilog = formatter.rich_text(epilog, styles.style_epilog_text)  # type: ignore[assignment]
         formatter.write(
             Padding(
-                Align(epilog, pad=False), formatter.config.padding_epilog, style=formatter.config.style_padding_epilog
+                Align(epilog, pad=False),
+                formatter.config.padding_epilog,
+                style=styles.style_padding_epilog,
             )
         )
 
@@ -1014,9 +1104,9 @@ def get_rich_epilog(
     if formatter.config.footer_text:
         formatter.write(
             Padding(
-                formatter.rich_text(formatter.config.footer_text, formatter.config.style_footer_text),
+                formatter.rich_text(formatter.config.footer_text, styles.style_footer_text),
                 formatter.config.padding_footer_text,
-                style=formatter.config.style_padding_epilog,
+                style=styles.style_padding_epilog,
             )
         )
 
@@ -1037,6 +1127,7 @@ def rich_format_error(
         export_console_as: If set, outputs error message as HTML or SVG.
 
     """
+    styles = formatter.config.compiled_styles
     config = formatter.config
     # Print usage
     if getattr(self, "ctx", None) is not None:
@@ -1049,7 +1140,7 @@ def rich_format_error(
                 config.errors_suggestion,
                 config.padding_errors_suggestion,
             ),
-            style=config.style_errors_suggestion,
+            style=styles.style_errors_suggestion,
         )
     elif (
         config.errors_suggestion is None
@@ -1066,19 +1157,19 @@ def rich_format_error(
                         Text(
                             f"'{cmd_path} {help_option}'",
                             style=(
-                                config.style_errors_suggestion_command
-                                if config.style_errors_suggestion_command is not None
-                                else config.style_option
+                                styles.style_errors_suggestion_command
+                                if styles.style_errors_suggestion_command is not None
+                                else styles.style_option
                             ),
                         ),
                         Text("for help"),
                     ),
                 ),
                 config.padding_errors_suggestion,
-                style=config.style_padding_errors,
+                style=styles.style_padding_errors,
             ),
             style=(
-                config.style_errors_suggestion if config.style_errors_suggestion is not None else config.style_helptext
+                styles.style_errors_suggestion if styles.style_errors_suggestion is not None else styles.style_helptext
             ),
         )
 
@@ -1093,13 +1184,13 @@ def rich_format_error(
             Padding(
                 Panel(
                     formatter.highlighter(self.format_message()),
-                    border_style=config.style_errors_panel_border,
+                    border_style=styles.style_errors_panel_border,
                     title=config.errors_panel_title,
                     title_align=config.align_errors_panel,
                     box=get_box(formatter.config.style_errors_panel_box or "ROUNDED"),
                 ),
                 config.padding_errors_panel,
-                style=config.style_padding_errors,
+                style=styles.style_padding_errors,
             )
         )
     if config.errors_epilogue:
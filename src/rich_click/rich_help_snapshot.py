@@ -0,0 +1,350 @@
+"""
+Pre-rendered help snapshots.
+
+A snapshot stores the help text of every command in a command tree, rendered at build time for a set of
+terminal widths and color systems. A CLI that ships a snapshot prints the help text stored for the terminal
+it runs in, without importing Rich, and renders its help text as usual when the snapshot does not match.
+
+The file starts with a line that identifies it, followed by a line with a JSON index, followed by the
+zlib-compressed help text of each command. The index stores the offset of each command's help text in the file,
+so that printing the help text of one command only reads and decompresses that command's.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import warnings
+import zlib
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+import click
+from click.core import Group
+
+from rich_click._cache import _environment, _hash, config_fingerprint, subcommands_fingerprint, terminal_size
+from rich_click.rich_help_manifest import _make_child_context, _manifest_key
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rich_click.rich_context import RichContext
+    from rich_click.rich_help_configuration import RichHelpConfiguration
+
+
+SNAPSHOT_VERSION = 1
+
+_MAGIC = b"rich-click help snapshot\n"
+
+ColorSystem = Literal["standard", "256", "truecolor"] | None
+
+DEFAULT_WIDTHS = (80, 100, 120, 160)
+DEFAULT_COLOR_SYSTEMS: tuple[ColorSystem, ...] = (None, "standard", "256", "truecolor")
+
+# Config options that describe the terminal. A snapshot stores the help text for each terminal instead.
+_TERMINAL_OPTIONS = frozenset({"width", "max_width", "color_system", "force_terminal"})
+
+# Environment variables that would change how every variant is rendered, which are unset while building a snapshot.
+_BUILD_ENV: dict[str, str | None] = {k: None for k in ("NO_COLOR", "TERM", "COLORTERM", "COLUMNS", "TTY_COMPATIBLE")}
+
+_loaded_snapshots: dict[str, _Snapshot | None] = {}
+
+
+class _Snapshot(NamedTuple):
+    commands: Mapping[str, Any]
+    path: str | None
+    data: bytes | None
+    data_start: int
+
+    def read(self, offset: int, length: int) -> bytes:
+        start = self.data_start + offset
+        if self.data is not None:
+            return self.data[start : start + length]
+        assert self.path is not None
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            return f.read(length)
+
+
+def _terminal_variant(ctx: RichContext) -> str | None:
+    """
+    Describe the width and color system that the help text of a context would be rendered with.
+
+    This follows how the formatter's console detects them, without creating a console.
+    Returns None for terminals that snapshots do not cover, e.g. on Windows, or when NO_COLOR is set.
+    """
+    config = ctx.help_config
+    if ctx.console is not None or ctx.export_console_as is not None or config.legacy_windows or sys.platform == "win32":
+        return None
+    import builtins
+
+    if hasattr(builtins, "get_ipython"):
+        # Jupyter
+        return None
+
+    environ = os.environ
+    is_terminal = config.force_terminal
+    if is_terminal is None:
+        tty_compatible = environ.get("TTY_COMPATIBLE", "")
+        if tty_compatible in ("0", "1"):
+            is_terminal = tty_compatible == "1"
+        elif "FORCE_COLOR" in environ:
+            is_terminal = environ["FORCE_COLOR"] != ""
+        else:
+            try:
+                is_terminal = sys.stdout.isatty()
+            except (AttributeError, ValueError):
+                is_terminal = False
+    if is_terminal and environ.get("TERM", "").lower() in ("dumb", "unknown"):
+        return None
+
+    color_system = config.color_system
+    if color_system == "auto":
+        if not is_terminal:
+            color_system = None
+        elif environ.get("COLORTERM", "").strip().lower() in ("truecolor", "24bit"):
+            color_system = "truecolor"
+        else:
+            colors = environ.get("TERM", "").strip().lower().rpartition("-")[2]
+            color_system = "256" if colors in ("kitty", "256color") else "standard"
+    if color_system is not None and environ.get("NO_COLOR", "") != "":
+        return None
+
+    encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+    if not encoding.lower().startswith("utf"):
+        # Rich replaces box characters with ASCII.
+        return None
+
+    width = ctx.terminal_width if ctx.terminal_width is not None else config.width
+    if width is None:
+        columns = environ.get("COLUMNS")
+        if columns is not None and columns.isdigit():
+            width = int(columns)
+        else:
+            width = (terminal_size() or (0, 0))[0] or 80
+    max_width = ctx.max_content_width if ctx.max_content_width is not None else config.max_width
+    if isinstance(max_width, int):
+        width = min(max_width, width)
+    return f"{width}:{color_system}"
+
+
+def _config_fingerprint(config: RichHelpConfiguration) -> str:
+    """Hash the config options that change help text, other than those that describe the terminal."""
+    return _hash(config_fingerprint(config, exclude=_TERMINAL_OPTIONS))
+
+
+def _command_signature(command: click.Command, ctx: click.Context) -> str:
+    """Hash the parts of a command and its context that appear in its help text, without computing any defaults."""
+    params = []
+    for param in command.get_params(ctx):
+        params.append(
+            [
+                param.name,
+                param.opts,
+                param.secondary_opts,
+                param.type.to_info_dict(),
+                param.required,
+                param.nargs,
+                param.envvar,
+                None if callable(param.default) else param.default,
+                getattr(param, "help", None),
+                getattr(param, "hidden", False),
+                getattr(param, "show_default", None),
+                getattr(param, "show_envvar", False),
+                getattr(param, "panel", None),
+            ]
+        )
+
+    data = [
+        ctx.command_path,
+        ctx.show_default,
+        ctx.help_option_names,
+        ctx.auto_envvar_prefix,
+        command.help,
+        command.short_help,
+        command.epilog,
+        command.options_metavar,
+        command.deprecated,
+        list(getattr(command, "aliases", None) or []),
+        [p.to_info_dict(ctx) for p in getattr(command, "panels", [])],
+        params,
+    ]
+    if isinstance(command, Group):
+        # The classes of subcommands are left out, since patching click replaces them.
+        data.extend([subcommands_fingerprint(command, ctx), command.subcommand_metavar, command.chain])
+    return _hash(data)
+
+
+def _has_dynamic_defaults(command: click.Command, ctx: click.Context) -> bool:
+    return any(callable(param.default) for param in command.get_params(ctx))
+
+
+def build_snapshot(
+    command: click.Command,
+    info_name: str | None = None,
+    *,
+    widths: Iterable[int] = DEFAULT_WIDTHS,
+    color_systems: Iterable[ColorSystem] = DEFAULT_COLOR_SYSTEMS,
+) -> bytes:
+    """
+    Render the help text of a command tree for every combination of widths and color systems.
+
+    Every subcommand is imported, so this is intended to run at build time.
+    Commands with callable defaults, or defaults without a stable repr, and commands that are not
+    rich-click commands, are left out.
+    Help text that is the same for several variants of a command is stored once.
+
+    Args:
+    ----
+        command: The root command of the CLI.
+        info_name: The name the root command is invoked as. Defaults to the command's name.
+            Help text is only printed from the snapshot when the command is invoked with this name.
+        widths: Terminal widths to render the help text at.
+        color_systems: Color systems to render the help text with. None renders it without colors.
+
+    """
+    from rich_click import __version__
+    from rich_click.rich_command import RichCommand
+    from rich_click.rich_context import RichContext
+    from rich_click.rich_help_configuration import config_scope
+    from rich_click.rich_help_tree import _walk
+
+    color_systems = list(color_systems)
+    entries: dict[str, dict[str, Any]] = {}
+    texts: dict[str, dict[str, str]] = {}
+
+    with _environment(_BUILD_ENV):
+        for width in widths:
+            for color_system in color_systems:
+                scope = config_scope(
+                    width=width,
+                    max_width=None,
+                    color_system=color_system,
+                    force_terminal=color_system is not None,
+                )
+                with scope:
+                    root = _make_child_context(command, info_name or command.name, None)
+                    for ctx in _walk(root, (), include_hidden=True):
+                        if not isinstance(ctx, RichContext) or not isinstance(ctx.command, RichCommand):
+                            continue
+                        # Render the help text, rather than print it from a snapshot the CLI already uses.
+                        ctx.help_snapshot = None
+                        key = _manifest_key(ctx)
+                        if key not in entries:
+                            if _has_dynamic_defaults(ctx.command, ctx):
+                                continue
+                            try:
+                                entries[key] = {
+                                    "config": _config_fingerprint(ctx.help_config),
+                                    "signature": _command_signature(ctx.command, ctx),
+                                }
+                            except TypeError:
+                                # e.g. a default that cannot be compared across processes.
+                                continue
+                            texts[key] = {}
+                        variant = _terminal_variant(ctx)
+                        if variant is None or variant in texts[key]:
+                            continue
+                        with ctx.scope(cleanup=False):
+                            texts[key][variant] = ctx.get_help()
+
+    chunks = []
+    offset = 0
+    for key, variants in texts.items():
+        data = bytearray()
+        ranges: dict[str, tuple[int, int]] = {}
+        variant_ranges: dict[str, tuple[int, int]] = {}
+        for variant, text in variants.items():
+            if text not in ranges:
+                encoded = text.encode("utf-8")
+                ranges[text] = (len(data), len(data) + len(encoded))
+                data += encoded
+            variant_ranges[variant] = ranges[text]
+        chunk = zlib.compress(bytes(data), 9)
+        entries[key].update(offset=offset, length=len(chunk), variants=variant_ranges)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+    index = {"rich_click_snapshot": SNAPSHOT_VERSION, "rich_click": __version__, "commands": entries}
+    return b"".join([_MAGIC, json.dumps(index, separators=(",", ":")).encode("utf-8"), b"\n", *chunks])
+
+
+def load_snapshot(source: str | os.PathLike[str] | bytes) -> _Snapshot | None:
+    """
+    Load the index of a snapshot from a path, or from the contents of a snapshot file.
+
+    Snapshots read from disk are cached for the lifetime of the process.
+    A snapshot that cannot be read emits a warning and returns None. A snapshot that was built
+    by another version of rich-click silently returns None. In both cases, help text is rendered as usual.
+    """
+    path = None
+    if isinstance(source, bytes):
+        magic = source[: len(_MAGIC)]
+        line, _, _ = source[len(magic) :].partition(b"\n")
+        data: bytes | None = source
+        data_start = len(magic) + len(line) + 1
+    else:
+        path = os.fspath(source)
+        if path in _loaded_snapshots:
+            return _loaded_snapshots[path]
+        try:
+            with open(path, "rb") as f:
+                magic = f.readline()
+                line = f.readline()
+                data_start = f.tell()
+        except OSError as e:
+            warnings.warn(f"Could not load help snapshot {path!r}: {e}", stacklevel=2)
+            _loaded_snapshots[path] = None
+            return None
+        data = None
+
+    snapshot = None
+    try:
+        if magic != _MAGIC:
+            raise ValueError("not a help snapshot")
+        index = json.loads(line)
+    except ValueError as e:
+        warnings.warn(f"Could not load help snapshot {path or '<bytes>'}: {e}", stacklevel=2)
+    else:
+        from rich_click import __version__
+
+        if index.get("rich_click_snapshot") == SNAPSHOT_VERSION and index.get("rich_click") == __version__:
+            snapshot = _Snapshot(index["commands"], path, data, data_start)
+
+    if path is not None:
+        _loaded_snapshots[path] = snapshot
+    return snapshot
+
+
+def get_snapshot_help(command: click.Command, ctx: RichContext) -> str | None:
+    """
+    Return the help text of a command from the context's help snapshot.
+
+    Returns None if the context has no snapshot, or the snapshot has no help text
+    that matches the command, the config and the terminal.
+    """
+    source = ctx.help_snapshot
+    if source is None or ctx.default_map is not None:
+        return None
+    snapshot = load_snapshot(source)
+    if snapshot is None:
+        return None
+    entry = snapshot.commands.get(_manifest_key(ctx))
+    if entry is None:
+        return None
+    variant = _terminal_variant(ctx)
+    if variant is None or variant not in entry["variants"]:
+        return None
+    try:
+        if entry["config"] != _config_fingerprint(ctx.help_config) or entry["signature"] != _command_signature(
+            command, ctx
+        ):
+            return None
+    except TypeError:
+        return None
+    start, end = entry["variants"][variant]
+    try:
+        data = zlib.decompress(snapshot.read(entry["offset"], entry["length"]))
+    except (OSError, zlib.error):
+        return None
+    return data[start:end].decode("utf-8")
@@ -0,0 +1,153 @@
+"""
+Render the help text of every command in a command tree, e.g. to generate documentation.
+
+Contexts are created without parsing any arguments, and child contexts share the help configuration
+of their parent, so the configuration is resolved once, and formatters reuse pooled consoles.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from typing import Literal, NamedTuple
+
+import click
+from click.core import Group
+
+from rich_click.rich_context import RichContext
+from rich_click.rich_help_manifest import _make_child_context
+from rich_click.utils import load_command
+
+
+HelpFormat = Literal["text", "html", "svg"] | None
+
+# Number of commands that a worker process renders per task.
+_PROCESS_CHUNK_SIZE = 32
+
+
+class RenderedHelp(NamedTuple):
+    """The help text of a command, rendered in one format."""
+
+    path: tuple[str, ...]
+    """Names of the subcommands between the root command and this command."""
+    command_path: str
+    """The command path as shown in the help text, e.g. `cli sub`."""
+    format: HelpFormat
+    """How the help text was exported, the same as `export_console_as`. None is the help text as printed."""
+    output: str
+
+
+def _walk(ctx: click.Context, path: tuple[str, ...], include_hidden: bool) -> Iterator[click.Context]:
+    # Resolve the config while walking, so the contexts can be rendered from other threads.
+    if isinstance(ctx, RichContext):
+        ctx.help_config  # noqa: B018
+    yield ctx
+    command = ctx.command
+    if not isinstance(command, Group):
+        return
+    for name in command.list_commands(ctx):
+        sub = command.get_command(ctx, name)
+        if sub is None or (sub.hidden and not include_hidden):
+            continue
+        sub_ctx = _make_child_context(sub, name, ctx)
+        sub_ctx._rich_tree_path = (*path, name)  # type: ignore[attr-defined]
+        yield from _walk(sub_ctx, (*path, name), include_hidden)
+
+
+def _context_path(ctx: click.Context) -> tuple[str, ...]:
+    path: tuple[str, ...] = getattr(ctx, "_rich_tree_path", ())
+    return path
+
+
+def _render(ctx: click.Context, formats: Sequence[HelpFormat]) -> list[RenderedHelp]:
+    results = []
+    with ctx.scope(cleanup=False):
+        for fmt in formats:
+            if isinstance(ctx, RichContext):
+                ctx.export_console_as = fmt
+            results.append(RenderedHelp(_context_path(ctx), ctx.command_path, fmt, ctx.get_help()))
+    return results
+
+
+@lru_cache(maxsize=8)
+def _root_context(import_path: str, info_name: str | None) -> click.Context:
+    command = load_command(import_path)
+    return _make_child_context(command, info_name or command.name, None)
+
+
+def _render_paths(
+    import_path: str, info_name: str | None, paths: list[tuple[str, ...]], formats: Sequence[HelpFormat]
+) -> list[RenderedHelp]:
+    """Render the help text of commands in a worker process, which imports the command tree once."""
+    results = []
+    for path in paths:
+        ctx = _root_context(import_path, info_name)
+        for name in path:
+            command = ctx.command.get_command(ctx, name)  # type: ignore[attr-defined]
+            ctx = _make_child_context(command, name, ctx)
+        ctx._rich_tree_path = path  # type: ignore[attr-defined]
+        results.extend(_render(ctx, formats))
+    return results
+
+
+def render_tree(
+    command: click.Command | str,
+    *,
+    info_name: str | None = None,
+    formats: Iterable[HelpFormat] = ("text",),
+    workers: int | None = None,
+    processes: bool = False,
+    include_hidden: bool = False,
+) -> Iterator[RenderedHelp]:
+    """
+    Render the help text of a command and all of its subcommands.
+
+    Subcommands are found with `list_commands()` and `get_command()`, so lazy subcommands are imported.
+    Without workers, results are yielded in the order the tree is walked, depth first.
+    With workers, they are yielded as they finish.
+
+    Args:
+    ----
+        command: The root command, or its import path in the form `module:attribute`.
+        info_name: The name the root command is invoked as. Defaults to the command's name.
+        formats: Formats to render each help text in, as for `export_console_as`.
+            None renders the help text as it is printed.
+        workers: Number of threads, or of processes if `processes` is set, that render concurrently.
+        processes: Render in worker processes. Each worker imports the command tree itself,
+            so the command must be passed as an import path.
+        include_hidden: Also render hidden commands.
+
+    """
+    formats = list(formats)
+    import_path = None
+    if isinstance(command, str):
+        import_path = command
+        command = load_command(import_path)
+
+    root = _make_child_context(command, info_name or command.name, None)
+    contexts = _walk(root, (), include_hidden)
+
+    if processes:
+        if import_path is None:
+            raise TypeError("render_tree() needs the import path of the command to render in worker processes.")
+
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        paths = [_context_path(ctx) for ctx in contexts]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_render_paths, import_path, info_name, paths[i : i + _PROCESS_CHUNK_SIZE], formats)
+                for i in range(0, len(paths), _PROCESS_CHUNK_SIZE)
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
+    elif workers:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_render, ctx, formats) for ctx in contexts]
+            for future in as_completed(futures):
+                yield from future.result()
+    else:
+        for ctx in contexts:
+            yield from _render(ctx, formats)
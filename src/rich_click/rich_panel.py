@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Generator
-from fnmatch import fnmatch
+import os
+import re
+from collections.abc import Callable, Generator
+from fnmatch import translate
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -9,6 +12,7 @@ from typing import (
     Generic,
     TypeVar,
 )
+from weakref import WeakKeyDictionary
 
 from click import Context, Parameter
 
@@ -174,20 +178,17 @@ class RichOptionPanel(RichPanel[Parameter, OptionColumnType]):
     def list_all_objects(cls, ctx: Context) -> list[tuple[str, Parameter]]:
         return [
             (i.opts[0] if getattr(i, "flag_value", None) and i.opts else i.name or "", i)
-            for i in ctx.command.get_params(ctx)
+            for i in _get_param_index(ctx.command, ctx).params
         ]
 
     def get_objects(self, command: Command, ctx: Context) -> Generator[Parameter, None, None]:
         """List the objects assigned to the panel."""
+        by_name = _get_param_index(command, ctx).by_name
         for opt in self.options:
-            # Get the param
-            for param in command.get_params(ctx):
-                if any([opt in [*param.opts, param.name]]):
-                    break
+            param = by_name.get(opt)
             # Skip if option is not listed in this group
-            else:
-                continue
-            yield param
+            if param is not None:
+                yield param
 
     def get_table(
         self,
@@ -309,9 +310,10 @@ class RichCommandPanel(RichPanel[Command, CommandColumnType]):
     def list_all_objects(cls, ctx: Context) -> list[tuple[str, Command]]:
         if not isinstance(ctx.command, Group):
             return []
+        get_command = _help_command_getter(ctx.command)
         commands = []
         for cmd_name in ctx.command.list_commands(ctx):
-            cmd = ctx.command.get_command(ctx, cmd_name)
+            cmd = get_command(ctx, cmd_name)
             if cmd is not None:
                 commands.append((cmd_name, cmd))
         return commands
@@ -321,12 +323,13 @@ class RichCommandPanel(RichPanel[Command, CommandColumnType]):
         if not isinstance(command, Group):
             return
 
+        get_command = _help_command_getter(command)
         commands_list = command.list_commands(ctx)
         callback_names = {c.callback.__name__: c for c in command.commands.values() if c.callback is not None}
 
         for cmd_name in self.commands:
             if cmd_name in commands_list:
-                yield command.get_command(ctx, cmd_name)  # type: ignore[misc]
+                yield get_command(ctx, cmd_name)  # type: ignore[misc]
             elif cmd_name in callback_names:
                 yield callback_names[cmd_name]
             else:
@@ -456,6 +459,93 @@ class RichCommandPanel(RichPanel[Command, CommandColumnType]):
         return panel
 
 
+class _ParamIndex:
+    """The params of a command, and a mapping of each of their names and opts to the param."""
+
+    def __init__(self, command: Command, ctx: Context) -> None:
+        self.command_params = list(command.params)
+        self.params = command.get_params(ctx)
+        self.by_name: dict[str, Parameter] = {}
+        for param in self.params:
+            for name in [*param.opts, param.name]:
+                if name is not None:
+                    # The first param with a name wins, same as a linear search would.
+                    self.by_name.setdefault(name, param)
+
+
+_param_indexes: WeakKeyDictionary[Context, dict[Command, _ParamIndex]] = WeakKeyDictionary()
+
+
+def _get_param_index(command: Command, ctx: Context) -> _ParamIndex:
+    """
+    Return the param index of a command.
+
+    The index is built once per command and context, and shared by every panel
+    that is rendered for the context. It is rebuilt if the command's params change.
+    """
+    indexes = _param_indexes.setdefault(ctx, {})
+    index = indexes.get(command)
+    if index is None or index.command_params != command.params:
+        index = indexes[command] = _ParamIndex(command, ctx)
+    return index
+
+
+def _help_command_getter(command: Group) -> Callable[[Context, str], Command | None]:
+    """
+    Return the method used to look up subcommands for help text.
+
+    This avoids importing lazy commands, and uses the help manifest for subcommands that are not loaded yet.
+    """
+    from rich_click.rich_command import RichGroup
+    from rich_click.rich_help_manifest import get_placeholder_command
+
+    get_command = command._get_help_command if isinstance(command, RichGroup) else command.get_command
+
+    def _get_command(ctx: Context, cmd_name: str) -> Command | None:
+        if cmd_name not in command.commands:
+            cmd = get_placeholder_command(ctx, cmd_name)
+            if cmd is not None:
+                return cmd
+        return get_command(ctx, cmd_name)
+
+    return _get_command
+
+
+class _GroupKeys:
+    """The keys of a groups config, split up so they can be matched without calling fnmatch() for each one."""
+
+    def __init__(self, keys: tuple[str, ...]) -> None:
+        self.literals: dict[str, list[str]] = {}
+        self.prefixes: list[tuple[str, str]] = []
+        self.patterns: list[tuple[str, re.Pattern[str]]] = []
+        for key in keys:
+            normalized = os.path.normcase(key)
+            is_prefix = normalized.endswith("*")
+            head = normalized[:-1] if is_prefix else normalized
+            if any(c in head for c in "*?["):
+                self.patterns.append((key, re.compile(translate(normalized))))
+            elif is_prefix:
+                # The most common wildcard, e.g. "my-cli *", is a plain prefix.
+                self.prefixes.append((key, head))
+            else:
+                self.literals.setdefault(normalized, []).append(key)
+
+    def match(self, paths: list[str]) -> set[str]:
+        """Return the keys that match any of the paths, the same way fnmatch() would."""
+        matches: set[str] = set()
+        for path in map(os.path.normcase, paths):
+            matches.update(self.literals.get(path, ()))
+            matches.update(key for key, prefix in self.prefixes if path.startswith(prefix))
+            matches.update(key for key, pattern in self.patterns if pattern.match(path))
+        return matches
+
+
+@lru_cache(maxsize=32)
+def _compile_group_keys(keys: tuple[str, ...]) -> _GroupKeys:
+    """Compile the keys of a groups config once, instead of for every help text."""
+    return _GroupKeys(keys)
+
+
 # Using config to define panels is silently deprecated.
 # We do not intend on removing this for a very long time, possibly ever.
 
@@ -486,36 +576,75 @@ def _resolve_panels_from_config(
         extra = ctx.command_path.replace("python -m ", "", 1)
         paths.append(extra)
     final_groups_list: list[GroupType] = []
+    seen: set[str] = set()
 
     # Step 2: Match currently executing command to keys
     # Assign wildcards, but make sure we do not overwrite anything already defined.
-    for mtch in reversed(sorted([_ for _ in groups if any(fnmatch(_path, _) for _path in paths)])):
+    for mtch in reversed(sorted(_compile_group_keys(tuple(groups)).match(paths))):  # type: ignore[arg-type]
         wildcard_option_groups = groups[mtch]
         for grp in wildcard_option_groups:
             grp = grp.copy()
             opts: list[str] = grp.get(panel_cls._object_attr, [])  # type: ignore[assignment]
-            traversed = []
-            for opt in grp.get(panel_cls._object_attr, []):  # type: ignore[attr-defined]
-                if grp.get("deduplicate", True) and opt in [
-                    _opt
-                    for _grp in final_groups_list
-                    for _opt in _grp.get(panel_cls._object_attr, [])  # type: ignore[attr-defined]
-                ]:
-                    opts.remove(opt)
-                traversed.append(opt)
+            if grp.pop("deduplicate", True):
+                opts = [opt for opt in opts if opt not in seen]
+            else:
+                opts = list(opts)
+            seen.update(opts)
             grp[panel_cls._object_attr] = opts  # type: ignore[literal-required]
-            grp.pop("deduplicate", None)
             final_groups_list.append(grp)
 
     return [panel_cls(**grp) for grp in final_groups_list]  # type: ignore[misc,arg-type]
 
 
+def _panel_layout_key(
+    command: RichCommand, ctx: RichContext, formatter: RichHelpFormatter, panels: list[RichPanel[Any, Any]]
+) -> tuple[Any, ...]:
+    """
+    Describe everything that the panel layout of a command depends on.
+
+    The config is compared by identity, and by its compiled styles, which are replaced when any of its fields are set.
+    """
+    config = ctx.help_config
+    key: tuple[Any, ...] = (
+        type(formatter),
+        id(config),
+        config.compiled_styles,
+        ctx.command_path,
+        tuple(ctx.help_option_names),
+        tuple(command.params),
+        # Panels can be edited in place, e.g. `panel.options.append(...)`.
+        tuple((panel, panel.name, tuple(panel.objects)) for panel in panels),
+    )
+    if isinstance(command, Group):
+        key += (tuple(command.commands.items()), tuple(command.list_commands(ctx)))
+    return key
+
+
 def construct_panels(
     command: RichCommand,
     ctx: RichContext,
     formatter: RichHelpFormatter,
 ) -> list[RichPanel[Any, Any]]:
-    """Construct panels from the command as well as from the old groups config."""
+    """
+    Construct panels from the command as well as from the old groups config.
+
+    The layout is memoized on the command, and rebuilt when its params, commands, panels or config change.
+    """
+    defined = [*command.panels, *command._implied_panels(ctx, formatter)]
+    key = _panel_layout_key(command, ctx, formatter, defined)
+    if command._panel_layout is not None and command._panel_layout[0] == key:
+        return list(command._panel_layout[1])
+    panels = _construct_panels(command, ctx, formatter, defined)
+    command._panel_layout = (key, panels)
+    return list(panels)
+
+
+def _construct_panels(
+    command: RichCommand,
+    ctx: RichContext,
+    formatter: RichHelpFormatter,
+    defined: list[RichPanel[Any, Any]],
+) -> list[RichPanel[Any, Any]]:
     _show_arguments = formatter.config.show_arguments
 
     # If only an options or a commands panel is defined,
@@ -529,7 +658,7 @@ def construct_panels(
     # Start with list of panels already defined.
     defined_panels: dict[tuple[str, str], RichPanel[Any, Any]] = {}
 
-    for p in command.panels:
+    for p in defined:
         defined_panels[(p._object_attr, p.name)] = p
         if p._object_attr == "options":
             defined_options = True
@@ -10,6 +10,7 @@ else:
     from typing import NotRequired
 
 if TYPE_CHECKING:
+    import click
     from rich.style import StyleType
 
     from rich_click.rich_help_configuration import CommandColumnType, OptionColumnType
@@ -33,6 +34,39 @@ def truthy(o: Any) -> bool | None:
         return bool(o)
 
 
+def load_object(import_path: str) -> Any:
+    """
+    Import the object at an import path of the form 'module:attribute', where the attribute can be dotted.
+
+    Raises ValueError if the import path is not of that form, and AttributeError if the attribute does not exist.
+    Errors raised while importing the module are not changed.
+    """
+    module_name, _, attr = import_path.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Import path {import_path!r} must be of the form 'module:attribute'.")
+
+    from importlib import import_module
+
+    obj = import_module(module_name)
+    for part in attr.split("."):
+        try:
+            obj = getattr(obj, part)
+        except AttributeError:
+            raise AttributeError(f"Module '{module_name}' has no attribute '{attr}'.") from None
+    return obj
+
+
+def load_command(import_path: str) -> click.Command:
+    """Import the click command at an import path, the same as load_object(). Raises TypeError for other objects."""
+    # The original class, which patching click replaces.
+    from rich_click._click_types_cache import Command
+
+    obj = load_object(import_path)
+    if not isinstance(obj, Command):
+        raise TypeError(f"{import_path!r} resolved to {obj!r}, which is not a click command.")
+    return obj
+
+
 def method_is_from_subclass_of(cls: type[object], base_cls: type[object], method_name: str) -> bool:
     """
     Check to see whether a class's method comes from a subclass of some base class.
@@ -76,3 +110,15 @@ class OptionGroupDict(TypedDict):
     title_style: NotRequired[StyleType | None]
 
     deduplicate: NotRequired[bool]
+
+
+class LazyCommandDict(TypedDict):
+    """Specification for lazily loaded commands."""
+
+    import_path: str
+    short_help: NotRequired[str | None]
+    help: NotRequired[str | None]
+    aliases: NotRequired[list[str]]
+    panel: NotRequired[str | list[str] | None]
+    hidden: NotRequired[bool]
+    deprecated: NotRequired[bool | str]
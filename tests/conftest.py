@@ -17,7 +17,7 @@ from typer.testing import CliRunner as TyperCliRunner
 import rich_click.rich_click as rc
 from rich_click._compat_click import CLICK_IS_BEFORE_VERSION_82
 from rich_click._compat_typer import TYPER_IS_BEFORE_VERSION_026
-from rich_click.rich_command import RichCommand
+from rich_click.rich_command import RichCommand, RichGroup
 from rich_click.rich_context import RichContext
 
 
@@ -72,9 +72,11 @@ def replace_link_ids(render: str) -> str:
 
 
 @pytest.fixture(autouse=True)
-def default_config(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+def default_config(monkeypatch, tmp_path) -> None:  # type: ignore[no-untyped-def]
     # Isolate rich_click global config module for each test:
     monkeypatch.delenv("RICH_CLICK_THEME", raising=False)
+    # Keep on-disk caches, e.g. the console scripts index, out of the user's cache directory:
+    monkeypatch.setenv("RICH_CLICK_CACHE_DIR", (tmp_path / "rich-click-cache").as_posix())
     reload(rc)
 
     # Default config settings
@@ -98,6 +100,13 @@ def load_command_from_module(namespace: str, command_attr: str = "cli") -> RichC
     return cast(RichCommand, getattr(module, command_attr))
 
 
+def make_release_cli(**context_settings: Any) -> RichGroup:
+    """Load a fresh copy of the CLI in `tests/fixtures/release_cli.py`, with the given context settings."""
+    cli = cast(RichGroup, load_command_from_module("tests.fixtures.release_cli"))
+    cli.context_settings.update(context_settings)
+    return cli
+
+
 class InvokeCli(Protocol):
     def __call__(self, cmd: click.Command, *args: Any, **kwargs: Any) -> Result:
         """
@@ -0,0 +1,30 @@
+import rich_click as click
+
+
+@click.group(epilog="For more, see the docs.")
+@click.option("--level", type=click.Choice(["debug", "info"]), default="info", show_default=True)
+@click.option("--verbose", is_flag=True, help="Be [b]loud[/b].")
+def cli(level: str, verbose: bool) -> None:
+    """My [b]CLI[/b] help text."""
+
+
+@cli.command(aliases=["d"], panel="Release")
+@click.argument("target")
+@click.option("--retries", type=click.IntRange(0, 5), default=3, show_default=True, help="Retries.")
+@click.option("--force/--no-force", default=False, show_default=True)
+def deploy(target: str, retries: int, force: bool) -> None:
+    """Deploy the project."""
+
+
+@cli.command()
+@click.option("--count", type=int, default=3, show_default=True, help="Number of times.")
+@click.pass_context
+def sub(ctx: click.RichContext, count: int) -> None:
+    """A subcommand."""
+    click.echo(f"count={count}", file=ctx.stdout)
+
+
+@cli.command()
+def abort() -> None:
+    """Always aborts."""
+    raise click.Abort()
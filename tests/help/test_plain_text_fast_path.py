@@ -0,0 +1,41 @@
+import pkgutil
+import re
+import warnings
+
+import click
+import pytest
+from click.testing import CliRunner
+
+import rich_click.rich_click as rc
+import rich_click.rich_help_formatter
+import tests.help.fixtures
+from tests.conftest import load_command_from_module
+
+
+FIXTURES = [m.name for m in pkgutil.iter_modules(tests.help.fixtures.__path__)]
+
+
+def _render_all(name: str, cli_runner: CliRunner) -> list[str]:
+    """Render the help text of a fixture's command and of all its subcommands."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        cli = load_command_from_module(f"tests.help.fixtures.{name}")
+        paths: list[list[str]] = [[]]
+        if isinstance(cli, click.Group):
+            paths.extend([[cmd] for cmd in cli.commands])
+        # Hyperlink ids are random, so they are removed before comparing.
+        return [re.sub(r"id=\d+;", "", cli_runner.invoke(cli, [*path, "--help"]).output) for path in paths]
+
+
+@pytest.mark.parametrize("text_markup", ["ansi", "rich", None])
+@pytest.mark.parametrize("name", FIXTURES)
+def test_plain_text_fast_path_matches_full_rendering(
+    cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch, name: str, text_markup: str | None
+) -> None:
+    rc.COLOR_SYSTEM = "truecolor"
+    rc.TEXT_MARKUP = text_markup  # type: ignore[assignment]
+    fast = _render_all(name, cli_runner)
+
+    # Claim that every string needs every transformation, which disables the fast path.
+    monkeypatch.setattr(rich_click.rich_help_formatter, "_classify_text", lambda text: -1)
+    assert _render_all(name, cli_runner) == fast
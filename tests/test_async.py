@@ -0,0 +1,75 @@
+import asyncio
+import threading
+
+import click
+import pytest
+
+from rich_click.rich_command import RichGroup
+from rich_click.rich_context import RichContext
+from rich_click.rich_help_formatter import RichHelpFormatter
+from tests.conftest import make_release_cli
+
+
+def _make_context(cli: RichGroup) -> RichContext:
+    ctx = cli.make_context("cli", [], resilient_parsing=True)
+    assert isinstance(ctx, RichContext)
+    return ctx
+
+
+def test_aget_help_matches_get_help() -> None:
+    ctx = _make_context(make_release_cli())
+    assert asyncio.run(ctx.aget_help()) == ctx.get_help()
+
+
+def test_arender_error_matches_write_error() -> None:
+    ctx = _make_context(make_release_cli())
+    error = click.UsageError("Something went wrong.", ctx=ctx)
+
+    formatter = ctx.make_formatter(error_mode=True)
+    formatter.write_error(error)
+    assert asyncio.run(ctx.make_formatter(error_mode=True).arender_error(error)) == formatter.getvalue()
+
+
+def test_aget_help_coalesces_concurrent_renders(monkeypatch: pytest.MonkeyPatch) -> None:
+    cli = make_release_cli()
+    renders = []
+    release = threading.Event()
+    format_help = RichGroup.format_help
+
+    def blocking_format_help(self: RichGroup, ctx: RichContext, formatter: RichHelpFormatter) -> None:
+        renders.append(ctx)
+        release.wait(5)
+        format_help(self, ctx, formatter)
+
+    monkeypatch.setattr(RichGroup, "format_help", blocking_format_help)
+
+    async def main() -> list[str]:
+        contexts = [_make_context(cli) for _ in range(5)]
+        tasks = [asyncio.create_task(ctx.aget_help()) for ctx in contexts]
+        cancelled = asyncio.create_task(contexts[0].aget_help())
+        await asyncio.sleep(0.05)
+
+        # Cancelling one caller does not cancel the render the others are waiting for.
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(main())
+    assert len(renders) == 1
+    assert len(set(results)) == 1
+    assert "Deploy the project." in results[0]
+
+    # A different width is a different render.
+    async def different_widths() -> list[str]:
+        ctx = _make_context(cli)
+        narrow = _make_context(cli)
+        narrow.terminal_width = 50
+        return await asyncio.gather(ctx.aget_help(), narrow.aget_help())
+
+    renders.clear()
+    wide, narrow = asyncio.run(different_widths())
+    assert len(renders) == 2
+    assert wide != narrow
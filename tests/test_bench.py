@@ -0,0 +1,45 @@
+from rich_click.bench import _case_metrics, compare, run_cases
+
+
+def test_bench_compare() -> None:
+    baseline = {"import": {"wall_ms": 100.0, "import_ms": 50.0}, "help_small": {"wall_ms": 10.0}}
+    results = {
+        "import": {"wall_ms": 130.0, "import_ms": 52.0},
+        # Over the relative threshold, but within the absolute noise allowance.
+        "help_small": {"wall_ms": 14.0},
+        # Not in the baseline.
+        "help_huge": {"wall_ms": 1000.0},
+    }
+    assert compare(results, baseline, max_regression=0.2, min_delta_ms=5) == [
+        "import wall_ms: 130.0ms vs. 100.0ms baseline (+30%)"
+    ]
+    assert compare(results, baseline, max_regression=0.5, min_delta_ms=5) == []
+
+
+def test_bench_compare_zero_baseline() -> None:
+    baseline = {"import": {"wall_ms": 0.0, "import_ms": 0.0}}
+    results = {"import": {"wall_ms": 100.0, "import_ms": 50.0}}
+    assert compare(results, baseline) == []
+
+
+def test_bench_compare_render_slowdown() -> None:
+    baseline = {"typer_help_1000": {"wall_ms": 500.0, "first_render_ms": 2.0, "last_render_ms": 2.0}}
+    # Each render is well within the absolute noise allowance, but the last renders are twice as slow as the first.
+    results = {"typer_help_1000": {"wall_ms": 500.0, "first_render_ms": 2.0, "last_render_ms": 4.0}}
+    assert compare(results, baseline, max_regression=0.2, min_delta_ms=5) == [
+        "typer_help_1000 last/first render: 2.00x vs. 1.00x baseline"
+    ]
+    # Renders that are slower overall, but do not slow down as they repeat.
+    results = {"typer_help_1000": {"wall_ms": 500.0, "first_render_ms": 3.0, "last_render_ms": 3.0}}
+    assert compare(results, baseline, max_regression=0.2, min_delta_ms=5) == []
+
+
+def test_bench_run_cases() -> None:
+    results = run_cases(["import"], repeat=1)
+    assert results["import"]["wall_ms"] > 0
+    assert results["import"]["import_ms"] > 0
+
+
+def test_bench_case_metrics() -> None:
+    stderr = "some output\nbench-metric first_render_ms 1.5\nbench-metric last_render_ms 2\n"
+    assert _case_metrics(stderr) == {"first_render_ms": 1.5, "last_render_ms": 2.0}
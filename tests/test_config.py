@@ -11,7 +11,17 @@ from inline_snapshot import snapshot
 from rich.console import Console
 
 import rich_click.rich_click as rc
-from rich_click import RichContext, RichHelpConfiguration, command, group, rich_config
+from rich_click import (
+    RichContext,
+    RichHelpConfiguration,
+    command,
+    config_scope,
+    group,
+    option,
+    option_panel,
+    rich_config,
+)
+from rich_click.rich_click_theme import get_theme
 
 
 if sys.version_info < (3, 11):
@@ -120,6 +130,45 @@ def test_config_from_globals_behavior() -> None:
         assert ctx.help_config.style_option == "new-value"
 
 
+def test_config_is_shared_between_contexts(cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+    @group(invoke_without_command=True)
+    def cli() -> None:
+        pass
+
+    @cli.command()
+    @rich_config(help_config={"style_option": "red"})
+    def sub() -> None:
+        pass
+
+    with cli.make_context("cli", []) as ctx1, cli.make_context("cli", []) as ctx2:
+        assert isinstance(ctx1, RichContext) and isinstance(ctx2, RichContext)
+        assert ctx1.help_config is ctx2.help_config
+
+        with sub.make_context("sub", [], parent=ctx1) as sub1, sub.make_context("sub", [], parent=ctx2) as sub2:
+            assert isinstance(sub1, RichContext) and isinstance(sub2, RichContext)
+            assert sub1.help_config is sub2.help_config
+            assert sub1.help_config.style_option == "red"
+            assert ctx1.help_config.style_option != "red"
+
+    # Rendering help resolves the config on a copy, so the shared config is left untouched.
+    shared = ctx1.help_config
+    before = repr(shared)
+    cli_runner.invoke(cli, ["sub", "--help"])
+    assert repr(shared) == before
+
+    # Reassigning a global or changing the theme produces a new config.
+    rc.STYLE_OPTION = "blue"
+    with cli.make_context("cli", []) as ctx3:
+        assert isinstance(ctx3, RichContext)
+        assert ctx3.help_config is not shared
+        assert ctx3.help_config.style_option == "blue"
+
+    monkeypatch.setenv("RICH_CLICK_THEME", "forest")
+    with cli.make_context("cli", []) as ctx4:
+        assert isinstance(ctx4, RichContext)
+        assert ctx4.help_config is not ctx3.help_config
+
+
 def test_config_is_serializable_and_invertible() -> None:
     config = RichHelpConfiguration()
     config.apply_theme(force_default=True)
@@ -196,3 +245,211 @@ def test_custom_console(cli_runner: CliRunner) -> None:
 │ --help  Show this message and exit.                                                              │
 ╰──────────────────────────────────────────────────────────────────────────────────────────────────╯
 """)
+
+
+def test_group_keys_match_like_fnmatch() -> None:
+    from fnmatch import fnmatch
+
+    from rich_click.rich_panel import _compile_group_keys
+
+    keys = ("*", "cli", "cli *", "cli sub", "c?i", "[ab]*", "cli s*b", "python -m cli")
+    for paths in (["cli"], ["cli sub"], ["bar.py", "cli sub"], ["python -m cli"], ["other"]):
+        expected = {key for key in keys if any(fnmatch(path, key) for path in paths)}
+        assert _compile_group_keys(keys).match(paths) == expected
+
+
+def test_option_groups_are_deduplicated_and_memoized(cli_runner: CliRunner) -> None:
+    import click
+
+    options = ["--a", "--b", "--c"]
+    option_groups = {
+        "cli": [{"name": "First", "options": ["--a", "--b"]}],
+        "*": [{"name": "All", "options": options}],
+    }
+
+    @command()
+    @rich_config(help_config=RichHelpConfiguration(option_groups=option_groups))  # type: ignore[arg-type]
+    @click.option("--a")
+    @click.option("--b")
+    @click.option("--c")
+    def cli(a: str, b: str, c: str) -> None:
+        """CLI."""
+
+    res = cli_runner.invoke(cli, "--help")
+    assert res.exit_code == 0, res.output
+    assert cli._panel_layout is not None
+    assert [(p.name, p.objects) for p in cli._panel_layout[1]] == [
+        ("First", ["--a", "--b"]),
+        ("All", ["--c"]),
+        ("Options", ["--help"]),
+    ]
+    # The config itself is left as is.
+    assert options == ["--a", "--b", "--c"]
+
+    layout = cli._panel_layout
+    cli_runner.invoke(cli, "--help")
+    assert cli._panel_layout is layout
+
+    # The layout is rebuilt when the params change.
+    cli.params.append(click.Option(["--d"]))
+    res = cli_runner.invoke(cli, "--help")
+    assert cli._panel_layout is not layout
+    assert "--d" in res.stdout
+
+    # ... and when the config changes.
+    layout = cli._panel_layout
+    cli.context_settings["rich_help_config"].option_groups = {}
+    res = cli_runner.invoke(cli, "--help")
+    assert cli._panel_layout is not layout
+    assert "First" not in res.stdout
+
+
+def test_panel_layout_follows_panels_edited_in_place(cli_runner: CliRunner) -> None:
+    @command()
+    @option_panel("Extra", options=["--b"])
+    @option("--a")
+    @option("--b")
+    def cli(a: str, b: str) -> None:
+        """CLI."""
+
+    cli_runner.invoke(cli, "--help")
+    cli.panels[0].options.append("--a")
+    res = cli_runner.invoke(cli, "--help")
+    assert cli._panel_layout is not None
+    assert [(p.name, p.objects) for p in cli._panel_layout[1]] == [
+        ("Extra", ["--b", "--a"]),
+        ("Options", ["--help"]),
+    ]
+    assert res.stdout.count("--a") == 1
+
+
+def test_compiled_styles() -> None:
+    from copy import copy
+
+    from rich.style import Style
+
+    config = RichHelpConfiguration(style_option="bold red", style_helptext="option", style_option_negative=None)
+    config.apply_theme(force_default=True)
+    styles = config.compiled_styles
+    assert styles.style_option == Style(bold=True, color="red")
+    # Names of styles in the console theme are left for the console to resolve.
+    assert styles.style_helptext == "option"
+    assert styles.style_option_negative is None
+    assert config.compiled_styles is styles
+    assert styles.console_theme() is styles.console_theme()
+
+    # Copies share the compiled styles until either one is modified.
+    config_copy = copy(config)
+    assert config_copy.compiled_styles is styles
+    config.style_option = "green"
+    assert config.compiled_styles.style_option == Style(color="green")
+    assert config_copy.compiled_styles is not styles
+    assert config_copy.compiled_styles.style_option == Style(bold=True, color="red")
+
+
+def test_shared_config_follows_globals_edited_in_place(cli_runner: CliRunner) -> None:
+    @command()
+    @option("--a")
+    @option("--b")
+    def cli(a: str, b: str) -> None:
+        """CLI."""
+
+    rc.OPTION_GROUPS = {"cli": [{"name": "First", "options": ["--a"]}]}
+    config = RichHelpConfiguration._load_shared_from_globals()
+    assert RichHelpConfiguration._load_shared_from_globals() is config
+    assert "First" in cli_runner.invoke(cli, "--help").stdout
+
+    rc.OPTION_GROUPS["cli"].append({"name": "Second", "options": ["--b"]})
+    assert RichHelpConfiguration._load_shared_from_globals() is not config
+    assert "Second" in cli_runner.invoke(cli, "--help").stdout
+
+    # Deeper edits need the global to be reassigned.
+    rc.OPTION_GROUPS["cli"][0]["name"] = "Renamed"
+    assert "Renamed" not in cli_runner.invoke(cli, "--help").stdout
+    rc.OPTION_GROUPS = dict(rc.OPTION_GROUPS)
+    assert "Renamed" in cli_runner.invoke(cli, "--help").stdout
+
+
+def test_editing_a_shared_config_after_rendering() -> None:
+    @command()
+    @option("--a")
+    def cli(a: str) -> None:
+        """CLI."""
+
+    ctx = cli.make_context("cli", [])
+    assert "Options" in ctx.get_help()
+    ctx.help_config.options_panel_title = "MUTATED"
+    assert "MUTATED" in ctx.get_help()
+
+    # Contexts created later are not affected.
+    other = cli.make_context("cli", [])
+    assert other.help_config.options_panel_title != "MUTATED"
+    assert "MUTATED" not in other.get_help()
+    assert other.help_config is cli.make_context("cli", []).help_config
+
+
+def test_config_scope(monkeypatch: pytest.MonkeyPatch) -> None:
+    rc.STYLE_OPTION = "red"
+    with config_scope(style_option="green", width=60):
+        assert RichHelpConfiguration.load_from_globals().style_option == "green"
+        with config_scope(style_option="blue"):
+            config = RichHelpConfiguration._load_shared_from_globals()
+            assert (config.style_option, config.width) == ("blue", 60)
+        assert RichHelpConfiguration._load_shared_from_globals().style_option == "green"
+        # Context settings take precedence over the scope.
+        assert RichHelpConfiguration.load_from_globals(style_option="cyan").style_option == "cyan"
+    assert RichHelpConfiguration._load_shared_from_globals().style_option == "red"
+
+    # A scoped theme takes precedence over the theme passed to the rich-click CLI.
+    monkeypatch.setattr(rc, "_THEME_FROM_CLI", "nord-box")
+    with config_scope(theme="forest-box"):
+        config = RichHelpConfiguration.load_from_globals()
+        config.apply_theme(force_default=True)
+        assert config.style_usage == get_theme("forest-box").styles["style_usage"]
+        assert config.style_usage != get_theme("nord-box").styles["style_usage"]
+
+    with pytest.raises(TypeError, match="not_an_option"):
+        with config_scope(not_an_option=True):
+            pass
+
+
+def test_config_scope_is_isolated_between_threads_and_tasks() -> None:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    rc.COLOR_SYSTEM = "truecolor"
+
+    @command()
+    @option("--name", help="The name.")
+    def cli(name: str) -> None:
+        """My help text."""
+
+    def render(style: str) -> str:
+        with config_scope(style_option=style):
+            stdout = io.StringIO()
+            cli.invoke_isolated(["--help"], prog_name="cli", stdout=stdout)
+            return stdout.getvalue()
+
+    styles = ["red", "green", "blue", "magenta"]
+    expected = {style: render(style) for style in styles}
+    assert len(set(expected.values())) == len(styles)
+
+    jobs = [styles[i % len(styles)] for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(render, jobs)) == [expected[style] for style in jobs]
+
+    def render_inherited() -> str:
+        stdout = io.StringIO()
+        cli.invoke_isolated(["--help"], prog_name="cli", stdout=stdout)
+        return stdout.getvalue()
+
+    async def render_in_task(style: str) -> str:
+        with config_scope(style_option=style):
+            await asyncio.sleep(0)
+            # Tasks and asyncio.to_thread() run with a copy of the current context, which includes the scope.
+            return await asyncio.create_task(asyncio.to_thread(render_inherited))
+
+    async def main() -> list[str]:
+        return await asyncio.gather(*(render_in_task(style) for style in jobs[:20]))
+
+    assert asyncio.run(main()) == [expected[style] for style in jobs[:20]]
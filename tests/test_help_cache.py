@@ -0,0 +1,171 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+import rich_click
+import rich_click.rich_click as rc
+from rich_click import _cache
+from rich_click.rich_command import RichGroup
+from tests.conftest import WriteScript, make_release_cli, run_as_subprocess
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("RICH_CLICK_CACHE_DIR", tmp_path.as_posix())
+    return tmp_path / "help"
+
+
+def test_help_cache_disabled_by_default(cli_runner: CliRunner, cache_dir: Path) -> None:
+    res = cli_runner.invoke(make_release_cli(), "--help")
+    assert res.exit_code == 0
+    assert not cache_dir.exists()
+
+
+def test_help_cache_hit_skips_rendering(
+    cli_runner: CliRunner, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rc.ENABLE_HELP_CACHE = True
+
+    first = cli_runner.invoke(make_release_cli(), "--help")
+    assert first.exit_code == 0
+    assert len(os.listdir(cache_dir)) == 1
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("help should have been served from the cache")
+
+    monkeypatch.setattr(RichGroup, "format_help", fail)
+
+    second = cli_runner.invoke(make_release_cli(), "--help")
+    assert second.exit_code == 0
+    assert second.stdout == first.stdout
+
+
+def test_help_cache_invalidation(cli_runner: CliRunner, cache_dir: Path) -> None:
+    rc.ENABLE_HELP_CACHE = True
+
+    cli = make_release_cli()
+    cli_runner.invoke(cli, "--help")
+    cli_runner.invoke(cli, "--help")
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Changes to the command, the config, and the width all produce new cache entries.
+    cli.help = "Greet someone else."
+    res = cli_runner.invoke(cli, "--help")
+    assert "Greet someone else." in res.stdout
+    assert len(os.listdir(cache_dir)) == 2
+
+    rc.STYLE_OPTION = "bold red"
+    cli_runner.invoke(cli, "--help")
+    assert len(os.listdir(cache_dir)) == 3
+
+    rc.WIDTH = 80
+    cli_runner.invoke(cli, "--help")
+    assert len(os.listdir(cache_dir)) == 4
+
+
+def test_help_cache_version_invalidation(
+    cli_runner: CliRunner, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rc.ENABLE_HELP_CACHE = True
+
+    cli_runner.invoke(make_release_cli(), "--help")
+    monkeypatch.setattr(rich_click, "__version__", "0.0.0")
+    cli_runner.invoke(make_release_cli(), "--help")
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_help_cache_hit_across_processes(mock_script_writer: WriteScript, cache_dir: Path) -> None:
+    path = mock_script_writer(
+        '''
+        import atexit
+        import sys
+
+        import rich_click as click
+
+        click.rich_click.ENABLE_HELP_CACHE = True
+        atexit.register(lambda: print("rich" in sys.modules, file=sys.stderr))
+
+        @click.command()
+        @click.option("--name", default="world", show_default=True)
+        def cli(name):
+            """My help text"""
+
+        if __name__ == "__main__":
+            cli(prog_name="cli")
+        ''',
+        module_name="cached_cli.py",
+    )
+    script = (path / "cached_cli.py").as_posix()
+
+    first = run_as_subprocess([sys.executable, script, "--help"])
+    assert (first.returncode, first.stderr) == (0, b"True\n")
+    assert len(os.listdir(cache_dir)) == 1
+
+    # The second run is a cache hit, so Rich is not even imported.
+    second = run_as_subprocess([sys.executable, script, "--help"])
+    assert (second.returncode, second.stdout, second.stderr) == (0, first.stdout, b"False\n")
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_help_cache_skips_unstable_reprs(cli_runner: CliRunner, cache_dir: Path) -> None:
+    rc.ENABLE_HELP_CACHE = True
+
+    @rich_click.command()
+    @rich_click.option("--when", default=object())
+    def cli(when: object) -> None:
+        """Schedule something."""
+
+    res = cli_runner.invoke(cli, "--help")
+    assert res.exit_code == 0
+    assert "Schedule something." in res.stdout
+    assert not cache_dir.exists()
+
+
+def test_help_cache_is_pruned(cli_runner: CliRunner, cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    rc.ENABLE_HELP_CACHE = True
+    monkeypatch.setattr(_cache, "_MAX_CACHED_HELP_TEXTS", 2)
+    monkeypatch.setattr(_cache, "_PRUNE_EVERY", 3)
+    monkeypatch.setattr(_cache, "_new_files_until_prune", {str(cache_dir): 3})
+
+    cli = make_release_cli()
+    for i in range(2):
+        cli.help = f"Greet someone {i}."
+        cli_runner.invoke(cli, "--help")
+    # Hits and rewrites of the same file do not count towards pruning.
+    cli_runner.invoke(cli, "--help")
+    _cache._store(str(cache_dir / os.listdir(cache_dir)[0]), "Rewritten.", 2)
+    cli.help = "Greet someone 2."
+    cli_runner.invoke(cli, "--help")
+    assert len(os.listdir(cache_dir)) == 2
+
+    for i in range(3, 5):
+        cli.help = f"Greet someone {i}."
+        cli_runner.invoke(cli, "--help")
+    assert len(os.listdir(cache_dir)) == 4
+    cli.help = "Greet someone 5."
+    cli_runner.invoke(cli, "--help")
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_help_cache_writes_from_threads(cache_dir: Path) -> None:
+    import threading
+
+    path = str(cache_dir / "shared.txt")
+    barrier = threading.Barrier(8)
+
+    def write(i: int) -> None:
+        barrier.wait()
+        for _ in range(20):
+            _cache.write_atomic(path, f"text {i} " * 1000)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert os.listdir(cache_dir) == ["shared.txt"]
+    assert (cache_dir / "shared.txt").read_text() in {f"text {i} " * 1000 for i in range(8)}
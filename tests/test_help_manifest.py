@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import click
+import pytest
+from click.testing import CliRunner
+
+import rich_click
+from rich_click.cli import main
+from rich_click.rich_help_manifest import build_manifest
+from tests.conftest import WriteScript, make_release_cli
+
+
+def test_help_manifest_matches_live_rendering(cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+    manifest = build_manifest(make_release_cli())
+    expected = [cli_runner.invoke(make_release_cli(), args).stdout for args in (["--help"], ["deploy", "--help"])]
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("help should have been rendered from the manifest")
+
+    cli = make_release_cli(help_manifest=manifest)
+    with monkeypatch.context() as m:
+        for cls in (click.Parameter, click.Option):
+            m.setattr(cls, "make_metavar", fail)
+            m.setattr(cls, "get_default", fail)
+        assert cli_runner.invoke(cli, "--help").stdout == expected[0]
+
+    # Invoking a subcommand parses the root command's options, which requires their defaults.
+    with monkeypatch.context() as m:
+        for cls in (click.Parameter, click.Option):
+            m.setattr(cls, "make_metavar", fail)
+        assert cli_runner.invoke(cli, ["deploy", "--help"]).stdout == expected[1]
+        res = cli_runner.invoke(cli, ["d", "--help"])
+        assert res.exit_code == 0, res.output
+        assert "Usage: cli d [OPTIONS] TARGET" in res.stdout
+
+
+def test_help_manifest_describes_unloaded_subcommands(cli_runner: CliRunner) -> None:
+    manifest = build_manifest(make_release_cli())
+    expected = cli_runner.invoke(make_release_cli(), "--help").stdout
+
+    @rich_click.group(
+        epilog="For more, see the docs.",
+        context_settings={"help_manifest": manifest},
+        lazy_commands={name: f"not_a_real_module:{name}" for name in ("deploy", "sub", "abort")},
+    )
+    @rich_click.option("--level", type=click.Choice(["debug", "info"]), default="info", show_default=True)
+    @rich_click.option("--verbose", is_flag=True, help="Be [b]loud[/b].")
+    def cli(level: str, verbose: bool) -> None:
+        """My [b]CLI[/b] help text."""
+
+    res = cli_runner.invoke(cli, "--help")
+    assert res.exit_code == 0, res.output
+    assert res.stdout == expected
+
+
+def test_help_manifest_ignores_stale_params(cli_runner: CliRunner) -> None:
+    manifest = build_manifest(make_release_cli())
+    manifest["commands"][""]["params"]["level"]["metavar"] = "[STALE]"
+    manifest["commands"][""]["params"]["level"]["opts"] = ["--old-level"]
+
+    res = cli_runner.invoke(make_release_cli(help_manifest=manifest), "--help")
+    assert "STALE" not in res.stdout
+    assert "debug|info" in res.stdout
+
+
+def test_help_manifest_ignores_changed_defaults_and_types(cli_runner: CliRunner) -> None:
+    manifest = build_manifest(make_release_cli())
+
+    def deploy_help(**changes: Any) -> str:
+        cli = make_release_cli(help_manifest=manifest)
+        retries = next(p for p in cli.commands["deploy"].params if p.name == "retries")
+        for attr, value in changes.items():
+            setattr(retries, attr, value)
+        res = cli_runner.invoke(cli, ["deploy", "--help"])
+        assert res.exit_code == 0, res.output
+        return res.stdout
+
+    assert "3" in deploy_help()
+    changed_default = deploy_help(default=7)
+    assert "7" in changed_default
+    assert "3" not in changed_default
+    assert "0<=x<=9" in deploy_help(type=click.IntRange(0, 9))
+    assert "[default: 3]" not in deploy_help(show_default=False)
+
+
+def test_rich_click_cli_build_manifest(mock_script_writer: WriteScript, cli_runner: CliRunner, tmp_path: Path) -> None:
+    mock_script_writer(
+        '''
+        import click
+
+        @click.group()
+        @click.option("--name", default="world", show_default=True)
+        def cli(name):
+            """My help text"""
+
+        @cli.command()
+        def sub():
+            """A subcommand."""
+        ''',
+        module_name="manifest_cli.py",
+    )
+    path = tmp_path / "manifest.json"
+
+    res = cli_runner.invoke(main, ["--build-manifest", path.as_posix(), "manifest_cli:cli"])
+    assert res.exit_code == 0, res.output
+
+    manifest = json.loads(path.read_text())
+    assert manifest["commands"][""]["params"]["name"]["default"] == "world"
+    assert manifest["commands"][""]["commands"] == {"sub": {"help": "A subcommand."}}
+    assert "sub" in manifest["commands"]
+
+    res = cli_runner.invoke(main, ["--build-manifest", path.as_posix(), "manifest_cli"])
+    assert res.exit_code == 2
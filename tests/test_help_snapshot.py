@@ -0,0 +1,178 @@
+import sys
+from pathlib import Path
+from typing import Any
+
+import click
+import pytest
+from click.testing import CliRunner
+
+import rich_click
+import rich_click.rich_click as rc
+from rich_click.rich_command import RichCommand, RichGroup
+from rich_click.rich_context import RichContext
+from rich_click.rich_help_snapshot import _terminal_variant, build_snapshot, load_snapshot
+from tests.conftest import WriteScript, make_release_cli, run_as_subprocess
+
+
+HELP_ARGS = [["--help"], ["deploy", "--help"]]
+
+
+@pytest.mark.parametrize(("width", "color_system"), [(80, None), (100, "truecolor"), (160, "256")])
+def test_help_snapshot_matches_live_rendering(
+    cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch, width: int, color_system: str | None
+) -> None:
+    snapshot = build_snapshot(make_release_cli())
+    rc.WIDTH = width
+    rc.COLOR_SYSTEM = color_system
+    expected = [cli_runner.invoke(make_release_cli(), args, prog_name="cli").stdout for args in HELP_ARGS]
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("help should have been printed from the snapshot")
+
+    monkeypatch.setattr(RichCommand, "format_help", fail)
+    monkeypatch.setattr(RichGroup, "format_help", fail)
+    cli = make_release_cli(help_snapshot=snapshot)
+    assert [cli_runner.invoke(cli, args, prog_name="cli").stdout for args in HELP_ARGS] == expected
+
+
+def test_help_snapshot_falls_back_to_rendering(cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+    snapshot = build_snapshot(make_release_cli(), widths=[100])
+    renders = []
+    format_help = RichGroup.format_help
+
+    def counting_format_help(self: RichGroup, ctx: RichContext, formatter: Any) -> None:
+        renders.append(ctx.command_path)
+        format_help(self, ctx, formatter)
+
+    monkeypatch.setattr(RichGroup, "format_help", counting_format_help)
+
+    def invoke(cli: click.Command, args: list[str], **kwargs: Any) -> str:
+        res = cli_runner.invoke(cli, args, **kwargs)
+        assert res.exit_code == 0, res.output
+        return res.stdout
+
+    expected_default = invoke(make_release_cli(help_snapshot=snapshot), ["--help"], prog_name="cli")
+    assert renders == []
+
+    # The width is not in the snapshot, the defaults can be overridden, or the command path is different.
+    rc.WIDTH = 90
+    expected = invoke(make_release_cli(), ["--help"], prog_name="cli")
+    renders.clear()
+    assert invoke(make_release_cli(help_snapshot=snapshot), ["--help"], prog_name="cli") == expected
+    rc.WIDTH = 100
+    invoke(make_release_cli(help_snapshot=snapshot, default_map={"level": "debug"}), ["--help"], prog_name="cli")
+    invoke(make_release_cli(help_snapshot=snapshot), ["--help"], prog_name="other")
+    assert renders == ["cli", "cli", "other"]
+    assert "Usage: cli d [OPTIONS] TARGET" in invoke(
+        make_release_cli(help_snapshot=snapshot), ["d", "--help"], prog_name="cli"
+    )
+
+    # The command changed since the snapshot was built.
+    cli = make_release_cli(help_snapshot=snapshot)
+    cli.params.append(rich_click.Option(["--new"], help="A new option."))
+    assert "A new option." in invoke(cli, ["--help"], prog_name="cli")
+
+    # One of its subcommands changed since the snapshot was built.
+    for attr, value in (("help", "Ship it."), ("short_help", "Ship it."), ("hidden", True), ("deprecated", True)):
+        cli = make_release_cli(help_snapshot=snapshot)
+        setattr(cli.commands["deploy"], attr, value)
+        renders.clear()
+        assert invoke(cli, ["--help"], prog_name="cli") != expected_default
+        assert renders == ["cli"]
+
+
+def test_help_snapshot_skips_dynamic_defaults() -> None:
+    cli = make_release_cli()
+
+    @cli.command()
+    @rich_click.option("--when", default=lambda: "now", show_default=True)
+    def schedule(when: str) -> None:
+        """Schedule a deploy."""
+
+    snapshot = load_snapshot(build_snapshot(cli, "cli", widths=[100], color_systems=[None]))
+    assert snapshot is not None
+    assert sorted(snapshot.commands) == ["", "abort", "deploy", "sub"]
+    assert list(snapshot.commands[""]["variants"]) == ["100:None"]
+
+
+def test_load_snapshot_warns_about_unreadable_snapshots(tmp_path: Path) -> None:
+    with pytest.warns(UserWarning, match="Could not load help snapshot"):
+        assert load_snapshot(tmp_path / "missing.snapshot") is None
+    with pytest.warns(UserWarning, match="not a help snapshot"):
+        assert load_snapshot(b"{}") is None
+
+    # A snapshot built by another version of rich-click is ignored.
+    snapshot = build_snapshot(make_release_cli(), widths=[100], color_systems=[None])
+    assert load_snapshot(snapshot.replace(rich_click.__version__.encode(), b"0.0.0", 1)) is None
+
+
+@pytest.mark.parametrize(
+    ("env", "context_settings"),
+    [
+        ({}, {}),
+        ({"FORCE_COLOR": "1", "TERM": "xterm-256color", "COLUMNS": "123"}, {}),
+        ({"TTY_COMPATIBLE": "1", "COLORTERM": "truecolor"}, {"max_content_width": 70}),
+        ({"TTY_COMPATIBLE": "1", "TERM": "xterm-kitty"}, {"terminal_width": 90}),
+        ({"TTY_COMPATIBLE": "1", "TERM": "xterm"}, {}),
+        ({"TTY_COMPATIBLE": "0", "COLORTERM": "truecolor"}, {}),
+    ],
+)
+def test_terminal_variant_matches_console(
+    monkeypatch: pytest.MonkeyPatch, env: dict[str, str], context_settings: dict[str, Any]
+) -> None:
+    for k in ("FORCE_COLOR", "TERM", "COLORTERM", "COLUMNS", "TTY_COMPATIBLE", "NO_COLOR"):
+        monkeypatch.delenv(k, raising=False)
+    for k, v in env.items():
+        monkeypatch.setenv(k, v)
+    rc.WIDTH = rc.MAX_WIDTH = rc.FORCE_TERMINAL = None
+    rc.COLOR_SYSTEM = "auto"
+
+    ctx = make_release_cli(**context_settings).make_context("cli", [], resilient_parsing=True)
+    assert isinstance(ctx, RichContext)
+    console = ctx.make_formatter().console
+    assert _terminal_variant(ctx) == f"{console.width}:{console.color_system}"
+
+
+def test_rich_click_cli_build_snapshot(mock_script_writer: WriteScript) -> None:
+    path = mock_script_writer(
+        '''
+        import atexit
+        import os
+        import sys
+
+        import rich_click as click
+
+        atexit.register(lambda: print("rich" in sys.modules, file=sys.stderr))
+
+        @click.group(context_settings={"help_snapshot": os.environ.get("HELP_SNAPSHOT")})
+        @click.option("--name", default="world", show_default=True)
+        def cli(name):
+            """My help text"""
+
+        @cli.command()
+        def sub():
+            """A subcommand."""
+
+        if __name__ == "__main__":
+            cli(prog_name="cli")
+        ''',
+        module_name="snapshot_cli.py",
+    )
+    snapshot = path / "help.snapshot"
+
+    res = run_as_subprocess(
+        [sys.executable, "-m", "src.rich_click", "--build-snapshot", snapshot.as_posix(), "snapshot_cli"]
+    )
+    assert res.returncode == 2
+    res = run_as_subprocess(
+        [sys.executable, "-m", "src.rich_click", "--build-snapshot", snapshot.as_posix(), "snapshot_cli:cli"]
+    )
+    assert res.returncode == 0, res.stderr.decode()
+
+    script = (path / "snapshot_cli.py").as_posix()
+    for args in (["--help"], ["sub", "--help"]):
+        live = run_as_subprocess([sys.executable, script, *args])
+        assert live.stderr == b"True\n"
+        res = run_as_subprocess([sys.executable, script, *args], env={"HELP_SNAPSHOT": snapshot.as_posix()})
+        # Rich is not even imported.
+        assert (res.returncode, res.stdout, res.stderr) == (0, live.stdout, b"False\n")
@@ -0,0 +1,50 @@
+import io
+
+import pytest
+from click.testing import CliRunner
+
+import rich_click
+import rich_click.rich_click as rc
+from rich_click.rich_command import RichCommand, RichGroup
+from rich_click.rich_context import RichContext
+from rich_click.rich_help_formatter import RichHelpFormatter
+from tests.conftest import make_release_cli
+
+
+@pytest.mark.parametrize("args", [["--help"], ["sub", "--help"]])
+def test_streamed_help_matches_buffered_help(cli_runner: CliRunner, args: list[str]) -> None:
+    buffered = cli_runner.invoke(make_release_cli(), args)
+    rc.STREAM_HELP = True
+    streamed = cli_runner.invoke(make_release_cli(), args)
+    assert streamed.exit_code == 0
+    assert streamed.stdout == buffered.stdout
+
+
+def test_streamed_help_is_written_as_it_renders(monkeypatch: pytest.MonkeyPatch) -> None:
+    rc.STREAM_HELP = True
+    cli = make_release_cli()
+    stream = io.StringIO()
+
+    def format_epilog(self: RichCommand, ctx: RichContext, formatter: RichHelpFormatter) -> None:
+        # Everything before the epilog has already been written to the stream.
+        assert "Deploy the project." in stream.getvalue()
+        assert not formatter.console.record
+
+    monkeypatch.setattr(RichGroup, "format_epilog", format_epilog)
+
+    with cli.make_context("cli", [], resilient_parsing=True) as ctx:
+        assert isinstance(ctx, RichContext)
+        ctx.print_help(stream)
+    assert "Usage: cli [OPTIONS] COMMAND [ARGS]..." in stream.getvalue()
+
+
+def test_help_is_buffered_when_exporting(cli_runner: CliRunner) -> None:
+    rc.STREAM_HELP = True
+
+    @rich_click.command(context_settings={"export_console_as": "html"})
+    def cli() -> None:
+        """My CLI help text."""
+
+    res = cli_runner.invoke(cli, "--help")
+    assert res.exit_code == 0
+    assert res.stdout.startswith("<!DOCTYPE html>")
@@ -0,0 +1,88 @@
+import click
+import pytest
+from click.testing import CliRunner
+
+import rich_click
+from rich_click import render_tree
+
+
+@rich_click.group()
+@rich_click.option("--verbose", is_flag=True, help="Be loud.")
+def cli(verbose: bool) -> None:
+    """My CLI."""
+
+
+@cli.group()
+def db() -> None:
+    """Database commands."""
+
+
+@db.command()
+@rich_click.option("--force", is_flag=True, help="Drop without asking.")
+def drop(force: bool) -> None:
+    """Drop the database."""
+
+
+@cli.command()
+def deploy() -> None:
+    """Deploy the app."""
+
+
+@cli.command(hidden=True)
+def secret() -> None:
+    """A hidden command."""
+
+
+PATHS = [(), ("db",), ("db", "drop"), ("deploy",)]
+
+
+def test_render_tree_matches_help_output(cli_runner: CliRunner) -> None:
+    results = list(render_tree(cli, formats=[None, "html"]))
+    assert [(r.path, r.format) for r in results] == [(path, fmt) for path in PATHS for fmt in (None, "html")]
+
+    for result in results:
+        assert result.command_path == " ".join(("cli", *result.path))
+        if result.format is None:
+            res = cli_runner.invoke(cli, [*result.path, "--help"], prog_name="cli")
+            assert result.output == res.stdout.rstrip("\n")
+        else:
+            assert result.output.startswith("<!DOCTYPE html>")
+
+
+def test_render_tree_include_hidden() -> None:
+    paths = [r.path for r in render_tree(cli, include_hidden=True)]
+    assert ("secret",) in paths
+
+
+def test_render_tree_with_threads() -> None:
+    expected = set(render_tree(cli, formats=["text", "svg"]))
+    results = list(render_tree(cli, formats=["text", "svg"], workers=4))
+    assert len(results) == len(expected)
+    assert set(results) == expected
+
+
+def test_render_tree_with_processes() -> None:
+    results = list(render_tree(f"{__name__}:cli", processes=True, workers=2))
+    assert sorted(r.path for r in results) == sorted(PATHS)
+    drop_help = next(r.output for r in results if r.path == ("db", "drop"))
+    assert "Drop without asking." in drop_help
+
+
+def test_render_tree_processes_needs_import_path() -> None:
+    with pytest.raises(TypeError):
+        next(render_tree(cli, processes=True))
+
+    with pytest.raises(TypeError):
+        next(render_tree("click:echo"))
+
+
+def test_render_tree_plain_click_command() -> None:
+    @click.group()
+    def plain() -> None:
+        """Plain click."""
+
+    @plain.command()
+    def sub() -> None:
+        """A subcommand."""
+
+    assert [r.path for r in render_tree(plain)] == [(), ("sub",)]
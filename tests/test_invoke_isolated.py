@@ -0,0 +1,63 @@
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from click.testing import CliRunner
+
+import rich_click
+import rich_click.rich_click as rc
+from rich_click.rich_command import RichGroup
+from rich_click.rich_help_configuration import RichHelpConfiguration
+from tests.conftest import make_release_cli
+
+
+CASES = [
+    ["--help"],
+    ["sub", "--help"],
+    ["sub", "--count", "5"],
+    ["sub", "--count", "not-a-number"],
+    ["--unknown"],
+    ["abort"],
+]
+
+
+def _invoke(cli: RichGroup, args: list[str], **kwargs: object) -> tuple[int, str, str]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    code = cli.invoke_isolated(args, prog_name="cli", stdout=stdout, stderr=stderr, **kwargs)  # type: ignore[arg-type]
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+@pytest.mark.parametrize("args", CASES)
+def test_invoke_isolated_matches_main(cli_runner: CliRunner, args: list[str]) -> None:
+    res = cli_runner.invoke(make_release_cli(), args, prog_name="cli")
+    stdout_before, stderr_before = sys.stdout, sys.stderr
+    code, stdout, stderr = _invoke(make_release_cli(), args)
+    assert (sys.stdout, sys.stderr) == (stdout_before, stderr_before)
+    assert code == res.exit_code
+    assert stdout == res.stdout
+    assert stderr == res.stderr
+
+
+def test_invoke_isolated_uses_given_settings() -> None:
+    code, stdout, _ = _invoke(make_release_cli(), ["--help"], config=RichHelpConfiguration(text_markup=None))
+    assert code == 0
+    assert "Be [b]loud[/b]." in stdout
+
+    code, _, stderr = _invoke(make_release_cli(), ["--unknown"], export_console_as="html", errors_in_output_format=True)
+    assert code == 2
+    assert stderr.startswith("<!DOCTYPE html>")
+    assert rich_click.RichContext.export_console_as is None
+
+
+def test_invoke_isolated_concurrently() -> None:
+    rc.COLOR_SYSTEM = "truecolor"
+    cli = make_release_cli()
+    expected = {tuple(args): _invoke(cli, args) for args in CASES}
+
+    jobs = [CASES[i % len(CASES)] for i in range(300)]
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda args: _invoke(cli, args), jobs))
+
+    for args, result in zip(jobs, results):
+        assert result == expected[tuple(args)], args
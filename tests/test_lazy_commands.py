@@ -0,0 +1,90 @@
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from inline_snapshot import snapshot
+
+import rich_click
+from rich_click.rich_command import RichGroup
+
+
+@pytest.fixture
+def lazy_cli(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> RichGroup:
+    pkg = tmp_path / "lazypkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "build.py").write_text(
+        "import rich_click as click\n\n"
+        "@click.command()\n"
+        "@click.option('--fast', is_flag=True)\n"
+        "def build(fast):\n"
+        "    '''Build the project.'''\n"
+        "    click.echo(f'building fast={fast}')\n"
+    )
+    (pkg / "deploy.py").write_text(
+        "import rich_click as click\n\n"
+        "@click.command()\n"
+        "def deploy():\n"
+        "    '''Deploy the project.'''\n"
+        "    click.echo('deploying')\n"
+    )
+    monkeypatch.syspath_prepend(tmp_path.as_posix())
+    for mod in ["lazypkg", "lazypkg.build", "lazypkg.deploy"]:
+        monkeypatch.delitem(sys.modules, mod, raising=False)
+
+    @rich_click.group(
+        lazy_commands={
+            "build": {"import_path": "lazypkg.build:build", "short_help": "Build the project.", "aliases": ["b"]},
+            "deploy": {"import_path": "lazypkg.deploy:deploy", "short_help": "Deploy it.", "panel": "Release"},
+            "hidden": {"import_path": "lazypkg.hidden:hidden", "hidden": True},
+        }
+    )
+    def cli() -> None:
+        """Lazy CLI."""
+
+    @cli.command()
+    def eager() -> None:
+        """An eager command."""
+
+    return cli
+
+
+def test_lazy_group_help_does_not_import(cli_runner: CliRunner, lazy_cli: RichGroup) -> None:
+    res = cli_runner.invoke(lazy_cli, "--help")
+    assert res.exit_code == 0, res.output
+    assert "lazypkg" not in sys.modules
+    assert res.stdout == snapshot("""\
+                                                                                                    \n\
+ Usage: cli [OPTIONS] COMMAND [ARGS]...                                                             \n\
+                                                                                                    \n\
+ Lazy CLI.                                                                                          \n\
+                                                                                                    \n\
+╭─ Release ────────────────────────────────────────────────────────────────────────────────────────╮
+│ deploy                                 Deploy it.                                                │
+╰──────────────────────────────────────────────────────────────────────────────────────────────────╯
+╭─ Options ────────────────────────────────────────────────────────────────────────────────────────╮
+│ --help  Show this message and exit.                                                              │
+╰──────────────────────────────────────────────────────────────────────────────────────────────────╯
+╭─ Commands ───────────────────────────────────────────────────────────────────────────────────────╮
+│ build                 b          Build the project.                                              │
+│ eager                            An eager command.                                               │
+╰──────────────────────────────────────────────────────────────────────────────────────────────────╯
+""")
+
+
+def test_lazy_group_imports_only_invoked_command(cli_runner: CliRunner, lazy_cli: RichGroup) -> None:
+    res = cli_runner.invoke(lazy_cli, ["b", "--fast"])
+    assert res.exit_code == 0, res.output
+    assert res.stdout == "building fast=True\n"
+    assert "lazypkg.build" in sys.modules
+    assert "lazypkg.deploy" not in sys.modules
+
+
+def test_lazy_command_bad_import_path(cli_runner: CliRunner) -> None:
+    @rich_click.group(lazy_commands={"bad": "os.path"})
+    def cli() -> None:
+        pass
+
+    with pytest.raises(ValueError, match="module:attribute"):
+        cli_runner.invoke(cli, ["bad"], catch_exceptions=False)
@@ -1,3 +1,6 @@
+import os
+import signal
+
 import pytest
 from click import Abort
 from click.testing import CliRunner
@@ -7,7 +10,8 @@ import rich_click
 import rich_click.rich_click as rc
 from rich_click._compat_click import CLICK_IS_BEFORE_VERSION_821
 from rich_click.rich_context import RichContext
-from rich_click.utils import truthy
+from rich_click.rich_help_formatter import _render_segments
+from rich_click.utils import load_command, load_object, truthy
 
 
 @pytest.mark.skipif(CLICK_IS_BEFORE_VERSION_821, reason="CliRunner's stderr capture doesn't work before 8.2.1.")
@@ -69,3 +73,212 @@ def test_help_to_stderr(cli_runner: CliRunner) -> None:
 │ --help  Show this message and exit.                                                              │
 ╰──────────────────────────────────────────────────────────────────────────────────────────────────╯
 """)
+
+
+def test_render_segments_matches_rich() -> None:
+    from rich.color import ColorSystem
+    from rich.console import Console
+    from rich.segment import Segment
+    from rich.style import Style
+    from rich.text import Text
+
+    bold = Style(bold=True)
+    red = Style(color="red", link="https://example.com")
+    segments = [
+        Segment("a", bold),
+        Segment("b", bold),
+        Segment("", red),
+        Segment("c", None),
+        Segment("d", red),
+        Segment("e", Style()),
+        Segment("f", Style(bold=True)),
+    ]
+    expected = "".join(style.render(text) if style else text for text, style, _ in segments)
+    res = _render_segments(segments, ColorSystem.TRUECOLOR)
+
+    # Consecutive segments with the same style share their ANSI codes.
+    assert len(res) < len(expected)
+    console = Console(color_system="truecolor")
+    assert list(Segment.simplify(Text.from_ansi(res).render(console))) == list(
+        Segment.simplify(Text.from_ansi(expected).render(console))
+    )
+    assert _render_segments(segments, None) == "abcdef"
+
+
+def test_option_panels_share_param_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    from rich_click.rich_panel import RichOptionPanel
+
+    @rich_click.command()
+    @rich_click.option_panel("First", options=["--a", "-b"])
+    @rich_click.option_panel("Second", options=["c", "--missing"])
+    @rich_click.option("--a")
+    @rich_click.option("--bee", "-b")
+    @rich_click.option("--c")
+    def cli(a: str, bee: str, c: str) -> None:
+        """CLI."""
+
+    calls = []
+    get_params = cli.get_params
+    monkeypatch.setattr(cli, "get_params", lambda ctx: calls.append(ctx) or get_params(ctx))
+
+    ctx = cli.make_context("cli", [], resilient_parsing=True)
+    calls.clear()
+    first, second = cli.panels
+    assert [p.name for p in first.get_objects(cli, ctx)] == ["a", "bee"]
+    assert [p.name for p in second.get_objects(cli, ctx)] == ["c"]
+    assert [name for name, _ in RichOptionPanel.list_all_objects(ctx)] == ["a", "bee", "c", "--help"]
+    assert len(calls) == 1
+
+    # The index is rebuilt when the command's params change.
+    cli.params.append(rich_click.Option(["--missing"]))
+    assert [p.name for p in second.get_objects(cli, ctx)] == ["c", "missing"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "No highlights here.",
+        "Use --name or -n.",
+        "Takes <--name> as input.",
+        "Pass <FILE -x> and ABC-123, see https://example.com/--foo",
+        "(DEPRECATED: use --other instead)",
+        "-a-b --c-d <e>",
+    ],
+)
+def test_combined_highlighter_matches_regex_highlighter(text: str) -> None:
+    from rich.highlighter import RegexHighlighter
+    from rich.text import Text
+
+    from rich_click.rich_help_configuration import RichHelpConfiguration
+    from rich_click.rich_help_formatter import RichHelpFormatter
+
+    patterns = [
+        *RichHelpConfiguration().highlighter_patterns,
+        r"(?P<ticket>[A-Z]+-\d+)",
+        r"(?P<url>https?://\S+)",
+    ]
+
+    class Expected(RegexHighlighter):
+        highlights = patterns
+
+    formatter = RichHelpFormatter(config=RichHelpConfiguration(highlighter_patterns=patterns))
+    assert formatter.highlighter(Text(text)).spans == Expected()(Text(text)).spans
+
+    # Formatters with the same patterns share a highlighter.
+    other = RichHelpFormatter(config=RichHelpConfiguration(highlighter_patterns=list(patterns)))
+    assert other.highlighter is formatter.highlighter
+
+
+def test_formatters_reuse_pooled_consoles() -> None:
+    from rich_click.rich_help_formatter import RichHelpFormatter
+
+    formatter = RichHelpFormatter()
+    console = formatter.console
+    formatter.width = 40
+    formatter.write("first")
+    formatter._release()
+
+    formatter = RichHelpFormatter()
+    assert formatter.console is console
+    assert formatter.width == 100
+    formatter.write("second")
+    assert formatter.getvalue() == "second\n"
+
+    # A console is only used by one formatter at a time, and only by formatters with the same settings.
+    assert RichHelpFormatter().console is not console
+    formatter._release()
+    assert RichHelpFormatter(width=50).console is not console
+
+
+def test_handed_out_consoles_are_not_pooled() -> None:
+    import gc
+
+    @rich_click.command()
+    def cli() -> None:
+        """My help text."""
+
+    ctx = cli.make_context("cli", [])
+    console = ctx.make_formatter().console
+    gc.collect()
+    assert ctx.make_formatter().console is not console
+
+    # Rendering help text returns its console to the pool, for the next formatter.
+    ctx.get_help()
+    console = ctx.make_formatter().console
+    ctx.get_help()
+    assert ctx.make_formatter().console is not console
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="SIGWINCH is not available")
+def test_terminal_size_is_cached_until_resize(monkeypatch: pytest.MonkeyPatch) -> None:
+    from rich_click import _cache
+    from rich_click.rich_help_formatter import RichHelpFormatter
+
+    lookups = []
+
+    def lookup() -> tuple[int, int]:
+        lookups.append(None)
+        return 120 + len(lookups), 40
+
+    monkeypatch.setattr(_cache, "_lookup_terminal_size", lookup)
+    monkeypatch.setattr(_cache, "_terminal_size_cached", False)
+    rc.WIDTH = None
+    rc.MAX_WIDTH = None
+    monkeypatch.delenv("COLUMNS", raising=False)
+    monkeypatch.delenv("LINES", raising=False)
+    monkeypatch.setenv("TERM", "xterm")
+
+    assert RichHelpFormatter().width == 121
+    assert RichHelpFormatter().width == 121
+    assert _cache.terminal_size() == (121, 40)
+    assert len(lookups) == 1
+
+    os.kill(os.getpid(), signal.SIGWINCH)
+    assert RichHelpFormatter().width == 122
+    assert len(lookups) == 2
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="SIGWINCH is not available")
+def test_terminal_size_is_cached_after_first_use_from_a_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    from rich_click import _cache
+
+    lookups = []
+
+    def lookup() -> tuple[int, int]:
+        lookups.append(None)
+        return 120, 40
+
+    monkeypatch.setattr(_cache, "_lookup_terminal_size", lookup)
+    monkeypatch.setattr(_cache, "_terminal_size_cached", False)
+    monkeypatch.setattr(_cache, "_resize_watch_installed", False)
+    monkeypatch.setattr(_cache, "_previous_resize_handler", None)
+    handler = signal.getsignal(signal.SIGWINCH)
+    try:
+        # Signal handlers cannot be installed from other threads, so the size is not cached there.
+        for _ in range(2):
+            thread = threading.Thread(target=_cache.terminal_size)
+            thread.start()
+            thread.join()
+        assert len(lookups) == 2
+
+        # The main thread can still install the handler and cache the size.
+        assert _cache.terminal_size() == (120, 40)
+        assert _cache.terminal_size() == (120, 40)
+        assert len(lookups) == 3
+    finally:
+        signal.signal(signal.SIGWINCH, handler)
+
+
+def test_load_command() -> None:
+    assert load_object("os.path:join") is os.path.join
+    assert load_object("rich_click:RichContext.make_formatter") is RichContext.make_formatter
+    with pytest.raises(ValueError, match="module:attribute"):
+        load_object("os.path")
+    with pytest.raises(AttributeError, match="Module 'os' has no attribute 'path.nope'."):
+        load_object("os:path.nope")
+    with pytest.raises(ModuleNotFoundError):
+        load_object("not_a_module:cli")
+    with pytest.raises(TypeError, match="not a click command"):
+        load_command("os.path:join")
@@ -1,6 +1,7 @@
 # ruff: noqa: D101,D103,D401,E501
 import builtins
 import importlib
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -9,7 +10,7 @@ from click.testing import CliRunner
 from inline_snapshot import snapshot
 
 import rich_click
-from tests.conftest import WriteScript
+from tests.conftest import WriteScript, run_as_subprocess
 
 
 # These tests are to assert various optimizations.
@@ -23,6 +24,8 @@ from tests.conftest import WriteScript
 #   `click.__version__`. A slightly lazy albeit acceptable way to assert that
 #   `importlib.metadata.version()` is never called is to just assert that `importlib.metadata`
 #   is not imported at all. During --help, however, we accept that this call will be made.
+# - Building the help configuration and resolving its theme is deferred until help text or an error is rendered.
+#   The theme definitions are not even imported during execution.
 
 
 @pytest.fixture
@@ -73,6 +76,58 @@ def test_imports_during_execution(recorded_imports: list[str], cli_runner: CliRu
     assert not any(m.startswith("importlib.") or m == "importlib" for m in recorded_imports)
 
 
+def test_no_config_resolution_during_execution(cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+    import rich_click.rich_click_theme
+    from rich_click.rich_help_configuration import RichHelpConfiguration
+
+    calls: list[str] = []
+
+    def record(name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> Any:
+            calls.append(name)
+            raise AssertionError(f"{name} should not be called during execution")
+
+        return _record
+
+    monkeypatch.setattr(RichHelpConfiguration, "apply_theme", record("apply_theme"))
+    monkeypatch.setattr(RichHelpConfiguration, "load_from_globals", record("load_from_globals"))
+    monkeypatch.setattr(rich_click.rich_click_theme, "get_theme", record("get_theme"))
+
+    @rich_click.group()
+    def cli() -> None:
+        pass
+
+    @cli.command()
+    @rich_click.rich_config(help_config={"theme": "forest"})
+    def sub() -> None:
+        print("Hello, world!")
+
+    res = cli_runner.invoke(cli, "sub")
+    assert res.exit_code == 0, res.output
+    assert res.stdout == "Hello, world!\n"
+    assert calls == []
+
+
+def test_no_theme_import_during_execution(mock_script_writer: WriteScript) -> None:
+    path = mock_script_writer(
+        """
+        import sys
+
+        import rich_click as click
+
+        @click.command()
+        def cli():
+            print("rich_click.rich_click_theme" in sys.modules)
+
+        cli()
+        """,
+        module_name="theme_imports.py",
+    )
+    res = run_as_subprocess([sys.executable, str(path / "theme_imports.py")])
+    assert res.returncode == 0, res.stderr
+    assert res.stdout == b"False\n"
+
+
 def test_imports_during_help(recorded_imports: list[str], cli_runner: CliRunner) -> None:
     importlib.reload(rich_click)
 
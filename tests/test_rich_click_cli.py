@@ -1,8 +1,11 @@
 # ruff: noqa: D101,D103,D401,E501
 import json
+import os
+import subprocess
 import sys
 from collections.abc import Callable
-from importlib.metadata import version
+from importlib import metadata
+from importlib.metadata import EntryPoint, version
 from pathlib import Path
 
 import packaging.version
@@ -10,7 +13,8 @@ import pytest
 from click.testing import CliRunner
 from inline_snapshot import snapshot
 
-from rich_click.cli import main
+from rich_click._cache import console_scripts_index
+from rich_click.cli import _get_module_path_and_function_name, main
 from tests.conftest import WriteScript, run_as_subprocess
 
 
@@ -115,13 +119,30 @@ def test_rich_click_cli_help_with_rich_config_from_file(tmp_path: Path) -> None:
 │ --suppress-warnings/--do-not-suppress-warnings  Suppress warnings when there are conflicting     │
 │                                                 entry_points. This situation is extremely rare.  │
 │                                                 [env var: RICH_CLICK_CLI_SUPPRESS_WARNINGS]      │
+│ --rebuild-index                                 Rebuild the cached index of installed console    │
+│                                                 scripts that SCRIPT is looked up in. Use this if │
+│                                                 a script was installed but is not found.         │
 │ --patch-rich-click/--no-patch-rich-click        If set, patch rich_click.Command, not just       │
 │                                                 click.Command.                                   │
+│ --deferred-patch/--no-deferred-patch            Only patch click when SCRIPT is run with no      │
+│                                                 arguments, --help or -h. Otherwise run it        │
+│                                                 unpatched, and render errors that escape it with │
+│                                                 rich-click, so that it starts as fast as it does │
+│                                                 without rich-click. [env var:                    │
+│                                                 RICH_CLICK_CLI_DEFERRED_PATCH]                   │
+│ --serve                                         Keep MODULE:CLICK_COMMAND imported, and render   │
+│                                                 its help text for other runs of rich-click with  │
+│                                                 --help or -h, over a Unix domain socket. Runs    │
+│                                                 until interrupted.                               │
 ╰──────────────────────────────────────────────────────────────────────────────────────────────────╯
 ╭─ Extra ──────────────────────────────────────────────────────────────────────────────────────────╮
-│ --themes       List all available themes and exit.                                               │
-│ --version      Show the version and exit.                                                        │
-│ --help     -h  Show this message and exit.                                                       │
+│ --themes                    List all available themes and exit.                                  │
+│ --build-manifest      FILE  Write a help manifest for MODULE:CLICK_COMMAND to FILE and exit.     │
+│ --build-snapshot      FILE  Write the help text of MODULE:CLICK_COMMAND and its subcommands,     │
+│                             rendered for common terminal widths and color systems, to FILE and   │
+│                             exit.                                                                │
+│ --version                   Show the version and exit.                                           │
+│ --help            -h        Show this message and exit.                                          │
 ╰──────────────────────────────────────────────────────────────────────────────────────────────────╯
 ╭─ Custom Name ────────────────────────────────────────────────────────────────────────────────────╮
 │ --theme        -t  THEME            Set the theme to render the CLI with.                        │
@@ -834,3 +855,154 @@ def test_cli_output_text(mock_script_writer: Callable[[str], Path]) -> None:
 │ --help  Show this message and exit.                                                              │
 ╰──────────────────────────────────────────────────────────────────────────────────────────────────╯
 """)
+
+
+def test_console_scripts_index(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    scans = []
+
+    def entry_points(group: str) -> list[EntryPoint]:
+        scans.append(group)
+        return [
+            EntryPoint("mycli", "mypkg.cli:main [extra]", group),
+            EntryPoint("mycli", "otherpkg.cli:main", group),
+            EntryPoint("mycli", "mypkg.cli:main [extra]", group),
+            EntryPoint("tool", "tool:run", group),
+        ]
+
+    monkeypatch.setattr(metadata, "entry_points", entry_points)
+
+    expected = {"mycli": ["mypkg.cli:main [extra]", "otherpkg.cli:main"], "tool": ["tool:run"]}
+    assert console_scripts_index() == expected
+    assert console_scripts_index() == expected
+    assert len(scans) == 1
+
+    assert console_scripts_index(rebuild=True) == expected
+    assert len(scans) == 2
+
+    # Entries of sys.path without distributions, e.g. the working directory, do not matter.
+    monkeypatch.syspath_prepend(tmp_path.as_posix())
+    (tmp_path / "new_module.py").touch()
+    console_scripts_index()
+    assert len(scans) == 2
+
+    # Adding or removing a distribution scans again.
+    (tmp_path / "new_package-1.0.dist-info").mkdir()
+    console_scripts_index()
+    assert len(scans) == 3
+    (tmp_path / "other_package-1.0.dist-info").mkdir()
+    console_scripts_index()
+    assert len(scans) == 4
+    console_scripts_index()
+    assert len(scans) == 4
+
+
+def test_get_module_path_from_console_scripts(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(
+        metadata,
+        "entry_points",
+        lambda group: [
+            EntryPoint("mycli", "mypkg.cli:main [extra]", group),
+            EntryPoint("mycli", "otherpkg.cli:main", group),
+            EntryPoint("tool", "tool:run", group),
+        ],
+    )
+
+    assert _get_module_path_and_function_name("tool", suppress_warnings=False) == ("tool", "run")
+    assert _get_module_path_and_function_name("mymodule:cli", suppress_warnings=False) == ("mymodule", "cli")
+    assert capsys.readouterr().out == ""
+
+    assert _get_module_path_and_function_name("mycli", suppress_warnings=True) == ("mypkg.cli", "main")
+    assert capsys.readouterr().out == ""
+
+    assert _get_module_path_and_function_name("mycli", suppress_warnings=False) == ("mypkg.cli", "main")
+    assert "WARNING: Multiple entry_points correspond with script 'mycli'" in capsys.readouterr().out
+
+
+def test_deferred_patch(mock_script_writer: Callable[[str], Path]) -> None:
+    mock_script_writer('''
+        import sys
+
+        import click
+
+        @click.group("foo")
+        def foo():
+            """foo group"""
+
+        @foo.command("bar")
+        def bar():
+            """bar command"""
+            print(type(foo).__module__, "rich" in sys.modules)
+        ''')
+
+    def run(*args: str) -> tuple[int, str, str]:
+        res = run_as_subprocess([sys.executable, "-m", "src.rich_click", *args])
+        return res.returncode, res.stdout.decode(), res.stderr.decode()
+
+    # Plain runs do not patch click.
+    assert run("--deferred-patch", "mymodule:foo", "bar") == (0, "click.core False\n", "")
+    assert run("mymodule:foo", "bar") == (0, "rich_click.patch False\n", "")
+
+    # Help text and errors render the same as when click is patched up front.
+    for args in (["bar", "--help"], ["--bad-input"], ["bar", "--bad-input"]):
+        deferred = run("--deferred-patch", "mymodule:foo", *args)
+        assert deferred == run("mymodule:foo", *args)
+        assert "─" in deferred[1] + deferred[2]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets are not available on Windows")
+def test_serve(mock_script_writer: Callable[[str], Path]) -> None:
+    mock_script_writer('''
+        import sys
+
+        import click
+
+        print("imported", file=sys.stderr)
+
+        @click.group("foo")
+        @click.option("--verbose", is_flag=True, help="Be loud.")
+        def foo(verbose):
+            """foo group"""
+            print("foo ran")
+
+        @foo.command("bar")
+        @click.argument("name")
+        def bar(name):
+            """bar command"""
+        ''')
+
+    def run(*args: str) -> tuple[int, str, str]:
+        res = run_as_subprocess([sys.executable, "-m", "src.rich_click", *args])
+        return res.returncode, res.stdout.decode(), res.stderr.decode()
+
+    cases = [["--help"], ["bar", "--help"], ["--verbose", "bar", "x", "--help"]]
+    expected = {tuple(args): run("mymodule:foo", *args) for args in cases}
+    for code, stdout, stderr in expected.values():
+        assert (code, stderr) == (0, "imported\n")
+        assert "─" in stdout
+
+    env = {**os.environ, "TERMINAL_WIDTH": "100", "FORCE_COLOR": "False"}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.rich_click", "--serve", "mymodule:foo"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        assert server.stderr is not None
+        assert server.stderr.readline() == b"imported\n"
+        assert server.stderr.readline().startswith(b"Serving help text on ")
+
+        # Help text comes from the server, so the CLI is not imported, and no callbacks run.
+        for args in cases:
+            code, stdout, stderr = expected[tuple(args)]
+            assert run("mymodule:foo", *args) == (code, stdout.removeprefix("foo ran\n"), "")
+
+        # Everything else runs in-process.
+        assert run("mymodule:foo", "bar", "x") == (0, "foo ran\n", "imported\n")
+        assert run("mymodule:foo", "nope", "--help")[2].startswith("imported\n")
+        assert run("--theme", "forest-slim", "mymodule:foo", "--help")[2] == "imported\n"
+    finally:
+        server.terminate()
+        server.wait(10)
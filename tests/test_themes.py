@@ -1,8 +1,10 @@
+import sys
 from collections.abc import Generator
+from pathlib import Path
 
 import pytest
 
-from rich_click.rich_click_theme import COLORS, FORMATS, RichClickThemeNotFound, get_theme
+from rich_click.rich_click_theme import COLORS, FORMATS, RichClickThemeNotFound, _entry_point_theme, get_theme
 from rich_click.rich_help_configuration import FromTheme, RichHelpConfiguration
 
 
@@ -35,3 +37,40 @@ def test_all_themes_have_from_theme_objs_replaced_on_resolution() -> None:
     for theme in all_themes():
         cfg = RichHelpConfiguration(theme=theme)
         assert _no_from_themes(cfg)
+
+
+def test_themes_are_cached_and_not_mutated() -> None:
+    theme = get_theme("forest-slim")
+    assert get_theme("forest-slim") is theme
+    assert get_theme("forest") is get_theme("forest-box")
+    # Combining themes does not copy or mutate the styles of the themes it combines.
+    assert theme.styles["options_table_column_types"] is FORMATS["slim"].styles["options_table_column_types"]
+    assert "options_table_column_types" not in COLORS["forest"].styles
+
+
+def test_entry_point_theme(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "my_themes.py").write_text(
+        "from rich_click.rich_click_theme import RichClickTheme\n"
+        "mine = RichClickTheme('mine', styles={'style_option': 'bold magenta'})\n"
+        "not_a_theme = object()\n"
+    )
+    dist_info = tmp_path / "my_themes-0.1.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: my-themes\nVersion: 0.1\n")
+    (dist_info / "entry_points.txt").write_text(
+        "[rich_click.themes]\nmine = my_themes:mine\nbroken = my_themes:not_a_theme\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _entry_point_theme.cache_clear()
+
+    try:
+        theme = get_theme("mine")
+        assert theme.styles["style_option"] == "bold magenta"
+        # Styles not defined by the theme come from the default theme.
+        assert theme.styles["style_command"] == get_theme("default-box").styles["style_command"]
+
+        with pytest.warns(UserWarning, match="is not a RichClickTheme"), pytest.raises(RichClickThemeNotFound):
+            get_theme("broken")
+    finally:
+        _entry_point_theme.cache_clear()
+        sys.modules.pop("my_themes", None)
@@ -64,3 +64,34 @@ def test_typer_rich_panels_subcommand(typer_cli_runner: CliRunner, cli: typer.Ty
                                                                                                     \n\
 """)
     assert result.stderr == snapshot("")
+
+
+def test_typer_rich_panels_repeated_renders(cli: typer.Typer) -> None:
+    group = typer.main.get_command(cli)
+    sub = group.commands["create"]  # type: ignore[attr-defined]
+    helps = set()
+    for _ in range(20):
+        for command, args in ((group, []), (sub, [])):
+            ctx = command.make_context("root", args, resilient_parsing=True)
+            helps.add(ctx.get_help())
+
+    # Typer panels are derived once per command, and never added to the user-defined panels.
+    assert len(helps) == 2
+    assert group.panels == []  # type: ignore[attr-defined]
+    assert sub.panels == []  # type: ignore[attr-defined]
+
+
+def test_typer_context_overlays_config_once(cli: typer.Typer) -> None:
+    group = typer.main.get_command(cli)
+    ctx = group.make_context("root", [], resilient_parsing=True)
+    ctx.get_help()
+    config = ctx.help_config
+    ctx.get_help()
+    assert ctx.help_config is config
+
+    # Box themes do not expand tables, unless the user says otherwise.
+    rc.THEME = "forest-box"
+    ctx = group.make_context("root", [], resilient_parsing=True)
+    formatter = ctx.make_formatter()
+    assert formatter.config.style_options_table_expand is False
+    assert formatter.config.style_commands_table_expand is False